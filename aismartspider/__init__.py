@@ -1,24 +1,10 @@
 """AISmartSpider package exports."""
 
+from importlib import import_module
+
 from .models import PageType, IntentType, Intent, PageTypingResult, Strategy
-from .ai_client import LLMClient, OpenAIClient, MockClient, GeminiClient
-from .executor import Executor
-from .fetcher import Fetcher, FetchResult
-from .dom_summary import DomSummarizer
-from .page_classifier import PageTypeClassifier
-from .intent_parser import IntentParser
-from .strategy_builder import StrategyBuilder
-from .output import (
-    ResultWriter,
-    TxtWriter,
-    JsonWriter,
-    CsvWriter,
-    SQLiteWriter,
-    MySQLWriter,
-    PostgresWriter,
-)
 
-__all__ = [
+__all__ = (
     "PageType",
     "IntentType",
     "Intent",
@@ -26,12 +12,16 @@ __all__ = [
     "Strategy",
     "LLMClient",
     "OpenAIClient",
+    "BatchingOpenAIClient",
     "MockClient",
     "GeminiClient",
+    "CachingLLMClient",
+    "RoundRobinLLMClient",
     "Executor",
     "Fetcher",
     "FetchResult",
     "DomSummarizer",
+    "DomSummary",
     "PageTypeClassifier",
     "IntentParser",
     "StrategyBuilder",
@@ -42,4 +32,45 @@ __all__ = [
     "SQLiteWriter",
     "MySQLWriter",
     "PostgresWriter",
-]
+)
+
+# Only the dependency-free models are imported eagerly. Everything else pulls in
+# bs4/lxml, HTTP stacks or provider SDKs, so it is imported on first attribute
+# access (PEP 562) and then cached in the module globals.
+_LAZY = {
+    "LLMClient": ".ai_client",
+    "OpenAIClient": ".ai_client",
+    "BatchingOpenAIClient": ".ai_client",
+    "MockClient": ".ai_client",
+    "GeminiClient": ".ai_client",
+    "CachingLLMClient": ".ai_client",
+    "RoundRobinLLMClient": ".ai_client",
+    "Executor": ".executor",
+    "Fetcher": ".fetcher",
+    "FetchResult": ".fetcher",
+    "DomSummarizer": ".dom_summary",
+    "DomSummary": ".dom_summary",
+    "PageTypeClassifier": ".page_classifier",
+    "IntentParser": ".intent_parser",
+    "StrategyBuilder": ".strategy_builder",
+    "ResultWriter": ".output",
+    "TxtWriter": ".output",
+    "JsonWriter": ".output",
+    "CsvWriter": ".output",
+    "SQLiteWriter": ".output",
+    "MySQLWriter": ".output",
+    "PostgresWriter": ".output",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
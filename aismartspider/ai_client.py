@@ -2,44 +2,192 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
 import json
+import os
+import random
+import re
+import sqlite3
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from .utils.json_utils import JsonStreamScanner, dumps, loads
 
 
 class LLMClient(ABC):
     """Base interface for chat-capable language models."""
 
+    max_concurrency: int = 8
+
     @abstractmethod
     def chat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
         """Return dict with at least a 'content' field containing model output."""
 
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        """Async variant of chat; defaults to running chat in a worker thread."""
+        return await asyncio.to_thread(self.chat, messages, **kwargs)
+
+    async def abatch(
+        self,
+        batch: Sequence[List[Dict[str, str]]],
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Run several chats concurrently, preserving input order."""
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def _run(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.achat(messages, **kwargs)
+
+        return list(await asyncio.gather(*(_run(messages) for messages in batch)))
+
+    def warmup(self) -> None:
+        """Open provider connections ahead of the first call; a no-op by default."""
+
+    async def awarmup(self) -> None:
+        """Async counterpart of :meth:`warmup` for callers that go through ``achat``."""
+        self.warmup()
+
 
 class OpenAIClient(LLMClient):
     """OpenAI-compatible client (works with GPT, DeepSeek, Moonshot, etc)."""
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, model: str = "gpt-4o-mini") -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        http2: bool = True,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 100,
+        stop_on_json: bool = True,
+    ) -> None:
         self.api_key = api_key or ""
         self.base_url = base_url
         self.model = model
+        self.stop_on_json = stop_on_json
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
         self._client = None
+        self._aclient = None
         self._legacy = None
+        self._http_client = None
+        self._async_http_client = None
+        self._init_lock = threading.Lock()
+
+    def _ensure_client(self) -> None:
+        # The SDK is imported on first use so constructing the client (and
+        # importing this module) stays cheap for mock or cached runs.
+        if self._client is not None or self._legacy is not None:
+            return
+        with self._init_lock:
+            if self._client is not None or self._legacy is not None:
+                return
+            try:
+                # Try modern OpenAI v1.x client
+                from openai import OpenAI
+                self._http_client = self._build_http_client()
+                self._client = OpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    http_client=self._http_client,
+                )
+            except ImportError:
+                # Fallback to legacy openai v0.x
+                import openai
+                self._legacy = openai
+                self._legacy.api_key = self.api_key
+                if self.base_url:
+                    self._legacy.api_base = self.base_url
+
+    def warmup(self) -> None:
+        """Complete DNS/TCP/TLS to the provider in the background.
 
+        The request goes through the shared pool, so the connection is kept
+        alive for the first real completion instead of being set up on it.
+        """
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self) -> None:
+        try:
+            self._ensure_client()
+            if self._http_client is None:
+                return
+            url = f"{str(self._client.base_url).rstrip('/')}/models"
+            self._http_client.head(url, headers={"Authorization": f"Bearer {self.api_key}"}, timeout=5.0)
+        except Exception:
+            # Purely an optimization; the first real call will surface any problem.
+            pass
+
+    async def awarmup(self) -> None:
+        """Warm the async pool that ``achat`` uses.
+
+        Must run on the event loop that will make the completions, since the
+        async pool's connections are bound to it.
+        """
         try:
-            # Try modern OpenAI v1.x client
-            from openai import OpenAI
-            self._client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+            await asyncio.to_thread(self._ensure_client)
+            if self._async_client() is None:
+                return
+            url = f"{str(self._aclient.base_url).rstrip('/')}/models"
+            await self._async_http_client.head(url, headers={"Authorization": f"Bearer {self.api_key}"}, timeout=5.0)
+        except Exception:
+            pass
+
+    def _build_http_client(self, asynchronous: bool = False):
+        """Shared keep-alive pool so completions reuse (and multiplex over) one connection."""
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=30,
+        )
+        timeout = httpx.Timeout(60.0, connect=10.0)
+        client_cls = httpx.AsyncClient if asynchronous else httpx.Client
+        return client_cls(http2=self._http2_available(), limits=limits, timeout=timeout)
+
+    def _http2_available(self) -> bool:
+        if not self.http2:
+            return False
+        try:
+            import h2  # noqa: F401
         except ImportError:
-            # Fallback to legacy openai v0.x
-            import openai
-            self._legacy = openai
-            self._legacy.api_key = self.api_key
-            if self.base_url:
-                self._legacy.api_base = self.base_url
+            # httpx needs the optional 'h2' package; degrade to HTTP/1.1 keep-alive.
+            return False
+        return True
 
     def chat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
-        if self._client:
+        self._ensure_client()
+        if self._client and self.stop_on_json:
+            stream = self._client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stream=True,
+                **kwargs,
+            )
+            scanner = JsonStreamScanner()
+            parts: List[str] = []
+            try:
+                for chunk in stream:
+                    text = self._chunk_text(chunk)
+                    parts.append(text)
+                    if scanner.feed(text):
+                        break
+            finally:
+                stream.close()
+            content = "".join(parts)
+        elif self._client:
             response = self._client.chat.completions.create(
                 model=self.model,
                 messages=messages,
@@ -55,20 +203,331 @@ class OpenAIClient(LLMClient):
             content = response["choices"][0]["message"]["content"]
         return {"content": content}
 
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        aclient = self._async_client()
+        if aclient is None:
+            return await super().achat(messages, **kwargs)
+        if not self.stop_on_json:
+            response = await aclient.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                **kwargs,
+            )
+            return {"content": response.choices[0].message.content}
+
+        stream = await aclient.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            stream=True,
+            **kwargs,
+        )
+        scanner = JsonStreamScanner()
+        parts: List[str] = []
+        try:
+            async for chunk in stream:
+                text = self._chunk_text(chunk)
+                parts.append(text)
+                if scanner.feed(text):
+                    break
+        finally:
+            await stream.close()
+        return {"content": "".join(parts)}
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        if not chunk.choices:
+            return ""
+        return chunk.choices[0].delta.content or ""
+
+    def _async_client(self):
+        self._ensure_client()
+        if self._aclient is None and self._client is not None:
+            from openai import AsyncOpenAI
+            self._async_http_client = self._build_http_client(asynchronous=True)
+            self._aclient = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=self._async_http_client,
+            )
+        return self._aclient
+
+
+_BATCH_TERMINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+
+class BatchingOpenAIClient(OpenAIClient):
+    """OpenAI client that routes chat calls through the Batch API (``/v1/batches``).
+
+    Requests are buffered for ``batch_window_seconds`` or until ``batch_size``
+    are pending, uploaded as one JSONL file and resolved when the batch
+    finishes. Batches are billed at half price but can take minutes to hours,
+    so this is meant for offline crawls that fan many pages out concurrently.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        batch_window_seconds: float = 5.0,
+        batch_size: int = 500,
+        poll_interval: float = 10.0,
+        completion_window: str = "24h",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.batch_window_seconds = batch_window_seconds
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+        self._pending: List[Tuple[str, Dict[str, Any], Future]] = []
+        self._pending_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._ids = itertools.count()
+
+    def chat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        return self.submit(messages, **kwargs).result()
+
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        return await asyncio.wrap_future(self.submit(messages, **kwargs))
+
+    def submit(self, messages: List[Dict[str, str]], **kwargs) -> Future:
+        """Queue one chat request and return a future for its ``{"content": ...}`` reply."""
+        future: Future = Future()
+        body = {"model": self.model, "messages": messages, **kwargs}
+        with self._pending_lock:
+            self._pending.append((f"req-{next(self._ids)}", body, future))
+            if len(self._pending) >= self.batch_size:
+                batch = self._take_pending()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.batch_window_seconds, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._dispatch(batch)
+        return future
+
+    def flush(self) -> None:
+        """Submit whatever is buffered without waiting for the window to close."""
+        with self._pending_lock:
+            batch = self._take_pending()
+        if batch:
+            self._dispatch(batch)
+
+    def _take_pending(self) -> List[Tuple[str, Dict[str, Any], Future]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _dispatch(self, batch: List[Tuple[str, Dict[str, Any], Future]]) -> None:
+        threading.Thread(target=self._run_batch, args=(batch,), daemon=True).start()
+
+    def _run_batch(self, batch: List[Tuple[str, Dict[str, Any], Future]]) -> None:
+        try:
+            results = self._submit_and_wait([(custom_id, body) for custom_id, body, _ in batch])
+        except Exception as exc:
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+        for custom_id, _, future in batch:
+            if custom_id in results:
+                future.set_result({"content": results[custom_id]})
+            else:
+                future.set_exception(RuntimeError(f"Batch request {custom_id} returned no result"))
+
+    def _submit_and_wait(self, requests: Sequence[Tuple[str, Dict[str, Any]]]) -> Dict[str, str]:
+        self._ensure_client()
+        if self._client is None:
+            raise RuntimeError("The Batch API requires openai>=1.0")
+
+        lines = "\n".join(
+            dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+            for custom_id, body in requests
+        )
+        upload = self._client.files.create(file=("batch.jsonl", lines.encode("utf-8")), purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,
+        )
+        while batch.status not in _BATCH_TERMINAL_STATES:
+            time.sleep(self.poll_interval)
+            batch = self._client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        results: Dict[str, str] = {}
+        for line in self._client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            row = loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            choices = (response.get("body") or {}).get("choices") or []
+            if choices:
+                results[row["custom_id"]] = choices[0]["message"]["content"]
+        return results
+
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    # Check for ResourceExhausted / RateLimitError (429)
+    message = str(exc)
+    return "429" in message or "ResourceExhausted" in message or type(exc).__name__ == "RateLimitError"
+
+
+_RETRY_HINT_RE = re.compile(
+    r"retry in (\d+(?:\.\d+)?)\s*s|retry_delay\s*\{\s*seconds:\s*(\d+)",
+    re.IGNORECASE,
+)
+_GEMINI_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _gemini_semaphore() -> asyncio.Semaphore:
+    """Per-event-loop cap on in-flight Gemini calls (AISMARTSPIDER_MAX_CONCURRENCY)."""
+    loop = asyncio.get_running_loop()
+    semaphore = _GEMINI_SEMAPHORES.get(loop)
+    if semaphore is None:
+        limit = int(os.getenv("AISMARTSPIDER_MAX_CONCURRENCY", "") or LLMClient.max_concurrency)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        _GEMINI_SEMAPHORES[loop] = semaphore
+    return semaphore
+
 
 class GeminiClient(LLMClient):
     """Client for Google Gemini models via google-generativeai SDK."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "models/gemini-2.5-pro") -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "models/gemini-2.5-pro",
+        stop_on_json: bool = True,
+    ) -> None:
+        self.stop_on_json = stop_on_json
+        self.api_key = api_key
+        self.model_name = model if model.startswith("models/") else f"models/{model}"
+        self._genai = None
+        self._model_cache: Dict[Tuple[Optional[str], Tuple[Tuple[str, Any], ...]], Any] = {}
+
+    def warmup(self) -> None:
+        """Import and configure the SDK in the background, off the first call's path."""
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self) -> None:
         try:
-            import google.generativeai as genai
-            self._genai = genai
-            self._genai.configure(api_key=api_key)
-            self.model_name = model if model.startswith("models/") else f"models/{model}"
+            self._sdk()
         except ImportError:
-            raise ImportError("Google Generative AI SDK not found. Please run: pip install google-generativeai")
+            pass
+
+    def _sdk(self):
+        # Deferred so that merely constructing the client does not pay for the SDK import.
+        if self._genai is None:
+            try:
+                import google.generativeai as genai
+            except ImportError:
+                raise ImportError("Google Generative AI SDK not found. Please run: pip install google-generativeai")
+            genai.configure(api_key=self.api_key)
+            self._genai = genai
+        return self._genai
 
     def chat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        system_instruction, contents = self._to_contents(messages)
+        model, call_kwargs = self._prepare_model(kwargs, system_instruction)
+
+        max_retries = 10
+
+        for attempt in range(max_retries):
+            try:
+                if not self.stop_on_json:
+                    response = model.generate_content(contents, **call_kwargs)
+                    return {"content": response.text}
+                scanner = JsonStreamScanner()
+                parts: List[str] = []
+                stream = model.generate_content(contents, stream=True, **call_kwargs)
+                try:
+                    for chunk in stream:
+                        parts.append(chunk.text)
+                        if scanner.feed(chunk.text):
+                            break
+                finally:
+                    self._close_stream(stream)
+                return {"content": "".join(parts)}
+            except Exception as e:
+                if self._is_rate_limited(e) and attempt < max_retries - 1:
+                    sleep_time = self._retry_delay(e, attempt)
+                    print(f"Rate limit hit. Retrying in {sleep_time:.1f}s...")
+                    time.sleep(sleep_time)
+                    continue
+                raise e
+        return {"content": ""}
+
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        system_instruction, contents = self._to_contents(messages)
+        model, call_kwargs = self._prepare_model(kwargs, system_instruction)
+
+        max_retries = 10
+
+        for attempt in range(max_retries):
+            try:
+                async with _gemini_semaphore():
+                    return {"content": await self._agenerate(model, contents, call_kwargs)}
+            except Exception as e:
+                if self._is_rate_limited(e) and attempt < max_retries - 1:
+                    sleep_time = self._retry_delay(e, attempt)
+                    print(f"Rate limit hit. Retrying in {sleep_time:.1f}s...")
+                    # Only this request waits; other in-flight calls keep running.
+                    await asyncio.sleep(sleep_time)
+                    continue
+                raise e
+        return {"content": ""}
+
+    async def _agenerate(self, model: Any, contents: List[Dict[str, Any]], call_kwargs: Dict[str, Any]) -> str:
+        if not self.stop_on_json:
+            response = await model.generate_content_async(contents, **call_kwargs)
+            return response.text
+        scanner = JsonStreamScanner()
+        parts: List[str] = []
+        stream = await model.generate_content_async(contents, stream=True, **call_kwargs)
+        try:
+            async for chunk in stream:
+                parts.append(chunk.text)
+                if scanner.feed(chunk.text):
+                    break
+        finally:
+            self._close_stream(stream)
+        return "".join(parts)
+
+    @staticmethod
+    def _close_stream(stream: Any) -> None:
+        """Cancel the underlying response stream so an early break does not leave it open."""
+        iterator = getattr(stream, "_iterator", None)
+        for target in (stream, iterator):
+            for name in ("close", "cancel"):
+                method = getattr(target, name, None)
+                if callable(method):
+                    try:
+                        method()
+                    except Exception:
+                        pass
+                    return
+
+    @staticmethod
+    def _retry_delay(exc: Exception, attempt: int, base: float = 5.0, cap: float = 60.0) -> float:
+        """Prefer the server's retry hint, otherwise capped exponential backoff with jitter."""
+        retry_delay = getattr(exc, "retry_delay", None)
+        hinted = getattr(retry_delay, "seconds", None)
+        if hinted is None:
+            match = _RETRY_HINT_RE.search(str(exc))
+            hinted = float(match.group(1) or match.group(2)) if match else None
+        if hinted:
+            return float(hinted)
+        return min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def _prepare_model(self, kwargs: Dict[str, Any], system_instruction: Optional[str] = None):
         call_kwargs = dict(kwargs)
         temperature = call_kwargs.pop("temperature", None)
         top_p = call_kwargs.pop("top_p", None)
@@ -82,91 +541,126 @@ class GeminiClient(LLMClient):
         if isinstance(response_format, dict) and response_format.get("type") == "json_object":
             generation_config["response_mime_type"] = "application/json"
 
-        model = self._genai.GenerativeModel(
-            self.model_name,
-            generation_config=generation_config or None,
-        )
-        
-        # Simple conversion of chat history to prompt for Gemini
-        # (For more complex history, use model.start_chat)
-        full_prompt = ""
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            full_prompt += f"{role}: {content}\n"
-            
-        max_retries = 10
-        base_delay = 5
-        
-        for attempt in range(max_retries):
-            try:
-                response = model.generate_content(full_prompt, **call_kwargs)
-                return {"content": response.text}
-            except Exception as e:
-                # Check for ResourceExhausted (429)
-                if "429" in str(e) or "ResourceExhausted" in str(e):
-                    if attempt < max_retries - 1:
-                        sleep_time = base_delay * (1.5 ** attempt)
-                        print(f"Rate limit hit. Retrying in {sleep_time:.1f}s...")
-                        time.sleep(sleep_time)
-                        continue
-                raise e
-        return {"content": ""}
+        # Reuse one GenerativeModel per distinct (system_instruction, generation_config).
+        key = (system_instruction, tuple(sorted(generation_config.items())))
+        model = self._model_cache.get(key)
+        if model is None:
+            model = self._sdk().GenerativeModel(
+                self.model_name,
+                generation_config=generation_config or None,
+                system_instruction=system_instruction,
+            )
+            self._model_cache[key] = model
+        return model, call_kwargs
+
+    @staticmethod
+    def _to_contents(messages: List[Dict[str, str]]) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """Map chat messages to Gemini's system_instruction + role/parts contents."""
+        system_parts = [msg.get("content", "") for msg in messages if msg.get("role") == "system"]
+        contents = [
+            {
+                "role": "model" if msg.get("role") == "assistant" else "user",
+                "parts": [{"text": msg.get("content", "")}],
+            }
+            for msg in messages
+            if msg.get("role") != "system"
+        ]
+        system_instruction = "\n".join(system_parts) or None
+        if not contents and system_instruction:
+            return None, [{"role": "user", "parts": [{"text": system_instruction}]}]
+        return system_instruction, contents
+
+    @staticmethod
+    def _is_rate_limited(exc: Exception) -> bool:
+        return _is_rate_limit_error(exc)
+
+
+
+_PROMPT_TYPE_MARKERS: Dict[str, str] = {
+    "field_selectors": "strategy",
+    "抽取策略": "strategy",
+    "intent_type": "intent",
+    "任务类型": "intent",
+    "page_type": "typing",
+    "页面类型": "typing",
+}
+_PROMPT_TYPE_RE = re.compile("|".join(map(re.escape, _PROMPT_TYPE_MARKERS)), re.IGNORECASE | re.ASCII)
+
 
+# Canned MockClient replies are serialized once; only the page type varies per call.
+_MOCK_INTENT_JSON = dumps(
+    {
+        "intent_type": "extract_info",
+        "requested_fields": ["title", "content"],
+    }
+)
+_MOCK_STRATEGY_JSON = dumps(
+    {
+        "field_selectors": {
+            "title": "h1",
+            "date": "time",
+            "content": "p",
+        },
+        "field_methods": {
+            "title": "css",
+            "date": "css",
+            "content": "css",
+        },
+        "is_list": False,
+        "item_link_selector": None,
+        "pagination_selector": None,
+        "max_depth": 1,
+        "max_pages": 1,
+        "image_selector": None,
+        "fallbacks": {},
+    }
+)
+_MOCK_DEFAULT_JSON = dumps({"message": "mock response"})
+
+
+@lru_cache(maxsize=16)
+def _mock_typing_json(page_type: str) -> str:
+    return dumps(
+        {
+            "page_type": page_type,
+            "confidence": 0.99,
+            "suggested_fields": ["title", "date", "content"],
+        }
+    )
 
 
 class MockClient(LLMClient):
     """Offline/test client that returns deterministic JSON snippets."""
 
     def chat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
-        content = messages[-1]["content"] if messages else ""
+        # Prompts are split into a static system prefix and a dynamic user message.
+        content = "\n".join(msg.get("content", "") for msg in messages)
         prompt_type = self._detect_prompt_type(content)
 
         if prompt_type == "typing":
-            payload = self._mock_page_type_response(content)
-        elif prompt_type == "intent":
-            payload = {
-                "intent_type": "extract_info",
-                "requested_fields": ["title", "content"],
-            }
-        elif prompt_type == "strategy":
-            payload = {
-                "field_selectors": {
-                    "title": "h1",
-                    "date": "time",
-                    "content": "p",
-                },
-                "field_methods": {
-                    "title": "css",
-                    "date": "css",
-                    "content": "css",
-                },
-                "is_list": False,
-                "item_link_selector": None,
-                "pagination_selector": None,
-                "max_depth": 1,
-                "max_pages": 1,
-                "image_selector": None,
-                "fallbacks": {},
-            }
-        else:
-            payload = {"message": "mock response"}
-
-        return {"content": json.dumps(payload, ensure_ascii=False)}
+            return {"content": _mock_typing_json(self._mock_page_type(content))}
+        if prompt_type == "intent":
+            return {"content": _MOCK_INTENT_JSON}
+        if prompt_type == "strategy":
+            return {"content": _MOCK_STRATEGY_JSON}
+        return {"content": _MOCK_DEFAULT_JSON}
 
     @staticmethod
     def _detect_prompt_type(content: str) -> str:
-        lowered = content.lower()
-        if "field_selectors" in lowered or "抽取策略" in content:
-            return "strategy"
-        if "intent_type" in lowered or "任务类型" in content:
-            return "intent"
-        if "page_type" in lowered or "页面类型" in content:
-            return "typing"
+        # One case-insensitive scan instead of lower() + a substring pass per marker.
+        found = set()
+        for match in _PROMPT_TYPE_RE.finditer(content):
+            prompt_type = _PROMPT_TYPE_MARKERS[match.group(0).lower()]
+            if prompt_type == "strategy":
+                return prompt_type
+            found.add(prompt_type)
+        for prompt_type in ("intent", "typing"):
+            if prompt_type in found:
+                return prompt_type
         return "unknown"
 
     @staticmethod
-    def _mock_page_type_response(content: str) -> Dict[str, Any]:
+    def _mock_page_type(content: str) -> str:
         # 简化版：仅用于测试，优先根据测试中注入的 "TEST_PAGE_TYPE:xxx" 标记决定页面类型
         # 找不到标记时，统一返回 news，避免因中文关键词微调导致测试不稳定
         lowered = content.lower()
@@ -174,12 +668,283 @@ class MockClient(LLMClient):
         idx = lowered.find(marker)
         if idx != -1:
             value = lowered[idx + len(marker) :].split()[0].strip().strip("\n\r,{}]")
-            page_type = value or "news"
+            return value or "news"
+        return "news"
+
+
+# --------------------------------------------------------------------------- #
+# Load balancing
+# --------------------------------------------------------------------------- #
+class RoundRobinLLMClient(LLMClient):
+    """Spread calls over several clients (API keys, regions or providers).
+
+    ``strategy`` is ``"least_loaded"`` (fewest in-flight calls, then least
+    recently failed) or ``"round_robin"``. A client that hits a rate limit is
+    cooled down for ``cooldown`` seconds and the call is retried on the next one.
+    """
+
+    def __init__(self, clients: Sequence[LLMClient], strategy: str = "least_loaded", cooldown: float = 30.0) -> None:
+        if not clients:
+            raise ValueError("RoundRobinLLMClient needs at least one client")
+        if strategy not in {"least_loaded", "round_robin"}:
+            raise ValueError(f"Unknown balancing strategy: {strategy}")
+        self.clients = list(clients)
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self._inflight = [0] * len(self.clients)
+        self._last_fail = [0.0] * len(self.clients)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def model(self) -> Optional[str]:
+        first = self.clients[0]
+        return getattr(first, "model", None) or getattr(first, "model_name", None)
+
+    def warmup(self) -> None:
+        for client in self.clients:
+            client.warmup()
+
+    async def awarmup(self) -> None:
+        await asyncio.gather(*(client.awarmup() for client in self.clients))
+
+    def chat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        for attempt in range(len(self.clients)):
+            index = self._acquire()
+            try:
+                return self.clients[index].chat(messages, **kwargs)
+            except Exception as exc:
+                if not self._should_retry(index, exc, attempt):
+                    raise
+            finally:
+                self._release(index)
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        for attempt in range(len(self.clients)):
+            index = self._acquire()
+            try:
+                return await self.clients[index].achat(messages, **kwargs)
+            except Exception as exc:
+                if not self._should_retry(index, exc, attempt):
+                    raise
+            finally:
+                self._release(index)
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _acquire(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            ready = [i for i in range(len(self.clients)) if now - self._last_fail[i] >= self.cooldown]
+            if not ready:
+                # Everyone is cooling down: take the one that failed longest ago.
+                ready = [min(range(len(self.clients)), key=lambda i: self._last_fail[i])]
+            if self.strategy == "round_robin":
+                index = min(ready, key=lambda i: (i - self._next) % len(self.clients))
+                self._next = (index + 1) % len(self.clients)
+            else:
+                index = min(ready, key=lambda i: (self._inflight[i], self._last_fail[i]))
+            self._inflight[index] += 1
+            return index
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._inflight[index] -= 1
+
+    def _should_retry(self, index: int, exc: Exception, attempt: int) -> bool:
+        if not _is_rate_limit_error(exc):
+            return False
+        with self._lock:
+            self._last_fail[index] = time.monotonic()
+        return attempt < len(self.clients) - 1
+
+
+# --------------------------------------------------------------------------- #
+# Response caching
+# --------------------------------------------------------------------------- #
+_CACHEABLE_KWARGS = ("temperature", "top_p", "response_format")
+
+
+class CacheBackend(ABC):
+    """Storage for serialized chat responses keyed by request hash."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None when missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: Optional[int]) -> None:
+        """Store value for ttl seconds (None means no expiry)."""
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU cache."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[str, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int]) -> None:
+        expires = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteBackend(CacheBackend):
+    """Persistent cache shared across runs."""
+
+    def __init__(self, path: str = "llm_cache.db") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, exp INTEGER)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, exp FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires = row
+        if expires is not None and expires < time.time():
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl: Optional[int]) -> None:
+        expires = int(time.time() + ttl) if ttl else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, exp) VALUES (?, ?, ?)",
+                (key, value.encode("utf-8"), expires),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingLLMClient(LLMClient):
+    """Wrap another client and replay deterministic (temperature=0) responses."""
+
+    def __init__(self, inner: LLMClient, backend: Optional[CacheBackend] = None, ttl: Optional[int] = 3600) -> None:
+        self.inner = inner
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    @property
+    def model(self) -> Optional[str]:
+        return getattr(self.inner, "model", None) or getattr(self.inner, "model_name", None)
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    async def awarmup(self) -> None:
+        await self.inner.awarmup()
+
+    def chat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        key = self._cache_key(messages, kwargs)
+        if key is None:
+            return self.inner.chat(messages, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        future, leader = self._join(key)
+        if not leader:
+            return dict(future.result())
+        try:
+            response = self.inner.chat(messages, **kwargs)
+        except BaseException as exc:
+            self._settle(key, future, exc=exc)
+            raise
+        self._settle(key, future, response=response)
+        return response
+
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        key = self._cache_key(messages, kwargs)
+        if key is None:
+            return await self.inner.achat(messages, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        future, leader = self._join(key)
+        if not leader:
+            return dict(await asyncio.wrap_future(future))
+        try:
+            response = await self.inner.achat(messages, **kwargs)
+        except BaseException as exc:
+            self._settle(key, future, exc=exc)
+            raise
+        self._settle(key, future, response=response)
+        return response
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """Singleflight: the first caller for a key makes the request, later ones wait on its future.
+
+        A concurrent.futures.Future serves both thread and event-loop callers.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _settle(
+        self,
+        key: str,
+        future: Future,
+        response: Optional[Dict[str, Any]] = None,
+        exc: Optional[BaseException] = None,
+    ) -> None:
+        if exc is None:
+            # Store before un-registering so late callers hit the cache instead of the provider.
+            self._store(key, response)
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        if exc is None:
+            future.set_result(response)
         else:
-            page_type = "news"
+            future.set_exception(exc)
 
-        return {
-            "page_type": page_type,
-            "confidence": 0.99,
-            "suggested_fields": ["title", "date", "content"],
+    def _cache_key(self, messages: List[Dict[str, str]], kwargs: Dict[str, Any]) -> Optional[str]:
+        if kwargs.get("temperature", 0) != 0:
+            return None
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "kwargs": {k: v for k, v in kwargs.items() if k in _CACHEABLE_KWARGS},
         }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.backend.get(key)
+        if raw is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return loads(raw)
+
+    def _store(self, key: str, response: Dict[str, Any]) -> None:
+        self.backend.set(key, dumps(response), self.ttl)
@@ -1,6 +1,18 @@
-"""Prompt templates used for LLM calls with strict JSON constraints."""
+"""Prompt templates used for LLM calls with strict JSON constraints.
 
-PAGE_TYPE_PROMPT_TEMPLATE = """
+Each prompt is split into a static ``*_SYSTEM_PROMPT`` (instructions, schema and
+examples) and a small ``*_INPUT_TEMPLATE`` holding the per-call values. Sending
+the static part first as the system message keeps it a stable prefix, so
+provider-side prompt caching can reuse it across calls.
+
+The input templates are parsed once at import into ``render_*`` functions that
+just concatenate literal fragments with the supplied values.
+"""
+
+from string import Formatter
+from typing import Any, Callable, List, Tuple
+
+PAGE_TYPE_SYSTEM_PROMPT = """
 You are a web page structure classifier. Decide the page type based on the DOM summary.
 
 Hard requirements:
@@ -9,17 +21,19 @@ Hard requirements:
 3. The JSON object must include page_type, confidence (0-1 float), and suggested_fields (array of strings).
 
 Output format:
-{{
+{
   "page_type": "news",
   "confidence": 0.92,
   "suggested_fields": ["title", "date", "content"]
-}}
+}
+"""
 
+PAGE_TYPE_INPUT_TEMPLATE = """---INPUT---
 DOM summary:
 {dom_summary}
 """
 
-INTENT_PROMPT_TEMPLATE = """
+INTENT_SYSTEM_PROMPT = """
 You are a natural language task interpreter. Select INTENT_TYPE strictly from:
 ["extract_info","crawl_list","download_images","crawl_detail","compare_price","other"]
 
@@ -27,61 +41,92 @@ Also list the fields explicitly requested by the user (return an empty array if
 Return ONLY a JSON object with the following keys: intent_type, requested_fields.
 
 Example:
-{{
+{
   "intent_type": "crawl_list",
   "requested_fields": ["title","date","links"]
-}}
+}
+"""
 
+INTENT_INPUT_TEMPLATE = """---INPUT---
 User instruction:
 {user_text}
 """
 
-STRATEGY_PROMPT_TEMPLATE = """
+STRATEGY_SYSTEM_PROMPT = """
 You are a strategy generator that must return a deterministic JSON object describing how to extract data.
 
-Context:
-- page_type: {page_type}
-- intent_type: {intent_type}
-- user requested fields: {requested_fields}
-- DOM summary: {dom_summary}
-
 Constraints:
 1. Respond with a SINGLE JSON object. No prose or Markdown.
 2. Allowed keys: field_selectors (dict[str,str]), field_methods (dict[str,str]), field_limits (dict[str,int]),
-   is_list (bool), item_link_selector (str|null), pagination_selector (str|null), max_depth (int),
+   is_list (bool), item_link_selector (str|null), pagination_selector (str|null),
+   pagination_template (str|null, page URL with a {page} placeholder when pages are numbered), max_depth (int),
    max_pages (int), image_selector (str|null), fallbacks (dict).
 3. Prefer selectors derived from structure_hints; avoid overly broad "body" or plain "div".
 4. Link fields must use attr:href, image fields must use attr:src.
 5. If recursive crawling is needed, set item_link_selector and sensible max_depth/max_pages.
 
 Example output:
-{{
-  "field_selectors": {{"title": "article h1", "content": ".article-body"}},
-  "field_methods": {{"title": "css", "content": "css"}},
-  "field_limits": {{"links": 10}},
+{
+  "field_selectors": {"title": "article h1", "content": ".article-body"},
+  "field_methods": {"title": "css", "content": "css"},
+  "field_limits": {"links": 10},
   "is_list": false,
   "item_link_selector": null,
   "pagination_selector": null,
   "max_depth": 1,
   "max_pages": 1,
   "image_selector": null,
-  "fallbacks": {{"field_selectors": {{"title": "title"}}}}
-}}
+  "fallbacks": {"field_selectors": {"title": "title"}}
+}
+"""
+
+STRATEGY_INPUT_TEMPLATE = """---INPUT---
+Context:
+- page_type: {page_type}
+- intent_type: {intent_type}
+- user requested fields: {requested_fields}
+- DOM summary: {dom_summary}
 """
 
-FIRST_IMAGE_PROMPT_TEMPLATE = """
+FIRST_IMAGE_SYSTEM_PROMPT = """
 You are producing a single CSS selector that points to the semantic first/hero image inside the article body.
 
 Contract:
-1. Reply with ONLY one JSON object matching this schema: {{"selector": "<css-selector-or-null>"}}.
+1. Reply with ONLY one JSON object matching this schema: {"selector": "<css-selector-or-null>"}.
 2. selector must be a single CSS selector string targeting exactly one <img>. If there is no valid hero image, set selector to null.
 3. Never return image URLs, arrays, or explanations. No Markdown or prose.
 4. Focus on main/article/section content areas and ignore navigation, headers, footers, or ad banners.
 5. Prefer selectors that begin from meaningful containers (article, main, #content, .post-body, etc.) and avoid generic "img".
+"""
 
-Inputs:
+FIRST_IMAGE_INPUT_TEMPLATE = """---INPUT---
 - page_type: {page_type}
 - task: {task}
 - requested_field: {field_name}
 - DOM summary (includes structure_hints + image_hints with parent tags and order): {dom_summary}
 """
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Pre-split a ``str.format`` template into literal/field pairs."""
+    parts: List[Tuple[str, str]] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in prompt template: {field_name}")
+        parts.append((literal, field_name or ""))
+
+    def render(**values: Any) -> str:
+        chunks: List[str] = []
+        for literal, field_name in parts:
+            chunks.append(literal)
+            if field_name:
+                chunks.append(str(values[field_name]))
+        return "".join(chunks)
+
+    return render
+
+
+render_page_type_input = _compile_template(PAGE_TYPE_INPUT_TEMPLATE)
+render_intent_input = _compile_template(INTENT_INPUT_TEMPLATE)
+render_strategy_input = _compile_template(STRATEGY_INPUT_TEMPLATE)
+render_first_image_input = _compile_template(FIRST_IMAGE_INPUT_TEMPLATE)
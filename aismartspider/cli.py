@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
+from itertools import chain
+from typing import TYPE_CHECKING, Any
 
-from .ai_client import OpenAIClient, MockClient, GeminiClient
 from .dom_summary import DomSummarizer
 from .executor import Executor
 from .fetcher import Fetcher
 from .intent_parser import IntentParser
+from .models import Intent
 from .output import (
     PrintWriter,
     TxtWriter,
@@ -22,6 +25,9 @@ from .output import (
 from .strategy_builder import StrategyBuilder
 from .page_classifier import PageTypeClassifier
 
+if TYPE_CHECKING:
+    from .ai_client import LLMClient
+
 
 def _build_writer(mode: str, path: str | None, args: argparse.Namespace):
     if mode == "print":
@@ -55,10 +61,20 @@ def _build_writer(mode: str, path: str | None, args: argparse.Namespace):
     return PrintWriter()
 
 
-def main() -> None:
+# Read once at import; the parser below is also built once and reused by every main() call.
+_DEFAULT_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser("AISmartSpider CLI")
-    parser.add_argument("url", help="Target URL")
+    parser.add_argument("url", nargs="+", help="Target URL(s)")
     parser.add_argument("--task", required=True, help="Natural language task description.")
+    parser.add_argument(
+        "--parallel-urls",
+        type=int,
+        default=8,
+        help="Maximum number of URLs processed concurrently.",
+    )
     parser.add_argument(
         "--output-mode",
         default="print",
@@ -73,10 +89,38 @@ def main() -> None:
     parser.add_argument("--db-name", default="aismartspider", help="Database/schema name.")
     parser.add_argument("--db-table", default="records", help="Target table name.")
     parser.add_argument("--use-mock", action="store_true", help="Use offline mock LLM responses.")
-    parser.add_argument("--api-key", default=None, help="API Key for the provider")
-    parser.add_argument("--base-url", default=None, help="Base URL for OpenAI-compatible APIs (e.g. DeepSeek)")
+    parser.add_argument("--api-key", default=_DEFAULT_API_KEY, help="API Key for the provider (comma separated to load-balance)")
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Base URL for OpenAI-compatible APIs (e.g. DeepSeek); comma separated to pair with multiple keys",
+    )
     parser.add_argument("--provider", default="openai", choices=["openai", "gemini", "mock"], help="LLM Provider")
     parser.add_argument("--model", default="gpt-4o-mini", help="LLM Model Name")
+    parser.add_argument(
+        "--http2",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Use HTTP/2 for OpenAI-compatible APIs (requires the 'http2' extra).",
+    )
+    parser.add_argument(
+        "--http-max-connections",
+        type=int,
+        default=200,
+        help="Connection pool size for OpenAI-compatible APIs.",
+    )
+    parser.add_argument(
+        "--cache",
+        default="none",
+        choices=["none", "memory", "sqlite"],
+        help="Cache deterministic LLM responses.",
+    )
+    parser.add_argument("--cache-path", default="llm_cache.db", help="SQLite file used by --cache sqlite.")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send OpenAI requests through the Batch API (half price, results may take hours).",
+    )
     parser.add_argument("--enable-playwright", action="store_true", help="(Legacy) ensure Playwright is in the render chain.")
     parser.add_argument(
         "--render-backends",
@@ -88,16 +132,57 @@ def main() -> None:
         action="store_true",
         help="Disable automatic detection of dynamic pages.",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--http-cache-dir",
+        default=None,
+        help=(
+            "Directory for cached pages and the Playwright browser profile; re-crawls send "
+            "ETag/Last-Modified, reuse 304 responses and the browser's cached assets."
+        ),
+    )
+    return parser
+
+
+_PARSER = _build_parser()
 
-    api_key = args.api_key or os.getenv("OPENAI_API_KEY", "")
 
+def main(argv: list[str] | None = None) -> None:
+    args = _PARSER.parse_args(argv)
+    api_key = args.api_key or ""
+
+    # Provider classes are imported inside their branch so a run only pays for what it uses.
     if args.use_mock or args.provider == "mock":
+        from .ai_client import MockClient
+
         client = MockClient()
     elif args.provider == "gemini":
+        from .ai_client import GeminiClient
+
         client = GeminiClient(api_key=api_key, model=args.model)
     else:
-        client = OpenAIClient(api_key=api_key, base_url=args.base_url, model=args.model)
+        from .ai_client import BatchingOpenAIClient, OpenAIClient, RoundRobinLLMClient
+
+        client_cls = BatchingOpenAIClient if args.batch else OpenAIClient
+        api_keys = [key.strip() for key in api_key.split(",")]
+        base_urls = [url.strip() or None for url in (args.base_url or "").split(",")]
+        clients = [
+            client_cls(
+                api_key=key,
+                base_url=base_urls[min(index, len(base_urls) - 1)],
+                model=args.model,
+                http2=args.http2,
+                max_connections=args.http_max_connections,
+                max_keepalive_connections=max(1, args.http_max_connections // 2),
+            )
+            for index, key in enumerate(api_keys)
+        ]
+        client = clients[0] if len(clients) == 1 else RoundRobinLLMClient(clients)
+
+    if args.cache != "none":
+        from .ai_client import CachingLLMClient, MemoryBackend, SQLiteBackend
+
+        backend = MemoryBackend() if args.cache == "memory" else SQLiteBackend(args.cache_path)
+        client = CachingLLMClient(client, backend)
 
     render_backends = [backend.strip() for backend in args.render_backends.split(",") if backend.strip()]
     if args.enable_playwright and "playwright" not in render_backends:
@@ -107,6 +192,7 @@ def main() -> None:
         use_playwright=True,
         auto_render=not args.disable_auto_render,
         render_backends=tuple(render_backends) if render_backends else None,
+        cache_dir=args.http_cache_dir,
     )
     summarizer = DomSummarizer()
     classifier = PageTypeClassifier(client)
@@ -115,17 +201,94 @@ def main() -> None:
     executor = Executor(fetcher)
     writer = _build_writer(args.output_mode, args.output_path, args)
 
-    page = fetcher.fetch(args.url)
+    with writer:
+        failed = asyncio.run(
+            _run(
+                args.url,
+                fetcher,
+                summarizer,
+                classifier,
+                intent_parser,
+                strategy_builder,
+                executor,
+                writer,
+                args.task,
+                args.parallel_urls,
+                client,
+            )
+        )
+    if failed:
+        # Records from the URLs that succeeded are already written; still signal the failure.
+        raise SystemExit(1)
+
+
+async def _run(
+    urls: list[str],
+    fetcher: Fetcher,
+    summarizer: DomSummarizer,
+    classifier: PageTypeClassifier,
+    intent_parser: IntentParser,
+    strategy_builder: StrategyBuilder,
+    executor: Executor,
+    writer,
+    task: str,
+    parallel_urls: int = 8,
+    client: LLMClient | None = None,
+) -> int:
+    """Crawl every URL and write their records; returns how many URLs failed."""
+    # Let the TLS handshake to the provider overlap with fetching the first page. It runs
+    # on this loop so the connection lands in the async pool the completions go through.
+    warmup_task = asyncio.ensure_future(client.awarmup()) if client is not None else None
+    semaphore = asyncio.Semaphore(max(1, parallel_urls))
+    # Every URL shares the same task, so its intent is parsed once and awaited by all.
+    intent_task = asyncio.ensure_future(intent_parser.aparse(task))
+
+    failed = 0
+
+    async def bounded(url: str):
+        nonlocal failed
+        async with semaphore:
+            try:
+                return await _process(url, fetcher, summarizer, classifier, strategy_builder, executor, intent_task)
+            except Exception as exc:
+                # One failing URL must not discard the records of the others.
+                print(f"[ERROR] Failed to process {url}: {exc}")
+                failed += 1
+                return None
+
+    results = await asyncio.gather(*(bounded(url) for url in urls))
+    if warmup_task is not None:
+        warmup_task.cancel()
+    fetched = [records for records in results if records is not None]
+    if not fetched:
+        intent_task.cancel()
+        return failed
+    # File writers overwrite their target, so all records go out in one write, in URL order.
+    writer.write(chain.from_iterable(fetched))
+    return failed
+
+
+async def _process(
+    url: str,
+    fetcher: Fetcher,
+    summarizer: DomSummarizer,
+    classifier: PageTypeClassifier,
+    strategy_builder: StrategyBuilder,
+    executor: Executor,
+    intent_task: asyncio.Future[Intent],
+) -> list[dict[str, Any]] | None:
+    page = await fetcher.afetch(url)
     if not page.html:
-        print("[ERROR] Failed to fetch content. Try a different renderer or check network connectivity.")
-        return
+        print(f"[ERROR] Failed to fetch content from {url}. Try a different renderer or check network connectivity.")
+        return None
 
     dom_summary = summarizer.summarize(page.html)
-    typing = classifier.classify(dom_summary)
-    intent = intent_parser.parse(args.task)
-    strategy = strategy_builder.build(typing, intent, dom_summary)
-    records = executor.execute(page.url or args.url, strategy)
-    writer.write(records)
+    # Page typing overlaps with the shared intent parse.
+    typing = await classifier.aclassify(dom_summary)
+    intent = await intent_task
+    strategy = await strategy_builder.abuild(typing, intent, dom_summary)
+    # The summarized page is reused as the first page instead of being fetched again.
+    return await executor.aexecute(page.url or url, strategy, html=page.html)
 
 
 if __name__ == "__main__":
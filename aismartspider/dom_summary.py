@@ -2,172 +2,252 @@
 
 from __future__ import annotations
 
-import json
-from collections import Counter
-from typing import Any, Dict, List
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Collection, Dict, FrozenSet, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+
+from .utils.html_utils import parse_html
+from .utils.json_utils import dumps
+
+# Subtrees that only add noise for the LLM. They are skipped by the walk and
+# filtered out of text/descendant queries rather than removed from the tree.
+_NOISE_TAGS = frozenset(("script", "style", "noscript", "iframe", "svg"))
+_NOT_IN_NOISE = "not(" + " or ".join(f"ancestor::{tag}" for tag in sorted(_NOISE_TAGS)) + ")"
+_TEXT_XPATH = etree.XPath(f"descendant::text()[{_NOT_IN_NOISE}]", smart_strings=False)
+_LIST_ITEMS_XPATH = etree.XPath(f"descendant::li[{_NOT_IN_NOISE}]")
+_IMAGES_XPATH = etree.XPath(f"descendant::img[{_NOT_IN_NOISE}]")
+_STRUCTURE_TAGS = frozenset(("article", "div", "section", "main"))
+_STRUCTURE_KEYWORD_RE = re.compile(r"content|article|post|body|detail|news|main", re.IGNORECASE)
+_IMAGE_CONTAINER_TAGS = frozenset(("article", "main", "section"))
+_HEADING_TAGS = frozenset(("h1", "h2", "h3"))
+_COUNTED_TAGS = frozenset(("div", "article", "section", "li", "img", "a", "table"))
+SUMMARY_FIELDS = (
+    "title",
+    "meta",
+    "structure_hints",
+    "headings",
+    "paragraphs",
+    "links",
+    "lists",
+    "tag_counts",
+    "image_hints",
+)
+
+
+class DomSummary(str):
+    """Summary JSON text that also carries its ``tag_counts`` mapping.
+
+    It is an ordinary ``str`` to every consumer (prompts, caches, logs); the
+    strategy builder reads ``tag_counts`` from it instead of re-parsing the JSON.
+    The mapping is shared with the summarizer's cache and must not be modified.
+    """
+
+    tag_counts: Dict[str, int]
+
+    def __new__(cls, text: str, tag_counts: Optional[Dict[str, int]] = None) -> "DomSummary":
+        summary = super().__new__(cls, text)
+        summary.tag_counts = tag_counts if tag_counts is not None else {}
+        return summary
 
 
 class DomSummarizer:
     """Generate compact JSON summaries from HTML."""
 
-    def __init__(self, max_text_nodes: int = 150, max_links: int = 100, max_lists: int = 20) -> None:
+    def __init__(
+        self,
+        max_text_nodes: int = 150,
+        max_links: int = 100,
+        max_lists: int = 20,
+        cache_size: int = 256,
+    ) -> None:
         self.max_text_nodes = max_text_nodes
         self.max_links = max_links
         self.max_lists = max_lists
+        self.cache_size = cache_size
+        # Identical pages (pagination repeats, one detail page behind several URLs)
+        # are summarized once; keyed by a content digest so the HTML itself is not retained.
+        self._cache: "OrderedDict[Tuple[bytes, Optional[FrozenSet[str]]], DomSummary]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
-    def summarize(self, html: str) -> str:
-        """Convert DOM to a lightweight JSON string for LLM consumption."""
-        soup = BeautifulSoup(html, "lxml")
-        
-        # Remove script and style elements to reduce noise
-        for script in soup(["script", "style", "noscript", "iframe", "svg"]):
-            script.decompose()
-
-        title = soup.title.get_text(strip=True) if soup.title else ""
-        meta = self._extract_meta(soup)
-        
-        # Extract potential content containers (with class/id hints)
-        structure_hints = self._extract_structure_hints(soup)
-        
-        headings = self._collect_texts(soup, ["h1", "h2", "h3"], limit=self.max_text_nodes // 3 or 1)
-        paragraphs = self._collect_texts(soup, ["p"], limit=self.max_text_nodes)
-        links = self._collect_links(soup)
-        lists = self._collect_lists(soup)
-        tag_counts = self._collect_tag_counts(soup)
-        image_hints = self._collect_image_hints(soup)
-
-        summary: Dict[str, Any] = {
-            "title": title,
-            "meta": meta,
-            "structure_hints": structure_hints, # New field to help AI find selectors
-            "headings": headings,
-            "paragraphs": paragraphs,
-            "links": links,
-            "lists": lists,
-            "tag_counts": tag_counts,
-            "image_hints": image_hints,
-        }
-        return json.dumps(summary, ensure_ascii=False)
-
-    def _extract_structure_hints(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """Find potential main content containers and return their attributes."""
-        hints = []
-        # Look for common content wrappers
-        candidates = soup.find_all(["article", "div", "section", "main"])
-        for tag in candidates:
-            classes = tag.get("class", [])
-            if isinstance(classes, list):
-                classes = " ".join(classes)
-            ids = tag.get("id", "")
-            
-            score = 0
-            # Simple heuristic to find "interesting" containers
-            keywords = ["content", "article", "post", "body", "detail", "news", "main"]
-            combined = (str(classes) + " " + str(ids)).lower()
-            
-            if any(k in combined for k in keywords):
-                # Get a snippet of text to help AI verify
-                text_snippet = tag.get_text(strip=True)[:100]
-                if len(text_snippet) > 20:
-                    hints.append({
-                        "tag": tag.name,
-                        "class": classes,
-                        "id": ids,
-                        "text_snippet": text_snippet
-                    })
-            
-            if len(hints) >= 10:
-                break
-        return hints
+    def summarize(self, html: str, fields: Optional[Collection[str]] = None) -> DomSummary:
+        """Convert DOM to a lightweight JSON string for LLM consumption.
+
+        ``fields`` restricts the summary to a subset of ``SUMMARY_FIELDS``;
+        collectors for the other keys are skipped entirely.
+        """
+        wanted = frozenset(SUMMARY_FIELDS if fields is None else fields)
+        unknown = wanted.difference(SUMMARY_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown summary fields: {sorted(unknown)}")
+        if self.cache_size <= 0:
+            return self._summarize(html, wanted, fields is not None)
+
+        digest = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        key = (digest, None if fields is None else wanted)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        summary = self._summarize(html, wanted, fields is not None)
+        with self._cache_lock:
+            self._cache[key] = summary
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return summary
+
+    def _summarize(self, html: str, wanted: FrozenSet[str], subset: bool) -> DomSummary:
+        root = parse_html(html)
+
+        title: Optional[str] = None
+        meta = {"description": None, "keywords": None}
+        structure_hints: List[Dict[str, str]] = []
+        headings: List[str] = []
+        paragraphs: List[str] = []
+        links: List[Dict[str, str]] = []
+        lists: List[Dict[str, Any]] = []
+        tag_counts: Dict[str, int] = {}
+        image_containers: List[etree._Element] = []
+        images: List[etree._Element] = []
+        # A zero limit switches a collector off when its field is not requested.
+        hint_limit = 10 if "structure_hints" in wanted else 0
+        heading_limit = (self.max_text_nodes // 3 or 1) if "headings" in wanted else 0
+        paragraph_limit = self.max_text_nodes if "paragraphs" in wanted else 0
+        link_limit = self.max_links if "links" in wanted else 0
+        list_limit = self.max_lists if "lists" in wanted else 0
+        want_title = "title" in wanted
+        want_meta = "meta" in wanted
+        want_counts = "tag_counts" in wanted
+        want_images = "image_hints" in wanted
+        text_cache: Dict[etree._Element, str] = {}
+
+        # One walk over the element tree feeds every collector.
+        walker = etree.iterwalk(root, events=("start",)) if root is not None else ()
+        for _, node in walker:
+            tag = node.tag
+            if tag in _NOISE_TAGS:
+                walker.skip_subtree()
+                continue
+            if want_counts and tag in _COUNTED_TAGS:
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+
+            if tag in _STRUCTURE_TAGS and len(structure_hints) < hint_limit:
+                hint = self._structure_hint(node, text_cache)
+                if hint:
+                    structure_hints.append(hint)
+            if want_images and tag in _IMAGE_CONTAINER_TAGS:
+                image_containers.append(node)
+
+            if tag in _HEADING_TAGS:
+                if len(headings) < heading_limit:
+                    text = _text(node, text_cache)
+                    if text:
+                        headings.append(text)
+            elif tag == "p":
+                if len(paragraphs) < paragraph_limit:
+                    text = _text(node, text_cache)
+                    if text:
+                        paragraphs.append(text)
+            elif tag == "a":
+                if len(links) < link_limit:
+                    href = node.get("href") or ""
+                    text = _text(node, text_cache)
+                    if href or text:
+                        links.append({"href": href, "text": text})
+            elif tag in ("ul", "ol"):
+                if len(lists) < list_limit:
+                    items = self._list_items(node, text_cache)
+                    if items:
+                        lists.append({"type": tag, "items": items})
+            elif tag == "img":
+                if want_images:
+                    images.append(node)
+            elif tag == "title":
+                if want_title and title is None:
+                    title = _text(node, text_cache)
+            elif tag == "meta" and want_meta:
+                name = node.get("name")
+                if name in meta and meta[name] is None:
+                    meta[name] = (node.get("content") or "").strip()
 
+        sections = (
+            ("title", title or ""),
+            ("meta", {key: value or "" for key, value in meta.items()}),
+            ("structure_hints", structure_hints), # New field to help AI find selectors
+            ("headings", headings),
+            ("paragraphs", paragraphs),
+            ("links", links),
+            ("lists", lists),
+            ("tag_counts", tag_counts),
+        )
+        # Encode section by section instead of assembling one summary dict first;
+        # the keys are plain ASCII, so the result matches dumps() of that dict.
+        parts = [f'"{key}":{dumps(value)}' for key, value in sections if not subset or key in wanted]
+        del sections, structure_hints, headings, paragraphs, links, lists
+        if want_images:
+            image_hints = self._collect_image_hints(image_containers, images, text_cache)
+            parts.append(f'"image_hints":{dumps(image_hints)}')
+        # tag_counts stays empty when that field was not requested, as if read from the JSON.
+        return DomSummary("{" + ",".join(parts) + "}", tag_counts)
 
     @staticmethod
-    def _extract_meta(soup: BeautifulSoup) -> Dict[str, str]:
-        description = soup.find("meta", attrs={"name": "description"})
-        keywords = soup.find("meta", attrs={"name": "keywords"})
-        return {
-            "description": description["content"].strip() if description and description.has_attr("content") else "",
-            "keywords": keywords["content"].strip() if keywords and keywords.has_attr("content") else "",
-        }
+    def _structure_hint(node: etree._Element, text_cache: Dict[etree._Element, str]) -> Optional[Dict[str, str]]:
+        """Return attributes of a potential main content container, if it looks like one."""
+        classes = _class_string(node)
+        ids = node.get("id", "")
+
+        # Simple heuristic to find "interesting" containers
+        if _STRUCTURE_KEYWORD_RE.search(classes) or _STRUCTURE_KEYWORD_RE.search(ids):
+            # Get a snippet of text to help AI verify
+            text_snippet = _text(node, text_cache)[:100]
+            if len(text_snippet) > 20:
+                return {
+                    "tag": node.tag,
+                    "class": classes,
+                    "id": ids,
+                    "text_snippet": text_snippet,
+                }
+        return None
 
     @staticmethod
-    def _collect_texts(soup: BeautifulSoup, tags: List[str], limit: int) -> List[str]:
-        results: List[str] = []
-        for node in soup.find_all(tags):
-            text = node.get_text(strip=True)
+    def _list_items(list_node: etree._Element, text_cache: Dict[etree._Element, str]) -> List[str]:
+        items: List[str] = []
+        for li in _LIST_ITEMS_XPATH(list_node):
+            text = _text(li, text_cache)
             if text:
-                results.append(text)
-            if len(results) >= limit:
-                break
-        return results
-
-    def _collect_links(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        results: List[Dict[str, str]] = []
-        for node in soup.find_all("a"):
-            href = node.get("href") or ""
-            text = node.get_text(strip=True)
-            if href or text:
-                results.append({"href": href, "text": text})
-            if len(results) >= self.max_links:
+                items.append(text)
+            if len(items) >= 10:
                 break
-        return results
+        return items
 
-    def _collect_lists(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        lists: List[Dict[str, Any]] = []
-        for list_tag in soup.find_all(["ul", "ol"]):
-            items = []
-            for li in list_tag.find_all("li"):
-                text = li.get_text(strip=True)
-                if text:
-                    items.append(text)
-                if len(items) >= 10:
-                    break
-            if items:
-                lists.append({"type": list_tag.name, "items": items})
-            if len(lists) >= self.max_lists:
-                break
-        return lists
-
-    @staticmethod
-    def _collect_tag_counts(soup: BeautifulSoup) -> Dict[str, int]:
-        interesting = ["div", "article", "section", "li", "img", "a", "table"]
-        counter: Counter[str] = Counter()
-        for tag in soup.find_all(interesting):  # type: ignore[arg-type]
-            if isinstance(tag, Tag):
-                counter[tag.name] += 1
-        return dict(counter)
-
-    def _collect_image_hints(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _collect_image_hints(
+        self,
+        containers: List[etree._Element],
+        images: List[etree._Element],
+        text_cache: Dict[etree._Element, str],
+    ) -> List[Dict[str, Any]]:
         """Capture parent/ordering info for the first few images near article content."""
         hints: List[Dict[str, Any]] = []
-        containers = soup.select("article, main, section")
-        seen = set()
+        # Only hashes are kept: the set is consulted for every candidate image but
+        # at most 15 are recorded, so a collision is practically irrelevant.
+        seen: Set[int] = set()
         order = 1
 
-        def _record(img: Tag, context_parent: Tag | None) -> None:
+        def _record(img: etree._Element, context_parent: Optional[etree._Element]) -> None:
             nonlocal order
-            parent = context_parent or img.parent
-            parent_tag = parent.name if isinstance(parent, Tag) else ""
-            parent_class = ""
-            if isinstance(parent, Tag):
-                classes = parent.get("class", [])
-                if isinstance(classes, list):
-                    parent_class = " ".join(classes)
-                else:
-                    parent_class = str(classes)
-            snippet = ""
-            if isinstance(parent, Tag):
-                snippet = parent.get_text(strip=True)[:80]
+            parent = context_parent if context_parent is not None else img.getparent()
             hints.append(
                 {
                     "order": order,
                     "src_preview": (img.get("src") or "")[:120],
-                    "parent_tag": parent_tag,
-                    "parent_class": parent_class,
+                    "parent_tag": parent.tag if parent is not None else "",
+                    "parent_class": _class_string(parent) if parent is not None else "",
                     "ancestor_chain": self._ancestor_chain(img),
-                    "context_text": snippet,
+                    "context_text": _text(parent, text_cache)[:80] if parent is not None else "",
                 }
             )
             order += 1
@@ -175,35 +255,57 @@ class DomSummarizer:
         for container in containers:
             if order > 15:
                 break
-            for img in container.find_all("img"):
+            for img in _IMAGES_XPATH(container):
                 src = img.get("src")
-                if not src or src in seen:
+                if not src:
+                    continue
+                key = hash(src)
+                if key in seen:
                     continue
-                seen.add(src)
+                seen.add(key)
                 _record(img, container)
                 if order > 15:
                     break
 
         if not hints:
-            for img in soup.find_all("img"):
+            for img in images:
                 src = img.get("src")
-                if not src or src in seen:
+                if not src:
                     continue
-                seen.add(src)
+                key = hash(src)
+                if key in seen:
+                    continue
+                seen.add(key)
                 _record(img, None)
                 if order > 15:
                     break
         return hints
 
     @staticmethod
-    def _ancestor_chain(node: Tag) -> List[str]:
+    def _ancestor_chain(node: etree._Element) -> List[str]:
         chain: List[str] = []
-        for ancestor in node.parents:
-            if not isinstance(ancestor, Tag):
-                continue
-            if ancestor.name in {"html", "body"}:
+        for ancestor in node.iterancestors():
+            if ancestor.tag in {"html", "body"}:
                 continue
-            chain.append(ancestor.name)
+            chain.append(ancestor.tag)
             if len(chain) >= 5:
-                break
+                return chain
+        # The document node sits above <html>; earlier summaries listed it as well.
+        chain.append("[document]")
         return chain
+
+
+def _text(node: etree._Element, cache: Dict[etree._Element, str]) -> str:
+    """Concatenate stripped descendant text, like BeautifulSoup's get_text(strip=True).
+
+    Containers, list items and image parents overlap, so results are memoized
+    per element for the duration of one summarize() call.
+    """
+    text = cache.get(node)
+    if text is None:
+        text = cache[node] = "".join(chunk.strip() for chunk in _TEXT_XPATH(node))
+    return text
+
+
+def _class_string(node: etree._Element) -> str:
+    return " ".join((node.get("class") or "").split())
@@ -2,43 +2,90 @@
 
 from __future__ import annotations
 
-from itertools import zip_longest
+import asyncio
 import re
-from typing import Any, Dict, List
-from urllib.parse import urljoin
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Any, Awaitable, Callable, Dict, Iterator, List
+from urllib.parse import urljoin, urlsplit
 
+import soupsieve
 from bs4 import BeautifulSoup
+from lxml import etree
+
+try:
+    from cssselect import ExpressionError, HTMLTranslator, SelectorError
+except ImportError:  # pragma: no cover - optional speedup, see the "fastparse" extra
+    HTMLTranslator = None
+    ExpressionError = SelectorError = Exception
 
 from .fetcher import Fetcher, FetchResult
 from .models import PageType, Strategy
+from .utils.html_utils import parse_html
 from .utils.retry import RetryPolicy
 
+_Fetch = Callable[[str], FetchResult]
+_AsyncFetch = Callable[[str], Awaitable[FetchResult]]
+
 
 class Executor:
     """Execute strategies on target URLs using provided fetcher."""
 
-    def __init__(self, fetcher: Fetcher, retry_policy: RetryPolicy | None = None) -> None:
+    def __init__(self, fetcher: Fetcher, retry_policy: RetryPolicy | None = None, max_workers: int = 8) -> None:
         self.fetcher = fetcher
         self.retry_policy = retry_policy or RetryPolicy()
+        self.max_workers = max_workers
+        # Recently parsed pages by URL, so a page seen again (list fallback, repeat
+        # detail links, retries) is not parsed twice.
+        self._documents: "OrderedDict[str, HtmlDocument]" = OrderedDict()
+        self._documents_lock = threading.Lock()
+
+    def execute(self, url: str, strategy: Strategy, html: str | None = None) -> List[Dict[str, Any]]:
+        """Run ``strategy`` starting at ``url``.
+
+        ``html`` is the already-fetched content of ``url`` (e.g. the page that was
+        summarized); when given, that page is not fetched again. Other pages the
+        strategy visits still go through the fetcher.
+        """
+        fetch = self._fetch_with_retry
+        if html is not None:
+            page = FetchResult(url=url, html=html, renderer="provided")
+
+            def fetch(target: str) -> FetchResult:
+                return page if target == url else self._fetch_with_retry(target)
 
-    def execute(self, url: str, strategy: Strategy) -> List[Dict[str, Any]]:
         if strategy.page_type == PageType.NEWS:
-            return self._run_news_flow(url, strategy)
+            return self._run_news_flow(url, strategy, fetch)
         if strategy.page_type == PageType.LIST:
-            return self._run_list_flow(url, strategy)
+            return self._run_list_flow(url, strategy, fetch)
         if strategy.page_type == PageType.GALLERY:
-            return self._run_gallery_flow(url, strategy)
-        return self._run_default_flow(url, strategy)
+            return self._run_gallery_flow(url, strategy, fetch)
+        return self._run_default_flow(url, strategy, fetch)
 
-    def _run_news_flow(self, url: str, strategy: Strategy) -> List[Dict[str, Any]]:
-        page = self.retry_policy.run(lambda: self.fetcher.fetch(url))
-        if not page.html:
-            return []
-        soup = BeautifulSoup(page.html, "lxml")
-        record = self._extract_fields(soup, strategy, page.url or url)
-        return [record]
+    async def aexecute(self, url: str, strategy: Strategy, html: str | None = None) -> List[Dict[str, Any]]:
+        """Async variant of :meth:`execute`.
+
+        Fetches run in worker threads (the fetcher is blocking) and detail pages
+        are gathered on the event loop; only pagination stays sequential.
+        """
+        afetch = self._afetch_with_retry
+        if html is not None:
+            page = FetchResult(url=url, html=html, renderer="provided")
 
-    def _run_list_flow(self, url: str, strategy: Strategy) -> List[Dict[str, Any]]:
+            async def afetch(target: str) -> FetchResult:
+                return page if target == url else await self._afetch_with_retry(target)
+
+        if strategy.page_type == PageType.LIST:
+            return await self._arun_list_flow(url, strategy, afetch)
+        return self._single_page_records(await afetch(url), url, strategy)
+
+    def _run_news_flow(self, url: str, strategy: Strategy, fetch: _Fetch) -> List[Dict[str, Any]]:
+        return self._single_page_records(fetch(url), url, strategy)
+
+    def _run_list_flow(self, url: str, strategy: Strategy, fetch: _Fetch) -> List[Dict[str, Any]]:
         records: List[Dict[str, Any]] = []
         pages_processed = 0
         next_url: str | None = url
@@ -48,16 +95,32 @@ class Executor:
         MAX_PAGE_VISITS = 5
         max_pages = min(strategy.max_pages or 1, MAX_PAGE_VISITS)
 
+        if strategy.pagination_template and max_pages > 1:
+            # Numbered pages do not depend on each other, so fetch them all at once.
+            urls = self._template_page_urls(url, strategy.pagination_template, max_pages)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+                pages = list(pool.map(fetch, urls))
+            for target_url, page in zip(urls, pages):
+                current_url = page.url or target_url
+                if current_url in visited:
+                    continue
+                visited.add(current_url)
+                records.extend(self._extract_list_records(self._document(page), current_url, strategy))
+                if strategy.max_items and len(records) >= strategy.max_items:
+                    records = records[:strategy.max_items]
+                    break
+            return records or self._run_default_flow(url, strategy, fetch)
+
         while next_url and pages_processed < max_pages:
             target_url = next_url
-            page = self.retry_policy.run(lambda target=target_url: self.fetcher.fetch(target))
+            page = fetch(target_url)
             current_url = page.url or target_url
             if current_url in visited:
                 break
             visited.add(current_url)
-            soup = BeautifulSoup(page.html, "lxml")
+            doc = self._document(page)
 
-            new_records = self._extract_list_records(soup, current_url, strategy)
+            new_records = self._extract_list_records(doc, current_url, strategy)
             records.extend(new_records)
             
             if strategy.max_items and len(records) >= strategy.max_items:
@@ -65,28 +128,112 @@ class Executor:
                 break
 
             pages_processed += 1
-            next_url = self._next_page_url(soup, current_url, strategy.pagination_selector)
+            next_url = self._next_page_url(doc, current_url, strategy.pagination_selector)
 
-        return records or self._run_default_flow(url, strategy)
+        return records or self._run_default_flow(url, strategy, fetch)
 
-    def _run_gallery_flow(self, url: str, strategy: Strategy) -> List[Dict[str, Any]]:
-        page = self.retry_policy.run(lambda: self.fetcher.fetch(url))
-        if not page.html:
-            return []
-        soup = BeautifulSoup(page.html, "lxml")
-        record = self._extract_fields(soup, strategy, page.url or url)
-        record["images"] = self._collect_images(soup, strategy.image_selector or "img", page.url or url)
-        return [record]
+    async def _arun_list_flow(self, url: str, strategy: Strategy, afetch: _AsyncFetch) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        pages_processed = 0
+        next_url: str | None = url
+        visited: set[str] = set()
+
+        MAX_PAGE_VISITS = 5
+        max_pages = min(strategy.max_pages or 1, MAX_PAGE_VISITS)
+
+        if strategy.pagination_template and max_pages > 1:
+            urls = self._template_page_urls(url, strategy.pagination_template, max_pages)
+            pages = await asyncio.gather(*(afetch(target) for target in urls))
+            for target_url, page in zip(urls, pages):
+                current_url = page.url or target_url
+                if current_url in visited:
+                    continue
+                visited.add(current_url)
+                records.extend(await self._alist_page_records(self._document(page), current_url, strategy))
+                if strategy.max_items and len(records) >= strategy.max_items:
+                    records = records[:strategy.max_items]
+                    break
+            next_url = None
+
+        # Each next-page URL comes from the previous page, so pages are walked in order.
+        while next_url and pages_processed < max_pages:
+            target_url = next_url
+            page = await afetch(target_url)
+            current_url = page.url or target_url
+            if current_url in visited:
+                break
+            visited.add(current_url)
+            doc = self._document(page)
 
-    def _run_default_flow(self, url: str, strategy: Strategy) -> List[Dict[str, Any]]:
-        page = self.retry_policy.run(lambda: self.fetcher.fetch(url))
+            new_records = await self._alist_page_records(doc, current_url, strategy)
+            records.extend(new_records)
+
+            if strategy.max_items and len(records) >= strategy.max_items:
+                records = records[:strategy.max_items]
+                break
+
+            pages_processed += 1
+            next_url = self._next_page_url(doc, current_url, strategy.pagination_selector)
+
+        if records:
+            return records
+        return self._single_page_records(await afetch(url), url, strategy)
+
+    async def _alist_page_records(self, doc: HtmlDocument, base_url: str, strategy: Strategy) -> List[Dict[str, Any]]:
+        if not self._sanitize_selector(strategy.item_link_selector):
+            return self._extract_inline_list(doc, strategy, base_url)
+        targets = self._detail_targets(doc, base_url, strategy)
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch_detail(target: str) -> FetchResult:
+            async with semaphore:
+                return await self._afetch_with_retry(target)
+
+        pages = await asyncio.gather(*(fetch_detail(target) for target in targets))
+        return self._detail_records(targets, pages, strategy)
+
+    @staticmethod
+    def _template_page_urls(url: str, template: str, max_pages: int) -> List[str]:
+        """First page plus pages 2..max_pages built from a ``{page}`` URL template."""
+        urls = [url]
+        for page_number in range(2, max_pages + 1):
+            urls.append(_join_url(url, template.replace("{page}", str(page_number))))
+        return urls
+
+    def _run_gallery_flow(self, url: str, strategy: Strategy, fetch: _Fetch) -> List[Dict[str, Any]]:
+        return self._single_page_records(fetch(url), url, strategy)
+
+    def _run_default_flow(self, url: str, strategy: Strategy, fetch: _Fetch) -> List[Dict[str, Any]]:
+        return self._single_page_records(fetch(url), url, strategy)
+
+    def _single_page_records(self, page: FetchResult, url: str, strategy: Strategy) -> List[Dict[str, Any]]:
+        """Extract the one record of a news, gallery or default page."""
         if not page.html:
             return []
-        soup = BeautifulSoup(page.html, "lxml")
-        record = self._extract_fields(soup, strategy, page.url or url)
+        doc = self._document(page)
+        record = self._extract_fields(doc, strategy, page.url or url)
+        if strategy.page_type == PageType.GALLERY:
+            record["images"] = self._collect_images(doc, strategy.image_selector or "img", page.url or url)
         return [record]
 
-    def _extract_fields(self, soup: BeautifulSoup, strategy: Strategy, base_url: str) -> Dict[str, Any]:
+    def _document(self, page: FetchResult) -> HtmlDocument:
+        html = page.html or ""
+        if len(html) > _MAX_CACHED_DOCUMENT_CHARS:
+            return HtmlDocument(html)
+        key = page.url or ""
+        with self._documents_lock:
+            doc = self._documents.get(key)
+            if doc is not None and doc.html == html:
+                self._documents.move_to_end(key)
+                return doc
+        doc = HtmlDocument(html)
+        with self._documents_lock:
+            self._documents[key] = doc
+            while len(self._documents) > _DOCUMENT_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        return doc
+
+    def _extract_fields(self, doc: HtmlDocument, strategy: Strategy, base_url: str) -> Dict[str, Any]:
         result: Dict[str, Any] = {}
         fallbacks = (strategy.fallbacks or {}).get("field_selectors", {})
         limits = strategy.field_limits or {}
@@ -107,7 +254,7 @@ class Executor:
                     limit = global_limit
 
             if field in {"sub_comments", "links"} and method.startswith("attr:href"):
-                nodes = soup.select(selector)
+                nodes = _select(doc, selector)
                 # Resolve URLs first, then limit
                 value = []
                 for node in nodes:
@@ -119,102 +266,125 @@ class Executor:
                 if limit:
                     value = value[:limit]
             elif field in {"sub_comments", "links", "image", "img", "src", "video"} and method == "css":
-                nodes = soup.select(selector)
+                nodes = _select(doc, selector)
                 if limit:
                     nodes = nodes[:limit]
                 value = []
                 for node in nodes:
                     # Prefer href for links field
-                    if field == "links" and node.name == "a" and node.has_attr("href"):
+                    if field == "links" and _tag(node) == "a" and _has_attr(node, "href"):
                         href = node.get("href", "").strip()
                         if href and not href.lower().startswith("javascript:"):
                             resolved = self._resolve_url(base_url, href)
                             value.append(resolved or href)
                             continue
                     # Prefer src for image fields
-                    if field in ("image", "img", "src") and node.name == "img" and node.has_attr("src"):
+                    if field in ("image", "img", "src") and _tag(node) == "img" and _has_attr(node, "src"):
                         src = node.get("src", "").strip()
                         resolved = self._resolve_url(base_url, src)
                         value.append(resolved or src)
                         continue
                     # Prefer src for video fields
-                    if field in ("video",) and node.name == "video":
+                    if field in ("video",) and _tag(node) == "video":
                          src = node.get("src", "").strip()
                          if not src:
                              # Try source children
-                             source = node.select_one("source")
-                             if source:
+                             source = _select_one(node, "source")
+                             if source is not None:
                                  src = source.get("src", "").strip()
                          if src:
                              resolved = self._resolve_url(base_url, src)
                              value.append(resolved or src)
                              continue
 
-                    value.append(node.get_text(strip=True))
+                    value.append(_text(node))
                 
                 if limit == 1:
                     value = value[0] if value else ""
             else:
-                value = self._extract_with_method(soup, selector, method, base_url)
+                value = self._extract_with_method(doc, selector, method, base_url)
             
             if not value and field in fallbacks:
                 fallback_selector = self._sanitize_selector(fallbacks[field])
-                value = self._extract_with_method(soup, fallback_selector, "css", base_url)
+                value = self._extract_with_method(doc, fallback_selector, "css", base_url)
             result[field] = value
 
         if strategy.primary_image_field:
             result[strategy.primary_image_field] = self._extract_primary_image(
-                soup,
+                doc,
                 strategy.primary_image_selector,
                 base_url,
             )
         return result
 
-    def _extract_with_method(self, soup: BeautifulSoup, selector: str, method: str, base_url: str) -> str:
+    def _extract_with_method(self, doc: HtmlDocument, selector: str, method: str, base_url: str) -> str:
         selector = self._sanitize_selector(selector)
         if not selector:
             return ""
         try:
             if method.startswith("attr:"):
                 attr = method.split(":", 1)[1]
-                node = soup.select_one(selector)
-                if not node:
+                node = _select_one(doc, selector)
+                if node is None:
                     return ""
                 value = node.get(attr, "").strip()
                 if attr in {"href", "src"}:
                     return self._resolve_url(base_url, value) or value
                 return value
             if method == "text":
-                node = soup.select_one(selector)
-                return node.get_text(strip=True) if node else ""
+                node = _select_one(doc, selector)
+                return _text(node) if node is not None else ""
             # default css
-            node = soup.select_one(selector)
-            return node.get_text(strip=True) if node else ""
+            node = _select_one(doc, selector)
+            return _text(node) if node is not None else ""
         except Exception:
             return ""
 
-    def _extract_list_records(self, soup: BeautifulSoup, base_url: str, strategy: Strategy) -> List[Dict[str, Any]]:
+    def _extract_list_records(self, doc: HtmlDocument, base_url: str, strategy: Strategy) -> List[Dict[str, Any]]:
         if self._sanitize_selector(strategy.item_link_selector):
-            return self._follow_detail_links(soup, base_url, strategy)
-        return self._extract_inline_list(soup, strategy, base_url)
-
-    def _follow_detail_links(self, soup: BeautifulSoup, base_url: str, strategy: Strategy) -> List[Dict[str, Any]]:
-        records: List[Dict[str, Any]] = []
+            return self._follow_detail_links(doc, base_url, strategy)
+        return self._extract_inline_list(doc, strategy, base_url)
+
+    def _follow_detail_links(self, doc: HtmlDocument, base_url: str, strategy: Strategy) -> List[Dict[str, Any]]:
+        targets = self._detail_targets(doc, base_url, strategy)
+
+        # Detail fetches are pure network waits; run them side by side, keeping link order.
+        # Fetcher.fetch keeps no per-request state, so sharing it across threads is safe.
+        workers = min(self.max_workers, len(targets))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                pages = list(pool.map(self._fetch_with_retry, targets))
+        else:
+            pages = [self._fetch_with_retry(target) for target in targets]
+        return self._detail_records(targets, pages, strategy)
+
+    def _detail_targets(self, doc: HtmlDocument, base_url: str, strategy: Strategy) -> List[str]:
         selector = self._sanitize_selector(strategy.item_link_selector)
-        links = soup.select(selector) if selector else []
+        links = _select(doc, selector) if selector else []
         max_items = max(1, strategy.max_depth or 1)
-        for link in links[:max_items]:
-            href = link.get("href")
-            target = self._resolve_url(base_url, href)
-            if not target:
-                continue
-            detail_page = self.retry_policy.run(lambda target_url=target: self.fetcher.fetch(target_url))
-            detail_soup = BeautifulSoup(detail_page.html, "lxml")
+        targets = [self._resolve_url(base_url, link.get("href")) for link in links[:max_items]]
+        return [target for target in targets if target]
+
+    def _detail_records(
+        self, targets: List[str], pages: List[FetchResult], strategy: Strategy
+    ) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        for target, detail_page in zip(targets, pages):
+            detail_doc = self._document(detail_page)
             detail_url = detail_page.url or target
-            records.append(self._extract_fields(detail_soup, strategy, detail_url))
+            records.append(self._extract_fields(detail_doc, strategy, detail_url))
         return records
 
-    def _extract_inline_list(self, soup: BeautifulSoup, strategy: Strategy, base_url: str | None = None) -> List[Dict[str, Any]]:
+    def _fetch_with_retry(self, url: str) -> FetchResult:
+        return self.retry_policy.run(lambda: self.fetcher.fetch(url))
+
+    async def _afetch_with_retry(self, url: str) -> FetchResult:
+        afetch = getattr(self.fetcher, "afetch", None)
+        if afetch is None:
+            return await asyncio.to_thread(self._fetch_with_retry, url)
+        return await self.retry_policy.arun(lambda: afetch(url))
+
+    def _extract_inline_list(self, doc: HtmlDocument, strategy: Strategy, base_url: str | None = None) -> List[Dict[str, Any]]:
         columns: Dict[str, List[Any]] = {}
         limits = strategy.field_limits or {}
         global_limit = strategy.max_items
@@ -223,7 +393,7 @@ class Executor:
             selector = self._sanitize_selector(selector)
             if not selector:
                 continue
-            nodes = soup.select(selector)
+            nodes = _select(doc, selector)
             limit = limits.get(field)
             # Treat 0 as None (no limit specified) so global_limit can apply
             if limit == 0:
@@ -233,44 +403,15 @@ class Executor:
                 if limit is None or global_limit < limit:
                     limit = global_limit
             
-            method = strategy.field_methods.get(field, "css")
+            extract = _node_extractor(field, strategy.field_methods.get(field, "css"))
             values: List[str] = []
             for node in nodes:
-                if method.startswith("attr:"):
-                    attr = method.split(":", 1)[1]
-                    val = node.get(attr, "").strip()
-                    if attr == "href":
-                        if val.lower().startswith("javascript:"):
-                            continue
-                        if base_url:
-                            val = self._resolve_url(base_url, val) or val
-                    elif attr == "src" and base_url:
-                        val = self._resolve_url(base_url, val) or val
-                    values.append(val)
-                elif method == "text":
-                    values.append(node.get_text(strip=True))
-                else:
-                    # Default CSS behavior
-                    # Auto-detect link intent
-                    if field in ("links", "link", "url", "urls") and node.name == "a" and node.has_attr("href"):
-                        val = node.get("href", "").strip()
-                        if not val.lower().startswith("javascript:"):
-                             if base_url:
-                                 val = self._resolve_url(base_url, val) or val
-                             values.append(val)
-                             continue
-                    # Auto-detect image intent
-                    if field in ("image", "img", "src") and node.name == "img" and node.has_attr("src"):
-                        val = node.get("src", "").strip()
-                        if base_url:
-                            val = self._resolve_url(base_url, val) or val
-                        values.append(val)
-                        continue
-                    
-                    values.append(node.get_text(strip=True))
-            
-            if limit:
-                values = values[:limit]
+                value = extract(node, base_url)
+                if value is _SKIP:
+                    continue
+                values.append(value)
+                if limit and len(values) >= limit:
+                    break
             columns[field] = values
         
         if not columns:
@@ -279,7 +420,7 @@ class Executor:
         keys = list(columns.keys())
         # Special-case list aggregation fields to keep them as arrays
         if keys == ["links"]:
-            return [{"links": columns["links"]}]
+            return [{"links": list(dict.fromkeys(columns["links"]))}]
         if keys == ["sub_comments"]:
             return [{"sub_comments": columns["sub_comments"]}]
 
@@ -291,20 +432,16 @@ class Executor:
             records.append(record)
         return records
 
-    def _collect_images(self, soup: BeautifulSoup, selector: str, base_url: str) -> List[str]:
-        results: List[str] = []
+    def _collect_images(self, doc: HtmlDocument, selector: str, base_url: str) -> List[str]:
         selector = self._sanitize_selector(selector)
-        for img in soup.select(selector):
-            src = img.get("src", "").strip()
-            if not src:
-                continue
-            resolved = self._resolve_url(base_url, src) or src
-            results.append(resolved)
-        return results
+        # Galleries repeat the same src (thumbnail strip + full view); resolve and keep each once.
+        sources = dict.fromkeys(img.get("src", "").strip() for img in _select(doc, selector))
+        sources.pop("", None)
+        return list(dict.fromkeys(self._resolve_url(base_url, src) or src for src in sources))
 
     def _extract_primary_image(
         self,
-        soup: BeautifulSoup,
+        doc: HtmlDocument,
         selector: str | None,
         base_url: str,
     ) -> Any:
@@ -312,10 +449,10 @@ class Executor:
         if not selector:
             return None
         try:
-            node = soup.select_one(selector)
+            node = _select_one(doc, selector)
         except Exception:
             node = None
-        if not node:
+        if node is None:
             return None
         src = node.get("src", "").strip()
         if not src:
@@ -326,23 +463,214 @@ class Executor:
     def _resolve_url(base_url: str, href: str | None) -> str | None:
         if not href:
             return None
-        return urljoin(base_url, href)
+        return _join_url(base_url, href)
 
     @staticmethod
-    def _next_page_url(soup: BeautifulSoup, base_url: str, selector: str | None) -> str | None:
+    def _next_page_url(doc: HtmlDocument, base_url: str, selector: str | None) -> str | None:
         selector = Executor._sanitize_selector(selector)
         if not selector:
             return None
-        node = soup.select_one(selector)
-        if not node:
+        node = _select_one(doc, selector)
+        if node is None:
             return None
         return Executor._resolve_url(base_url, node.get("href"))
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _sanitize_selector(selector: str | None) -> str:
+        # Strategies are reused for every page and detail page, so rewrite each selector once.
         if not selector:
             return ""
         return _CONTAINS_RE.sub(":-soup-contains", selector)
 
 
 _CONTAINS_RE = re.compile(r":contains(?=\s*\()")
+_BARE_TAG_RE = re.compile(r"\s*[a-zA-Z][a-zA-Z0-9]*\s*$")
+_DOCUMENT_CACHE_SIZE = 64
+_MAX_CACHED_DOCUMENT_CHARS = 5_000_000
+
+
+_SKIP = object()
+_LINK_FIELDS = frozenset(("links", "link", "url", "urls"))
+_IMAGE_FIELDS = frozenset(("image", "img", "src"))
+
+
+def _absolute(base_url: str | None, value: str) -> str:
+    if base_url and value:
+        return _join_url(base_url, value)
+    return value
+
+
+def _join_url(base_url: str, href: str) -> str:
+    """``urljoin`` with fast paths for the absolute and root-relative links most pages use."""
+    # Empty queries/fragments and dot segments are normalized by urljoin, so leave those to it.
+    if not href.endswith(("#", "?")) and "?#" not in href:
+        if href.startswith(("http://", "https://")):
+            host_start = href.index("//") + 2
+            if href[host_start:host_start + 1] not in ("", "/", "?", "#"):
+                return href
+        if href.startswith("/") and not href.startswith("//") and "/." not in href:
+            origin = _origin(base_url)
+            if origin:
+                return origin + href
+    return _urljoin(base_url, href)
+
+
+# List pages repeat the same relative hrefs (pagination, category links) against one base.
+_urljoin = lru_cache(maxsize=8192)(urljoin)
+
+
+@lru_cache(maxsize=64)
+def _origin(base_url: str) -> str:
+    parts = urlsplit(base_url)
+    if parts.scheme in ("http", "https") and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc}"
+    return ""
+
+
+@lru_cache(maxsize=256)
+def _node_extractor(field: str, method: str) -> Callable[[Any, str | None], Any]:
+    """Build the per-node value function for an inline-list column once per (field, method).
+
+    The returned function maps a selected node and the page URL to its value,
+    or to ``_SKIP`` when the node should not produce a row (``javascript:`` links).
+    """
+    if method.startswith("attr:"):
+        attr = method.split(":", 1)[1]
+        if attr == "href":
+            def extract_href(node: Any, base_url: str | None) -> Any:
+                value = node.get("href", "").strip()
+                if value.lower().startswith("javascript:"):
+                    return _SKIP
+                return _absolute(base_url, value)
+
+            return extract_href
+        if attr == "src":
+            return lambda node, base_url: _absolute(base_url, node.get("src", "").strip())
+        return lambda node, base_url: node.get(attr, "").strip()
+
+    if method == "text" or (field not in _LINK_FIELDS and field not in _IMAGE_FIELDS):
+        return lambda node, base_url: _text(node)
+
+    # Default CSS behavior: auto-detect link or image intent from the field name.
+    wanted_tag, attr = ("a", "href") if field in _LINK_FIELDS else ("img", "src")
+
+    def extract_auto(node: Any, base_url: str | None) -> Any:
+        if _tag(node) == wanted_tag and _has_attr(node, attr):
+            value = node.get(attr, "").strip()
+            if attr == "src" or not value.lower().startswith("javascript:"):
+                return _absolute(base_url, value)
+        return _text(node)
+
+    return extract_auto
+
+
+# BeautifulSoup keeps text under these tags in dedicated string types that
+# get_text() leaves out; the lxml path mirrors that.
+_STRING_CONTAINER_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+_STRING_CONTAINERS = "ancestor::*[" + " or ".join(f"self::{tag}" for tag in sorted(_STRING_CONTAINER_TAGS)) + "]"
+_TEXT_XPATH = etree.XPath(f"descendant::text()[not({_STRING_CONTAINERS})]", smart_strings=False)
+# Inside a container tag only strings whose nearest container has the same name count.
+_CONTAINER_TEXT_XPATH = etree.XPath(
+    f"descendant::text()[name(({_STRING_CONTAINERS})[last()]) = $tag]",
+    smart_strings=False,
+)
+
+
+class HtmlDocument:
+    """A fetched page, parsed once with lxml and queried many times.
+
+    CSS selectors are translated to XPath by cssselect. Selectors it cannot
+    express (soupsieve extensions such as ``:-soup-contains`` or ``:has``), or
+    every selector when cssselect is not installed, run through soupsieve on a
+    BeautifulSoup tree that is only built when first needed.
+    """
+
+    def __init__(self, html: str) -> None:
+        self.html = html or ""
+        self._root: etree._Element | None = None
+        self._parsed = False
+        self._soup: BeautifulSoup | None = None
+
+    @property
+    def root(self) -> etree._Element | None:
+        if not self._parsed:
+            self._parsed = True
+            self._root = parse_html(self.html)
+        return self._root
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+
+@lru_cache(maxsize=1024)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    # The same strategy selectors run against every list/detail page; parse each once.
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=1024)
+def _compile_xpath(selector: str, prefix: str) -> etree.XPath | None:
+    if HTMLTranslator is None:
+        return None
+    try:
+        return etree.XPath(HTMLTranslator().css_to_xpath(selector, prefix=prefix))
+    except (SelectorError, ExpressionError):
+        return None
+
+
+def _select(node: Any, selector: str) -> List[Any]:
+    if isinstance(node, (HtmlDocument, etree._Element)) and _BARE_TAG_RE.match(selector):
+        return list(_iter_tag(node, selector))
+    if isinstance(node, HtmlDocument):
+        xpath = _compile_xpath(selector, "descendant-or-self::")
+        if xpath is None:
+            return _compile_selector(selector).select(node.soup)
+        root = node.root
+        return xpath(root) if root is not None else []
+    if isinstance(node, etree._Element):
+        xpath = _compile_xpath(selector, "descendant::")
+        if xpath is None:
+            raise ValueError(f"Selector cannot be evaluated on an lxml node: {selector}")
+        return xpath(node)
+    return _compile_selector(selector).select(node)
+
+
+def _select_one(node: Any, selector: str) -> Any:
+    if isinstance(node, (HtmlDocument, etree._Element)):
+        if _BARE_TAG_RE.match(selector):
+            return next(_iter_tag(node, selector), None)
+        matches = _select(node, selector)
+        return matches[0] if matches else None
+    return _compile_selector(selector).select_one(node)
+
+
+def _iter_tag(node: Any, selector: str) -> Iterator[etree._Element]:
+    """Plain tag selectors ("img", "a") skip XPath and use lxml's C tag iterator."""
+    tag = selector.strip().lower()
+    if isinstance(node, HtmlDocument):
+        root = node.root
+        return root.iter(tag) if root is not None else iter(())
+    return node.iterdescendants(tag)
+
+
+def _tag(node: Any) -> str:
+    return node.tag if isinstance(node, etree._Element) else node.name
+
+
+def _has_attr(node: Any, attr: str) -> bool:
+    return attr in node.attrib if isinstance(node, etree._Element) else node.has_attr(attr)
+
+
+def _text(node: Any) -> str:
+    """Stripped, concatenated text of node, matching BeautifulSoup's get_text(strip=True)."""
+    if not isinstance(node, etree._Element):
+        return node.get_text(strip=True)
+    if node.tag in _STRING_CONTAINER_TAGS:
+        chunks = _CONTAINER_TEXT_XPATH(node, tag=node.tag)
+    else:
+        chunks = _TEXT_XPATH(node)
+    return "".join(chunk.strip() for chunk in chunks)
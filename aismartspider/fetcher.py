@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import concurrent.futures
+import importlib.util
 import os
+import random
+import re
 import shutil
+import sqlite3
 import tempfile
+import threading
 import time
+import weakref
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote, urlsplit, urlunsplit
 
 from curl_cffi import requests
 from curl_cffi.requests import RequestsError
@@ -50,6 +61,18 @@ def _ensure_ascii_cert_path() -> Optional[str]:
 CERT_BUNDLE_PATH = _ensure_ascii_cert_path()
 
 
+@lru_cache(maxsize=1024)
+def _encode_url(url: str) -> str:
+    """Percent-encode non-ASCII characters (e.g. Chinese in query params) in ``url``."""
+    parts = urlsplit(url)
+    # Encode path and query, keeping safe characters
+    # safe characters for path usually include /
+    # safe characters for query usually include = & %
+    encoded_path = quote(parts.path, safe="/%")
+    encoded_query = quote(parts.query, safe="=&%")
+    return urlunsplit((parts.scheme, parts.netloc, encoded_path, encoded_query, parts.fragment))
+
+
 @dataclass
 class FetchResult:
     """Represents a fetched (and possibly rendered) page."""
@@ -71,6 +94,7 @@ class Fetcher:
         auto_render: bool = True,
         render_backends: Optional[Sequence[str]] = None,
         selenium_options: Optional[Dict[str, str]] = None,
+        cache_dir: Optional[str] = None,
     ) -> None:
         # use_playwright is kept for backward-compatibility; default to auto-render.
         if use_playwright is None:
@@ -86,6 +110,18 @@ class Fetcher:
         self._cert_bundle = CERT_BUNDLE_PATH
         self._playwright_disabled = False
         self._selenium_disabled = False
+        # curl handles are not thread-safe, so each worker thread keeps its own pooled session.
+        self._local = threading.local()
+        self._renderer_lock = threading.Lock()
+        self._host_lock = threading.Lock()
+        self._host_next_slot: Dict[str, float] = {}
+        self.cache_dir = cache_dir
+        # Validators of earlier responses, so re-crawls can be answered with 304 Not Modified.
+        self._http_cache = _HttpCache(cache_dir) if cache_dir else None
+        self._playwright_renderer: Optional[_PlaywrightRenderer] = None
+        self._async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, requests.AsyncSession]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     def fetch(self, url: str) -> FetchResult:
         """Fetch page source via static request with automatic render fallback."""
@@ -105,6 +141,16 @@ class Fetcher:
         rendered = None
         if self.auto_render:
             rendered = self._render_with_backends(url)
+        return self._fallback_result(url, static_html, final_url, last_error, rendered)
+
+    @staticmethod
+    def _fallback_result(
+        url: str,
+        static_html: str,
+        final_url: str,
+        last_error: Exception | None,
+        rendered: Optional[Tuple[str, str, str]],
+    ) -> FetchResult:
         if rendered:
             html, rendered_url, backend = rendered
             return FetchResult(url=rendered_url or url, html=html, renderer=backend)
@@ -117,70 +163,173 @@ class Fetcher:
 
         return FetchResult(url=url, html="", renderer="static", degraded=True)
 
+    async def afetch(self, url: str) -> FetchResult:
+        """Async variant of :meth:`fetch`.
+
+        The static request runs on the event loop. Playwright renders are awaited
+        on the shared browser; Selenium still blocks and runs in a worker thread.
+        """
+        static_html = ""
+        final_url = url
+        last_error: Exception | None = None
+
+        try:
+            static_html, final_url = await self._afetch_static(url)
+        except Exception as exc:
+            last_error = exc
+
+        needs_render = self.auto_render and self._needs_render(static_html)
+        if static_html and not needs_render:
+            return FetchResult(url=final_url, html=static_html, renderer="static")
+
+        rendered = None
+        if self.auto_render:
+            rendered = await self._arender_with_backends(url)
+        return self._fallback_result(url, static_html, final_url, last_error, rendered)
+
+    async def fetch_many(self, urls: Sequence[str], concurrency: int = 16) -> List[FetchResult]:
+        """Fetch ``urls`` concurrently, at most ``concurrency`` at a time, in input order.
+
+        Requests to the same host are still spaced by ``settings.rate_limit``.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def bounded(url: str) -> FetchResult:
+            async with semaphore:
+                return await self.afetch(url)
+
+        return list(await asyncio.gather(*(bounded(url) for url in urls)))
+
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
     def _fetch_static(self, url: str) -> Tuple[str, str]:
-        # Encode URL to handle non-ASCII characters (e.g. Chinese in query params)
-        from urllib.parse import quote, urlsplit, urlunsplit
-        
-        parts = urlsplit(url)
-        # Encode path and query, keeping safe characters
-        # safe characters for path usually include /
-        # safe characters for query usually include = & %
-        encoded_path = quote(parts.path, safe="/%")
-        encoded_query = quote(parts.query, safe="=&%")
-        encoded_url = urlunsplit((parts.scheme, parts.netloc, encoded_path, encoded_query, parts.fragment))
+        cached = self._http_cache.get(url) if self._http_cache else None
+        if cached is not None and cached.is_fresh():
+            return cached.body, cached.final_url
+
+        request = self._static_request(url, cached)
+        delay = self._reserve_host_slot(url)
+        if delay > 0:
+            time.sleep(delay)  # gentle rate limit
+        try:
+            response = self._session().get(**request)
+        except RequestsError as exc:
+            if not self._insecure_retry(exc, request):
+                raise
+            response = self._session().get(**request)
 
-        headers = {
-            "Referer": encoded_url,
-            "Upgrade-Insecure-Requests": "1",
-            "User-Agent": settings.user_agent,
-        }
-        proxies = {"http": self.proxy, "https": self.proxy} if self.proxy else None
+        if cached is not None and response.status_code == 304:
+            return self._revalidated(url, cached, response)
 
-        verify_arg: bool | str = self._cert_bundle or True
+        if response.status_code == 403:
+            print(f"[Fetcher] 403 Forbidden for {url}")
+            return "", response.url or url
+
+        response.raise_for_status()
+        return self._response_text(response, url)
+
+    async def _afetch_static(self, url: str) -> Tuple[str, str]:
+        cached = self._http_cache.get(url) if self._http_cache else None
+        if cached is not None and cached.is_fresh():
+            return cached.body, cached.final_url
 
+        request = self._static_request(url, cached)
+        delay = self._reserve_host_slot(url)
+        if delay > 0:
+            await asyncio.sleep(delay)  # gentle rate limit
         try:
-            response = requests.get(
-                encoded_url,
-                headers=headers,
-                cookies=self.cookies,
-                proxies=proxies,
-                timeout=settings.timeout,
-                impersonate="chrome120",
-                allow_redirects=True,
-                verify=verify_arg,
-            )
+            response = await self._async_session().get(**request)
         except RequestsError as exc:
-            message = str(exc).lower()
-            if "certificate" in message and "verify" in message and verify_arg is not False:
-                print("[Fetcher] TLS verification failed (likely non-ASCII CA path). Retrying insecurely.")
-                response = requests.get(
-                    encoded_url,
-                    headers=headers,
-                    cookies=self.cookies,
-                    proxies=proxies,
-                    timeout=settings.timeout,
-                    impersonate="chrome120",
-                    allow_redirects=True,
-                    verify=False,
-                )
-            else:
+            if not self._insecure_retry(exc, request):
                 raise
+            response = await self._async_session().get(**request)
+
+        if cached is not None and response.status_code == 304:
+            return self._revalidated(url, cached, response)
 
         if response.status_code == 403:
             print(f"[Fetcher] 403 Forbidden for {url}")
             return "", response.url or url
 
         response.raise_for_status()
-        time.sleep(0.5)  # gentle rate limit
+        return self._response_text(response, url)
+
+    def _reserve_host_slot(self, url: str) -> float:
+        """Book the next request slot for url's host and return how long to wait for it.
+
+        Requests to one host start at least ``settings.rate_limit`` seconds
+        apart; different hosts do not wait on each other.
+        """
+        if settings.rate_limit <= 0:
+            return 0.0
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_slot.get(host, 0.0))
+            self._host_next_slot[host] = start + settings.rate_limit
+        return start - now
+
+    def _static_request(self, url: str, cached: Optional[_CachedPage] = None) -> Dict[str, Any]:
+        encoded_url = _encode_url(url)
+        headers = {
+            "Referer": encoded_url,
+            "Upgrade-Insecure-Requests": "1",
+            "User-Agent": settings.user_agent,
+        }
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return {
+            "url": encoded_url,
+            "headers": headers,
+            "cookies": self.cookies,
+            "proxies": {"http": self.proxy, "https": self.proxy} if self.proxy else None,
+            "timeout": settings.timeout,
+            "impersonate": "chrome120",
+            "allow_redirects": True,
+            "verify": self._cert_bundle or True,
+        }
 
+    @staticmethod
+    def _insecure_retry(exc: RequestsError, request: Dict[str, Any]) -> bool:
+        """Switch ``request`` to verify=False if ``exc`` is a CA-bundle failure worth retrying."""
+        message = str(exc).lower()
+        if "certificate" in message and "verify" in message and request["verify"] is not False:
+            print("[Fetcher] TLS verification failed (likely non-ASCII CA path). Retrying insecurely.")
+            request["verify"] = False
+            return True
+        return False
+
+    def _response_text(self, response: Any, url: str) -> Tuple[str, str]:
         if "<html" not in response.text.lower():
             print(f"[Fetcher] Warning: unusual response, missing <html> tag for {url}")
-
+        if self._http_cache is not None:
+            self._http_cache.store(url, response, response.text, response.url or url)
         return response.text, response.url or url
 
+    def _revalidated(self, url: str, cached: _CachedPage, response: Any) -> Tuple[str, str]:
+        """Serve the stored body for a 304 and refresh its validators and freshness."""
+        self._http_cache.store(url, response, cached.body, cached.final_url, previous=cached)
+        return cached.body, cached.final_url
+
+    def _session(self) -> requests.Session:
+        """Return this thread's session; it keeps connections and TLS state alive between fetches."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _async_session(self) -> requests.AsyncSession:
+        """Return the async session bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None:
+            session = self._async_sessions[loop] = requests.AsyncSession()
+        return session
+
     def _render_with_backends(self, url: str) -> Optional[Tuple[str, str, str]]:
         for backend in self.render_backends:
             if backend == "playwright" and self._playwright_disabled:
@@ -199,76 +348,88 @@ class Fetcher:
                 return html, final_url or url, backend
         return None
 
+    async def _arender_with_backends(self, url: str) -> Optional[Tuple[str, str, str]]:
+        for backend in self.render_backends:
+            if backend == "playwright" and not self._playwright_disabled:
+                rendered = await self._afetch_with_playwright(url)
+            elif backend == "selenium" and not self._selenium_disabled:
+                rendered = await asyncio.to_thread(self._fetch_with_selenium, url)
+            else:
+                continue
+
+            if rendered and rendered[0]:
+                html, final_url = rendered
+                return html, final_url or url, backend
+        return None
+
     def _fetch_with_playwright(self, url: str) -> Optional[Tuple[str, str]]:
-        if self._playwright_disabled:
+        if not self._playwright_available():
             return None
         try:
-            from playwright.sync_api import sync_playwright
-            import random
-        except ImportError:
-            print("[Fetcher] Playwright not installed. Run 'pip install playwright' and 'playwright install'.")
-            self._playwright_disabled = True
-            return None
+            return self._playwright().submit(url).result()
+        except Exception as exc:
+            self._playwright_failed(exc)
+        return None
 
+    async def _afetch_with_playwright(self, url: str) -> Optional[Tuple[str, str]]:
+        if not self._playwright_available():
+            return None
         try:
-            with sync_playwright() as p:
-                launch_args = {
-                    "headless": True,
-                    "args": ["--disable-blink-features=AutomationControlled"],
-                }
-                if self.proxy:
-                    launch_args["proxy"] = {"server": self.proxy}
-
-                browser = p.chromium.launch(**launch_args)
-                context = browser.new_context(
-                    user_agent=settings.user_agent,
-                    viewport={"width": 1920, "height": 1080},
-                    locale="zh-CN",
-                    timezone_id="Asia/Shanghai",
-                )
-                context.add_init_script(
-                    """
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    """
-                )
-
-                if self.cookies:
-                    from urllib.parse import urlparse
-
-                    parsed = urlparse(url)
-                    domain = parsed.hostname or ""
-                    if domain and "baidu.com" in domain:
-                        domain = ".baidu.com"
-
-                    cookie_list = []
-                    for key, value in self.cookies.items():
-                        cookie_list.append({"name": key, "value": value, "domain": domain, "path": "/"})
-                    context.add_cookies(cookie_list)
-
-                page = context.new_page()
-                page.goto(url, wait_until="networkidle", timeout=settings.timeout * 1000)
-
-                try:
-                    page.mouse.move(random.randint(100, 400), random.randint(200, 700))
-                    page.mouse.wheel(0, random.randint(200, 800))
-                except Exception:
-                    pass
-
-                time.sleep(1.5)
-                content = page.content()
-                final_url = page.url
-                browser.close()
-                return content, final_url
+            # Awaiting the renderer's future directly lets gathered fetches render side by
+            # side in the shared context without tying up a worker thread per page.
+            return await asyncio.wrap_future(self._playwright().submit(url))
         except Exception as exc:
-            print(f"[Fetcher] Playwright fetch error: {exc}")
-            message = str(exc).lower()
-            if "playwright install" in message or "executable doesn't exist" in message:
-                print("[Fetcher] Disabling Playwright backend for this run. Falling back to static fetch.")
-                self._playwright_disabled = True
+            self._playwright_failed(exc)
         return None
 
+    def _playwright_available(self) -> bool:
+        if self._playwright_disabled:
+            return False
+        if importlib.util.find_spec("playwright") is None:
+            print("[Fetcher] Playwright not installed. Run 'pip install playwright' and 'playwright install'.")
+            self._playwright_disabled = True
+            return False
+        return True
+
+    def _playwright_failed(self, exc: Exception) -> None:
+        print(f"[Fetcher] Playwright fetch error: {exc}")
+        message = str(exc).lower()
+        if "playwright install" in message or "executable doesn't exist" in message:
+            print("[Fetcher] Disabling Playwright backend for this run. Falling back to static fetch.")
+            self._playwright_disabled = True
+
+    def _playwright(self) -> "_PlaywrightRenderer":
+        with self._renderer_lock:
+            if self._playwright_renderer is None:
+                # With a cache_dir the browser keeps a profile there, so its HTTP cache
+                # (scripts, styles, images) and cookies carry over to later runs.
+                profile_dir = os.path.join(self.cache_dir, _BROWSER_PROFILE_DIR) if self.cache_dir else None
+                self._playwright_renderer = _PlaywrightRenderer(self.proxy, self.cookies, profile_dir)
+            return self._playwright_renderer
+
+    def close(self) -> None:
+        """Shut down the shared Playwright browser and the HTTP cache, if they were opened."""
+        self._close_renderer()
+        if self._http_cache is not None:
+            self._http_cache.close()
+            self._http_cache = None
+
+    def clear_cache(self) -> None:
+        """Forget cached pages and the browser profile kept under ``cache_dir``."""
+        if not self.cache_dir:
+            return
+        # The profile directory is locked while Chromium runs; the next render relaunches it.
+        self._close_renderer()
+        if self._http_cache is not None:
+            self._http_cache.clear()
+        shutil.rmtree(os.path.join(self.cache_dir, _BROWSER_PROFILE_DIR), ignore_errors=True)
+
+    def _close_renderer(self) -> None:
+        with self._renderer_lock:
+            renderer, self._playwright_renderer = self._playwright_renderer, None
+        if renderer is not None:
+            renderer.close()
+
     def _fetch_with_selenium(self, url: str) -> Optional[Tuple[str, str]]:
         if self._selenium_disabled:
             return None
@@ -312,10 +473,15 @@ class Fetcher:
         sample = html.strip().lower()
         if len(sample) < 800:
             return True
-        script_count = sample.count("<script")
-        text_block_count = sample.count("<p") + sample.count("<article") + sample.count("<section") + sample.count("<li")
         if "enable javascript" in sample or "requires javascript" in sample:
             return True
+        script_count = sample.count("<script")
+        text_block_count = 0
+        # Each count is a full scan, so stop once none of the density rules below can fire.
+        for marker in ("<p", "<li", "<article", "<section"):
+            text_block_count += sample.count(marker)
+            if text_block_count >= 3 and text_block_count * 2 >= script_count:
+                return False
         if text_block_count == 0 and script_count > 0:
             return True
         if script_count >= 15 and script_count > text_block_count * 2:
@@ -323,3 +489,214 @@ class Fetcher:
         if sample.count("var ") > 50 and text_block_count < 3:
             return True
         return False
+
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)")
+# Chromium profile kept under Fetcher.cache_dir for persistent Playwright renders.
+_BROWSER_PROFILE_DIR = "playwright-profile"
+_HIDE_WEBDRIVER_SCRIPT = """
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+                """
+
+
+def _context_options() -> Dict[str, Any]:
+    return {
+        "user_agent": settings.user_agent,
+        "viewport": {"width": 1920, "height": 1080},
+        "locale": "zh-CN",
+        "timezone_id": "Asia/Shanghai",
+    }
+
+
+@dataclass
+class _CachedPage:
+    body: str
+    final_url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires: Optional[float] = None
+
+    def is_fresh(self) -> bool:
+        return self.expires is not None and self.expires > time.time()
+
+
+class _HttpCache:
+    """SQLite store of page bodies plus the ETag/Last-Modified validators they came with."""
+
+    def __init__(self, cache_dir: str) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "http_cache.db")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages "
+            "(url TEXT PRIMARY KEY, body BLOB, final_url TEXT, etag TEXT, last_modified TEXT, exp REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[_CachedPage]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, final_url, etag, last_modified, exp FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, final_url, etag, last_modified, expires = row
+        return _CachedPage(body.decode("utf-8"), final_url, etag, last_modified, expires)
+
+    def store(
+        self,
+        url: str,
+        response: Any,
+        body: str,
+        final_url: str,
+        previous: Optional[_CachedPage] = None,
+    ) -> None:
+        cache_control = (response.headers.get("Cache-Control") or "").lower()
+        etag = response.headers.get("ETag") or (previous.etag if previous else None)
+        last_modified = response.headers.get("Last-Modified") or (previous.last_modified if previous else None)
+        if "no-store" in cache_control or not (etag or last_modified or "max-age" in cache_control):
+            return
+        expires = None
+        match = _MAX_AGE_RE.search(cache_control)
+        if match and "no-cache" not in cache_control:
+            expires = time.time() + int(match.group(1))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, body, final_url, etag, last_modified, exp) VALUES (?, ?, ?, ?, ?, ?)",
+                (url, body.encode("utf-8"), final_url, etag, last_modified, expires),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _PlaywrightRenderer:
+    """One headless browser shared by every Playwright render of a Fetcher.
+
+    Launching Chromium costs seconds, so it is started on first use and kept;
+    each render gets its own short-lived context, which is cheap and keeps
+    cookies and storage from leaking between pages. Given a ``profile_dir``
+    the browser is instead launched as one persistent context on disk, and
+    renders open pages in it so cached assets survive across runs. Playwright objects are
+    bound to the loop that created them, so the renderer runs its own event
+    loop on a daemon thread and callers on any thread submit coroutines to it.
+    """
+
+    def __init__(self, proxy: Optional[str], cookies: Dict[str, str], profile_dir: Optional[str] = None) -> None:
+        self.proxy = proxy
+        self.cookies = cookies
+        self.profile_dir = profile_dir
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="aismartspider-playwright", daemon=True)
+        self._thread.start()
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._playwright: Any = None
+        self._browser: Any = None
+        atexit.register(self.close)
+
+    def submit(self, url: str) -> "concurrent.futures.Future[Tuple[str, str]]":
+        """Schedule a render; concurrent renders run side by side in the one browser."""
+        return asyncio.run_coroutine_threadsafe(self._render(url), self._loop)
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        if self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=10)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+        self._loop.close()
+        atexit.unregister(self.close)
+
+    async def _browser_for_run(self) -> Any:
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                launch_args: Dict[str, Any] = {
+                    "headless": True,
+                    "args": ["--disable-blink-features=AutomationControlled"],
+                }
+                if self.proxy:
+                    launch_args["proxy"] = {"server": self.proxy}
+
+                self._playwright = await async_playwright().start()
+                try:
+                    if self.profile_dir is None:
+                        self._browser = await self._playwright.chromium.launch(**launch_args)
+                    else:
+                        # A persistent launch returns a context, which stands in for the browser.
+                        self._browser = await self._playwright.chromium.launch_persistent_context(
+                            self.profile_dir, **launch_args, **_context_options()
+                        )
+                        await self._browser.add_init_script(_HIDE_WEBDRIVER_SCRIPT)
+                except Exception:
+                    # Leave nothing half-started behind; the next render retries from scratch.
+                    await self._shutdown()
+                    raise
+        return self._browser
+
+    async def _render(self, url: str) -> Tuple[str, str]:
+        browser = await self._browser_for_run()
+        if self.profile_dir is not None:
+            await self._add_cookies(browser, url)
+            return await self._load(browser, url)
+
+        context = await browser.new_context(**_context_options())
+        try:
+            await context.add_init_script(_HIDE_WEBDRIVER_SCRIPT)
+            await self._add_cookies(context, url)
+            return await self._load(context, url)
+        finally:
+            await context.close()
+
+    async def _add_cookies(self, context: Any, url: str) -> None:
+        if not self.cookies:
+            return
+        domain = urlsplit(url).hostname or ""
+        if domain and "baidu.com" in domain:
+            domain = ".baidu.com"
+
+        cookie_list = []
+        for key, value in self.cookies.items():
+            cookie_list.append({"name": key, "value": value, "domain": domain, "path": "/"})
+        await context.add_cookies(cookie_list)
+
+    @staticmethod
+    async def _load(context: Any, url: str) -> Tuple[str, str]:
+        page = await context.new_page()
+        try:
+            await page.goto(url, wait_until="networkidle", timeout=settings.timeout * 1000)
+
+            try:
+                await page.mouse.move(random.randint(100, 400), random.randint(200, 700))
+                await page.mouse.wheel(0, random.randint(200, 800))
+            except Exception:
+                pass
+
+            await asyncio.sleep(1.5)
+            return await page.content(), page.url
+        finally:
+            await page.close()
+
+    async def _shutdown(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = self._playwright = None
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .ai_client import LLMClient
-from .ai_prompts import INTENT_PROMPT_TEMPLATE
+from .ai_prompts import INTENT_SYSTEM_PROMPT, render_intent_input
 from .models import Intent, IntentType
 from .utils.json_utils import extract_json_payload, ensure_string_list
 
@@ -30,18 +30,56 @@ _INTENT_HINTS: Dict[IntentType, List[str]] = {
     IntentType.DOWNLOAD_IMAGES: ["image", "\u56fe\u7247", "\u56fe\u96c6", "\u4e0b\u8f7d\u56fe"],
     IntentType.CRAWL_DETAIL: ["detail", "\u8be6\u60c5", "\u9012\u5f52", "\u6df1\u5ea6"],
 }
+
+# Lower-cased once here; the heuristic matches them against the lowered user text.
+_FIELD_HINTS_LOWER: Dict[str, Tuple[str, ...]] = {
+    field: tuple(hint.lower() for hint in hints) for field, hints in _FIELD_HINTS.items()
+}
+_INTENT_HINTS_LOWER: Dict[IntentType, Tuple[str, ...]] = {
+    intent: tuple(marker.lower() for marker in markers) for intent, markers in _INTENT_HINTS.items()
+}
+
+# Match "前10", "Top 10" (most specific and common for limits)
+_LIMIT_TOP_RE = re.compile(r'(?:前|top)\s*(\d+)', re.IGNORECASE)
+# Match "10个", "10条", "10章" etc.
+_LIMIT_COUNTER_RE = re.compile(r'(\d+)\s*(?:个|条|篇|章|项|links?)', re.IGNORECASE)
+
+
 class IntentParser:
     """Parse user text into structured Intent objects."""
 
     def __init__(self, client: LLMClient) -> None:
         self.client = client
 
-    def parse(self, user_text: str) -> Intent:
-        prompt = INTENT_PROMPT_TEMPLATE.format(user_text=user_text)
-        messages: List[Dict[str, str]] = [{"role": "user", "content": prompt}]
-        data = self._call_model(messages)
+    def parse(self, user_text: str, force_llm: bool = False) -> Intent:
+        """Parse user_text; the LLM is skipped when heuristics are unambiguous unless ``force_llm``."""
         heuristics = self._heuristic_parse(user_text)
+        if not force_llm and self._is_unambiguous(heuristics):
+            return self._build_intent(user_text, {}, heuristics)
+        data = self._call_model(self._build_messages(user_text))
+        return self._build_intent(user_text, data, heuristics)
+
+    async def aparse(self, user_text: str, force_llm: bool = False) -> Intent:
+        heuristics = self._heuristic_parse(user_text)
+        if not force_llm and self._is_unambiguous(heuristics):
+            return self._build_intent(user_text, {}, heuristics)
+        data = await self._acall_model(self._build_messages(user_text))
+        return self._build_intent(user_text, data, heuristics)
+
+    @staticmethod
+    def _build_messages(user_text: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": INTENT_SYSTEM_PROMPT},
+            {"role": "user", "content": render_intent_input(user_text=user_text)},
+        ]
+
+    @staticmethod
+    def _is_unambiguous(heuristics: Dict[str, Any]) -> bool:
+        # A specific intent hint plus at least two field hints leaves little for the model to add.
+        fields = heuristics["requested_fields"] or []
+        return heuristics["intent_type"] != IntentType.EXTRACT_INFO and len(fields) >= 2
 
+    def _build_intent(self, user_text: str, data: Dict[str, Any], heuristics: Dict[str, Any]) -> Intent:
         model_intent = self._safe_intent_type(data.get("intent_type")) if data else None
         if model_intent and model_intent != IntentType.OTHER:
             intent_type = model_intent
@@ -63,21 +101,33 @@ class IntentParser:
 
     @staticmethod
     def _parse_limit(user_text: str) -> Optional[int]:
-        # Match "前10", "Top 10" (most specific and common for limits)
-        m = re.search(r'(?:前|top)\s*(\d+)', user_text, re.IGNORECASE)
+        m = _LIMIT_TOP_RE.search(user_text)
         if m:
             return int(m.group(1))
 
-        # Match "10个", "10条", "10章" etc.
-        m = re.search(r'(\d+)\s*(?:个|条|篇|章|项|links?)', user_text, re.IGNORECASE)
+        m = _LIMIT_COUNTER_RE.search(user_text)
         if m:
             return int(m.group(1))
-            
+
         return None
 
     def _call_model(self, messages: List[Dict[str, str]]) -> Dict[str, List[str] | str]:
         try:
             response = self.client.chat(messages)
+        except Exception:
+            return {}
+        return self._clean_response(response)
+
+    async def _acall_model(self, messages: List[Dict[str, str]]) -> Dict[str, List[str] | str]:
+        try:
+            response = await self.client.achat(messages)
+        except Exception:
+            return {}
+        return self._clean_response(response)
+
+    @staticmethod
+    def _clean_response(response: Dict[str, Any]) -> Dict[str, List[str] | str]:
+        try:
             payload = extract_json_payload(response.get("content", ""))
         except Exception:
             return {}
@@ -99,14 +149,14 @@ class IntentParser:
     def _heuristic_parse(self, user_text: str) -> Dict[str, Optional[List[str]] | IntentType]:
         lowered = user_text.lower()
         intent_type = IntentType.EXTRACT_INFO
-        for candidate, markers in _INTENT_HINTS.items():
-            if any(marker.lower() in lowered for marker in markers):
+        for candidate, markers in _INTENT_HINTS_LOWER.items():
+            if any(marker in lowered for marker in markers):
                 intent_type = candidate
                 break
 
         requested_fields: List[str] = []
-        for field, hints in _FIELD_HINTS.items():
-            if any(hint.lower() in lowered for hint in hints):
+        for field, hints in _FIELD_HINTS_LOWER.items():
+            if any(hint in lowered for hint in hints):
                 requested_fields.append(field)
 
         return {
@@ -119,7 +169,7 @@ class IntentParser:
         if not value:
             return IntentType.OTHER
         normalized = value.lower()
-        return IntentType(normalized) if normalized in IntentType._value2member_map_ else IntentType.OTHER
+        return IntentType._value2member_map_.get(normalized, IntentType.OTHER)
 
     @staticmethod
     def _merge_fields(model_fields: Optional[List[str]], heuristic_fields: Optional[List[str]]) -> Optional[List[str]]:
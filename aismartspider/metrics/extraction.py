@@ -6,6 +6,42 @@ def _string_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a, b).ratio()
 
 
+def _normalize_list_item(value: Any) -> str:
+    # Normalize URLs for comparison
+    s = str(value).strip()
+    if s.startswith("http://"):
+        s = s.replace("http://", "https://")
+    return s.rstrip("/")
+
+
+def _similar_at_least(a: str, b: str, threshold: float) -> bool:
+    """Same as ``_string_similarity(a, b) >= threshold``, rejecting via the cheap upper bounds first."""
+    matcher = SequenceMatcher(None, a, b)
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
+def _best_similarity(gold: str, candidates: List[Any]) -> float:
+    """Highest ``_string_similarity(gold, str(c))`` over candidates.
+
+    Pairs whose upper bound cannot beat the current best skip the full ratio().
+    """
+    best = 0.0
+    matcher = SequenceMatcher(None)
+    matcher.set_seq1(gold)
+    for candidate in candidates:
+        matcher.set_seq2(str(candidate))
+        if matcher.real_quick_ratio() <= best or matcher.quick_ratio() <= best:
+            continue
+        best = max(best, matcher.ratio())
+        if best == 1.0:
+            break
+    return best
+
+
 def compute_field_precision_recall(
     gold_fields: Dict[str, Any],
     pred_fields: Dict[str, Any],
@@ -24,30 +60,22 @@ def compute_field_precision_recall(
 
         # 1) list 类型字段
         if isinstance(gold_val, list):
-            # Normalize URLs for comparison
-            def normalize(s):
-                s = str(s).strip()
-                if s.startswith("http://"):
-                    s = s.replace("http://", "https://")
-                return s.rstrip("/")
-
-            gold_set = set(map(normalize, gold_val))
-            pred_set = set(map(normalize, pred_val or []))
+            gold_set = {_normalize_list_item(x) for x in gold_val}
+            pred_set = {_normalize_list_item(x) for x in pred_val or []}
 
             # Relaxed matching: if gold is a subset of pred, count as full match for gold items
             # This handles "Top 10" vs "Top 3" mismatch
-            inter = gold_set & pred_set
-            
+            matched = len(gold_set & pred_set)
+
             # If we found all gold items, treat extra pred items as valid (not FP)
             # ONLY if the task implies "Top N" and gold is just a sample
-            if gold_set and gold_set.issubset(pred_set):
+            if gold_set and matched == len(gold_set):
                 tp += len(pred_set) # All predicted are considered "correct" contextually
-                fp += 0
-                fn += 0
             else:
-                tp += len(inter)
-                fp += len(pred_set - inter)
-                fn += len(gold_set - inter)
+                # The differences are only counted, so derive their sizes instead of building them.
+                tp += matched
+                fp += len(pred_set) - matched
+                fn += len(gold_set) - matched
 
         # 2) 标量字符串
         elif isinstance(gold_val, str):
@@ -67,8 +95,7 @@ def compute_field_precision_recall(
                 if gold_str in pred_str or pred_str in gold_str:
                     tp += 1
                 else:
-                    sim = _string_similarity(gold_str, pred_str)
-                    if sim >= string_match_threshold:
+                    if _similar_at_least(gold_str, pred_str, string_match_threshold):
                         tp += 1
                     else:
                         fp += 1
@@ -82,8 +109,7 @@ def compute_field_precision_recall(
             if not pred_str:
                 fn += 1
             else:
-                sim = _string_similarity(gold_str, pred_str)
-                if sim >= string_match_threshold:
+                if _similar_at_least(gold_str, pred_str, string_match_threshold):
                     tp += 1
                 else:
                     fp += 1
@@ -132,12 +158,7 @@ def compute_fuzzy_similarity(
             # 对列表，取每个 gold 元素在 pred 中的最大相似度，然后平均
             if not gold_val:
                 continue
-            item_sims = []
-            for g in gold_val:
-                best = 0.0
-                for p in pred_val:
-                    best = max(best, _string_similarity(str(g), str(p)))
-                item_sims.append(best)
+            item_sims = [_best_similarity(str(g), pred_val) for g in gold_val]
             if item_sims:
                 sims.append(sum(item_sims) / len(item_sims))
 
@@ -1,3 +1,4 @@
+import operator
 from typing import List
 
 
@@ -5,5 +6,5 @@ def compute_page_type_accuracy(gold_types: List[str], pred_types: List[str]) ->
     if not gold_types:
         return 0.0
     assert len(gold_types) == len(pred_types)
-    correct = sum(int(g == p) for g, p in zip(gold_types, pred_types))
-    return correct / max(len(gold_types), 1)
+    correct = sum(map(operator.eq, gold_types, pred_types))
+    return correct / len(gold_types)
@@ -1,5 +1,6 @@
 from typing import List, Dict
 import math
+import operator
 
 
 def aggregate_timings(timings_list: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
@@ -15,10 +16,10 @@ def aggregate_timings(timings_list: List[Dict[str, float]]) -> Dict[str, Dict[st
     summary = {}
     for k, vals in buckets.items():
         n = len(vals)
-        if n == 0:
-            continue
-        mean = sum(vals) / max(n, 1)
-        var = sum((x - mean) ** 2 for x in vals) / max(n, 1)
+        mean = sum(vals) / n
+        # 两遍法求总体方差；差值平方交给 map/sum 在 C 层完成
+        deviations = [x - mean for x in vals]
+        var = sum(map(operator.mul, deviations, deviations)) / n
         std = math.sqrt(var)
         summary[k] = {
             "mean": mean,
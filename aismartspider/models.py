@@ -55,6 +55,8 @@ class Strategy:
     max_depth: int = 1
 
     pagination_selector: Optional[str] = None
+    # URL with a "{page}" placeholder for numbered pages; lets them be fetched in parallel.
+    pagination_template: Optional[str] = None
     max_pages: int = 1
     max_items: Optional[int] = None
 
@@ -3,65 +3,95 @@
 from __future__ import annotations
 
 import csv
-import json
+import re
 import sqlite3
 from abc import ABC, abstractmethod
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .utils.json_utils import dumps
+
+_CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
 
 
 class ResultWriter(ABC):
     """Base interface for output adapters."""
 
     @abstractmethod
-    def write(self, records: List[Dict[str, Any]]) -> None:
-        """Persist records to desired sink."""
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Persist records to desired sink.
+
+        ``records`` may be any iterable, including a generator; text and JSON
+        files are written as it is consumed.
+        """
+
+    def close(self) -> None:
+        """Release anything kept open between writes; most writers hold nothing."""
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
 
 # --------------------------------------------------------------------------- #
 # File-based writers
 # --------------------------------------------------------------------------- #
 class PrintWriter(ResultWriter):
-    def write(self, records: List[Dict[str, Any]]) -> None:
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
         from pprint import pprint
 
-        pprint(records)
+        pprint(records if isinstance(records, list) else list(records))
 
 
 class TxtWriter(ResultWriter):
     def __init__(self, path: str = "output.txt") -> None:
         self.path = Path(path)
 
-    def write(self, records: List[Dict[str, Any]]) -> None:
-        with self.path.open("w", encoding="utf-8") as handle:
-            for record in records:
-                handle.write(json.dumps(record, ensure_ascii=False))
-                handle.write("\n")
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        with self.path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+            handle.writelines(dumps(record) + "\n" for record in records)
 
 
 class JsonWriter(ResultWriter):
     def __init__(self, path: str = "output.json") -> None:
         self.path = Path(path)
 
-    def write(self, records: List[Dict[str, Any]]) -> None:
-        with self.path.open("w", encoding="utf-8") as handle:
-            json.dump(records, handle, ensure_ascii=False, indent=2)
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        # Records are encoded one at a time, so only a single record's text is held
+        # in memory; the layout matches json.dump(records, indent=2).
+        with self.path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+            separator = "[\n  "
+            for record in records:
+                handle.write(separator)
+                handle.write(dumps(record, indent=True).replace("\n", "\n  "))
+                separator = ",\n  "
+            handle.write("[]" if separator == "[\n  " else "\n]")
 
 
 class CsvWriter(ResultWriter):
     def __init__(self, path: str = "output.csv") -> None:
         self.path = Path(path)
 
-    def write(self, records: List[Dict[str, Any]]) -> None:
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        # The header needs every column, so an iterator is read to the end first.
+        records = _as_sequence(records)
         if not records:
             return
         columns = _collect_columns(records)
-        with self.path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=columns)
-            writer.writeheader()
-            for record in records:
-                normalized = _normalize_record(record, columns)
-                writer.writerow(normalized)
+        with self.path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            rows = _normalize_rows(records, columns)
+            if len(columns) == 1:
+                # csv quotes a lone empty field so the row is not read back as blank.
+                writer.writerows(rows)
+                return
+            # Same output as csv.writer's default dialect, with only the fields
+            # that contain a delimiter, quote or line break going through quoting.
+            handle.writelines(",".join(map(_csv_field, row)) + "\r\n" for row in rows)
 
 
 # --------------------------------------------------------------------------- #
@@ -72,42 +102,79 @@ class SQLWriter(ResultWriter, ABC):
 
     placeholder = "?"
     column_type = "TEXT"
+    # Rows queued by append() before they are written in one transaction.
+    append_batch_size = 10_000
 
     def __init__(self, table: str = "records") -> None:
         self.table = table
+        self._pending: List[Dict[str, Any]] = []
 
-    def write(self, records: List[Dict[str, Any]]) -> None:
+    def append(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Queue records from a per-page caller; they are written in large batches.
+
+        Queued rows reach the database once ``append_batch_size`` accumulate, or on
+        flush()/close().
+        """
+        self._pending.extend(records)
+        if len(self._pending) >= self.append_batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self.write(pending)
+
+    def close(self) -> None:
+        self.flush()
+
+    def write(self, records: Iterable[Dict[str, Any]]) -> None:
+        records = _as_sequence(records)
         if not records:
             return
 
         columns = _collect_columns(records)
-        normalized_rows = [_normalize_row_for_db(record, columns) for record in records]
         column_definitions = ", ".join(f"{self._quote_identifier(col)} {self.column_type}" for col in columns)
         column_list = ", ".join(self._quote_identifier(col) for col in columns)
-        placeholders = ", ".join(self.placeholder for _ in columns)
 
         connection = self._connect()
+        cursor = None
         try:
             cursor = connection.cursor()
             cursor.execute(
                 f"CREATE TABLE IF NOT EXISTS {self._quote_identifier(self.table)} ({column_definitions})"
             )
-            cursor.executemany(
-                f"INSERT INTO {self._quote_identifier(self.table)} ({column_list}) VALUES ({placeholders})",
-                normalized_rows,
+            # Rows are normalized lazily as the driver consumes them.
+            self._insert_rows(
+                cursor,
+                f"INSERT INTO {self._quote_identifier(self.table)} ({column_list})",
+                len(columns),
+                _normalize_rows(records, columns),
             )
             connection.commit()
+        except BaseException:
+            # A kept-open connection must not carry the failed transaction into the next write.
+            connection.rollback()
+            raise
         finally:
-            try:
-                cursor.close()  # type: ignore[has-type]
-            except Exception:
-                pass
-            connection.close()
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            self._release(connection)
+
+    def _insert_rows(self, cursor, insert_prefix: str, column_count: int, rows: Iterable[List[str]]) -> None:
+        """Insert all rows inside the open transaction; committed by ``write``."""
+        placeholders = ", ".join([self.placeholder] * column_count)
+        cursor.executemany(f"{insert_prefix} VALUES ({placeholders})", rows)
 
     @abstractmethod
     def _connect(self):
         raise NotImplementedError
 
+    def _release(self, connection) -> None:
+        """Called after every write; servers get a fresh connection per write."""
+        connection.close()
+
     @abstractmethod
     def _quote_identifier(self, identifier: str) -> str:
         raise NotImplementedError
@@ -117,9 +184,29 @@ class SQLiteWriter(SQLWriter):
     def __init__(self, db_path: str = "data.db", table: str = "records") -> None:
         super().__init__(table=table)
         self.db_path = db_path
+        # Kept open across writes so repeated appends skip connection setup and
+        # reuse a warm page cache; released by close().
+        self._connection: Optional[sqlite3.Connection] = None
 
     def _connect(self):
-        return sqlite3.connect(self.db_path)
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL lets the bulk insert append to the log instead of journaling every
+            # page it overwrites, and with WAL synchronous=NORMAL is still crash-safe
+            # (it only defers the fsync to checkpoints).
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection = connection
+        return self._connection
+
+    def _release(self, connection) -> None:
+        pass
+
+    def close(self) -> None:
+        super().close()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
 
     def _quote_identifier(self, identifier: str) -> str:
         safe = identifier.replace('"', '""')
@@ -170,6 +257,8 @@ class MySQLWriter(SQLWriter):
 class PostgresWriter(SQLWriter):
     placeholder = "%s"
     column_type = "TEXT"
+    # Rows per multi-row INSERT statement.
+    batch_size = 500
 
     def __init__(
         self,
@@ -201,6 +290,13 @@ class PostgresWriter(SQLWriter):
             dbname=self.database,
         )
 
+    def _insert_rows(self, cursor, insert_prefix: str, column_count: int, rows: Iterable[List[str]]) -> None:
+        # psycopg2's executemany() issues one statement per row; execute_values
+        # folds each page of rows into a single multi-row VALUES list.
+        from psycopg2.extras import execute_values
+
+        execute_values(cursor, f"{insert_prefix} VALUES %s", rows, page_size=self.batch_size)
+
     def _quote_identifier(self, identifier: str) -> str:
         safe = identifier.replace('"', '""')
         return f'"{safe}"'
@@ -209,32 +305,41 @@ class PostgresWriter(SQLWriter):
 # --------------------------------------------------------------------------- #
 # Helper utilities
 # --------------------------------------------------------------------------- #
-def _collect_columns(records: List[Dict[str, Any]]) -> List[str]:
-    columns: List[str] = []
-    seen: set[str] = set()
-    for record in records:
-        for key in record.keys():
-            if key not in seen:
-                columns.append(key)
-                seen.add(key)
-    return columns
+def _as_sequence(records: Iterable[Dict[str, Any]]) -> Sequence[Dict[str, Any]]:
+    # Column discovery needs a second pass over the records.
+    return records if isinstance(records, (list, tuple)) else list(records)
 
 
-def _normalize_record(record: Dict[str, Any], columns: Sequence[str]) -> Dict[str, str]:
-    normalized: Dict[str, str] = {}
-    for column in columns:
-        normalized[column] = _normalize_cell(record.get(column))
-    return normalized
+def _collect_columns(records: Sequence[Dict[str, Any]]) -> List[str]:
+    # Chaining the records yields their keys; dict.fromkeys keeps first-seen order.
+    return list(dict.fromkeys(chain.from_iterable(records)))
 
 
-def _normalize_row_for_db(record: Dict[str, Any], columns: Sequence[str]) -> List[str]:
-    normalized = _normalize_record(record, columns)
-    return [normalized[col] for col in columns]
+def _csv_field(value: str) -> str:
+    if _CSV_SPECIAL_RE.search(value) is None:
+        return value
+    return '"' + value.replace('"', '""') + '"'
 
 
-def _normalize_cell(value: Any) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, (str, int, float)):
-        return str(value)
-    return json.dumps(value, ensure_ascii=False)
+def _normalize_rows(records: Iterable[Dict[str, Any]], columns: Sequence[str]) -> Iterator[List[str]]:
+    # Scraped records often share the same list/dict object (e.g. a tag list),
+    # so nested values are encoded once per write. Keying by id() is safe
+    # because the records keep every value alive until the write finishes.
+    encoded: Dict[int, str] = {}
+    scalar_types = (str, int, float)
+    for record in records:
+        get = record.get
+        row: List[str] = []
+        append = row.append
+        for column in columns:
+            value = get(column)
+            if value is None:
+                append("")
+            elif isinstance(value, scalar_types):
+                append(str(value))
+            else:
+                text = encoded.get(id(value))
+                if text is None:
+                    text = encoded[id(value)] = dumps(value)
+                append(text)
+        yield row
@@ -2,24 +2,95 @@
 
 from __future__ import annotations
 
-from typing import List, Dict
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional
 
 from .ai_client import LLMClient
-from .ai_prompts import PAGE_TYPE_PROMPT_TEMPLATE
+from .ai_prompts import PAGE_TYPE_SYSTEM_PROMPT, render_page_type_input
 from .models import PageTypingResult, PageType
 from .utils.json_utils import extract_json_payload, ensure_string_list
 
+# Lower-cased model answers mapped straight to members; aliases take precedence
+# over a same-named value (the model's "profile" is treated as a news page).
+_PAGE_TYPE_ALIASES = {
+    "detail": "news",
+    "profile": "news",
+    "thread": "forum",
+}
+_PAGE_TYPE_LOOKUP: Dict[str, PageType] = {member.value: member for member in PageType}
+_PAGE_TYPE_LOOKUP.update({alias: PageType(target) for alias, target in _PAGE_TYPE_ALIASES.items()})
+
 
 class PageTypeClassifier:
     """Classify DOM summaries into PageType values via LLM prompts."""
 
-    def __init__(self, client: LLMClient) -> None:
+    def __init__(self, client: LLMClient, cache_size: int = 1024) -> None:
         self.client = client
+        self.cache_size = cache_size
+        # Pages of one site template share a DOM summary, so their typing is reused
+        # instead of asking the model again; keyed by a digest of the prompt.
+        self._cache: "OrderedDict[bytes, PageTypingResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def classify(self, dom_summary: str) -> PageTypingResult:
-        prompt = PAGE_TYPE_PROMPT_TEMPLATE.format(dom_summary=dom_summary)
-        messages: List[Dict[str, str]] = [{"role": "user", "content": prompt}]
-        response = self.client.chat(messages)
+        messages = self._build_messages(dom_summary)
+        key = self._cache_key(messages)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        result = self._parse_response(self.client.chat(messages))
+        self._cache_store(key, result)
+        return result
+
+    async def aclassify(self, dom_summary: str) -> PageTypingResult:
+        messages = self._build_messages(dom_summary)
+        key = self._cache_key(messages)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        result = self._parse_response(await self.client.achat(messages))
+        self._cache_store(key, result)
+        return result
+
+    def cache_clear(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _build_messages(dom_summary: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": PAGE_TYPE_SYSTEM_PROMPT},
+            {"role": "user", "content": render_page_type_input(dom_summary=dom_summary)},
+        ]
+
+    def _cache_key(self, messages: List[Dict[str, str]]) -> Optional[bytes]:
+        if self.cache_size <= 0:
+            return None
+        return hashlib.blake2b(messages[-1]["content"].encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _cache_lookup(self, key: Optional[bytes]) -> Optional[PageTypingResult]:
+        if key is None:
+            return None
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+        return _copy_result(result)
+
+    def _cache_store(self, key: Optional[bytes], result: PageTypingResult) -> None:
+        # "unknown" is also what an unparseable reply becomes; leave those to be asked again.
+        if key is None or result.page_type == PageType.UNKNOWN:
+            return
+        with self._cache_lock:
+            self._cache[key] = _copy_result(result)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _parse_response(self, response: Dict[str, Any]) -> PageTypingResult:
         content = response.get("content", "").strip()
 
         data = extract_json_payload(content)
@@ -36,14 +107,7 @@ class PageTypeClassifier:
     def _safe_page_type(value: str | None) -> PageType:
         if not value:
             return PageType.UNKNOWN
-        normalized = value.lower()
-        aliases = {
-            "detail": "news",
-            "profile": "news",
-            "thread": "forum",
-        }
-        normalized = aliases.get(normalized, normalized)
-        return PageType(normalized) if normalized in PageType._value2member_map_ else PageType.UNKNOWN
+        return _PAGE_TYPE_LOOKUP.get(value.lower(), PageType.UNKNOWN)
 
     @staticmethod
     def _safe_confidence(value: object) -> float:
@@ -56,3 +120,8 @@ class PageTypeClassifier:
         if confidence > 1.0:
             return 1.0
         return confidence
+
+
+def _copy_result(result: PageTypingResult) -> PageTypingResult:
+    fields = result.suggested_fields
+    return dataclasses.replace(result, suggested_fields=list(fields) if fields is not None else None)
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from .ai_client import LLMClient
-from .ai_prompts import STRATEGY_PROMPT_TEMPLATE, FIRST_IMAGE_PROMPT_TEMPLATE
+from .ai_prompts import (
+    STRATEGY_SYSTEM_PROMPT,
+    render_strategy_input,
+    FIRST_IMAGE_SYSTEM_PROMPT,
+    render_first_image_input,
+)
 from .models import Intent, PageType, PageTypingResult, Strategy
-from .utils.json_utils import extract_json_payload, ensure_mapping
+from .utils.json_utils import extract_json_payload, ensure_mapping, loads
 
 _DEFAULT_FIELD_SELECTORS: Dict[str, str] = {
     "title": "article h1, h1, h2, .title",
@@ -24,6 +33,17 @@ _DEFAULT_FIELD_SELECTORS: Dict[str, str] = {
     "answer": ".answer, .post-content, article",
 }
 
+# (selector, method) per default field, resolved once instead of per requested field.
+_DEFAULT_FIELD_RULES: Dict[str, Tuple[str, str]] = {
+    field: (selector, "attr:href" if field == "links" else "css")
+    for field, selector in _DEFAULT_FIELD_SELECTORS.items()
+    if selector
+}
+
+_LIST_ITEM_LINK_SELECTOR = ".list a, .post a, a"
+_LIST_PAGINATION_SELECTOR = ".pagination a.next, a.next, a[rel='next']"
+_GALLERY_IMAGE_SELECTOR = ".gallery img, img"
+
 _FALLBACK_FIELD_SELECTORS: Dict[str, str] = {
     "title": "meta[property='og:title'], meta[name='title'], title",
     "content": "meta[property='og:description'], .article-content",
@@ -41,32 +61,104 @@ _PRIMARY_IMAGE_FIELD_MARKERS = {
 }
 
 _SELECTOR_INVALID = object()
+# The hero-image answer must be one deterministic JSON object.
+_PRIMARY_IMAGE_CHAT_KWARGS: Dict[str, Any] = {
+    "temperature": 0,
+    "top_p": 1,
+    "response_format": {"type": "json_object"},
+}
 
 
 class StrategyBuilder:
     """Use AI to synthesize a Strategy object."""
 
-    def __init__(self, client: LLMClient) -> None:
+    def __init__(self, client: LLMClient, cache_size: int = 256) -> None:
         self.client = client
+        self.cache_size = cache_size
+        # Pages built from one template yield identical prompts; their cleaned model
+        # answers are kept, keyed by a digest of the prompt rather than the prompt itself.
+        self._cache: "OrderedDict[Tuple[str, bytes], Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def cache_clear(self) -> None:
+        """Forget memoized model answers, e.g. in long-running workers."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def build(self, typing: PageTypingResult, intent: Intent, dom_summary: str) -> Strategy:
         primary_image_field = self._detect_primary_image_field(intent.requested_fields)
-        prompt = STRATEGY_PROMPT_TEMPLATE.format(
+        prompt, messages = self._strategy_messages(typing, intent, dom_summary)
+        model_data = self._memoized("strategy", prompt, lambda: self._call_model(messages), valid=bool)
+        primary_image_selector: Any = None
+        if primary_image_field:
+            primary_image_selector = self._build_primary_image_selector(
+                typing,
+                intent,
+                dom_summary,
+                primary_image_field,
+            )
+        return self._assemble(typing, intent, dom_summary, model_data, primary_image_field, primary_image_selector)
+
+    async def abuild(self, typing: PageTypingResult, intent: Intent, dom_summary: str) -> Strategy:
+        """Async variant of :meth:`build`; the strategy and hero-image requests run concurrently."""
+        primary_image_field = self._detect_primary_image_field(intent.requested_fields)
+        prompt, messages = self._strategy_messages(typing, intent, dom_summary)
+        model_request = self._amemoized("strategy", prompt, lambda: self._acall_model(messages), valid=bool)
+        if primary_image_field:
+            model_data, primary_image_selector = await asyncio.gather(
+                model_request,
+                self._abuild_primary_image_selector(typing, intent, dom_summary, primary_image_field),
+            )
+        else:
+            model_data, primary_image_selector = await model_request, None
+        return self._assemble(typing, intent, dom_summary, model_data, primary_image_field, primary_image_selector)
+
+    async def abuild_many(
+        self,
+        jobs: Sequence[Tuple[PageTypingResult, Intent, str]],
+        max_concurrency: int = 8,
+    ) -> List[Strategy]:
+        """Build strategies for several pages concurrently, preserving input order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(typing: PageTypingResult, intent: Intent, dom_summary: str) -> Strategy:
+            async with semaphore:
+                return await self.abuild(typing, intent, dom_summary)
+
+        return list(await asyncio.gather(*(_run(*job) for job in jobs)))
+
+    @staticmethod
+    def _strategy_messages(
+        typing: PageTypingResult, intent: Intent, dom_summary: str
+    ) -> Tuple[str, List[Dict[str, str]]]:
+        prompt = render_strategy_input(
             page_type=typing.page_type.value,
             intent_type=intent.intent_type.value,
             requested_fields=intent.requested_fields or [],
             dom_summary=dom_summary,
         )
-        messages: List[Dict[str, str]] = [{"role": "user", "content": prompt}]
-        model_data = self._call_model(messages)
+        messages: List[Dict[str, str]] = [
+            {"role": "system", "content": STRATEGY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+        return prompt, messages
+
+    def _assemble(
+        self,
+        typing: PageTypingResult,
+        intent: Intent,
+        dom_summary: str,
+        model_data: Dict[str, Any],
+        primary_image_field: Optional[str],
+        primary_image_selector: Any,
+    ) -> Strategy:
         heuristic_data = self._heuristic_strategy(typing, intent, dom_summary)
         data = self._merge_strategy_dicts(heuristic_data, model_data)
-        primary_image_selector: Optional[str] = None
 
         if intent.requested_fields:
-            allowed = set(intent.requested_fields)
-            data["field_selectors"] = {k: v for k, v in data.get("field_selectors", {}).items() if k in allowed}
-            data["field_methods"] = {k: v for k, v in data.get("field_methods", {}).items() if k in allowed}
+            allowed = frozenset(intent.requested_fields)
+            data["field_selectors"] = self._restrict_keys(data.get("field_selectors", {}), allowed)
+            data["field_methods"] = self._restrict_keys(data.get("field_methods", {}), allowed)
 
         if primary_image_field:
             # Remove direct extraction of the image field from AI/heuristics results
@@ -74,12 +166,6 @@ class StrategyBuilder:
             data.get("field_methods", {}).pop(primary_image_field, None)
             if "field_limits" in data and isinstance(data["field_limits"], dict):
                 data["field_limits"].pop(primary_image_field, None)
-            primary_image_selector = self._build_primary_image_selector(
-                typing,
-                intent,
-                dom_summary,
-                primary_image_field,
-            )
             if primary_image_selector is _SELECTOR_INVALID:
                 primary_image_selector = self._fallback_primary_image_selector()
 
@@ -92,6 +178,7 @@ class StrategyBuilder:
             item_link_selector=data.get("item_link_selector"),
             max_depth=data.get("max_depth", 1),
             pagination_selector=data.get("pagination_selector"),
+            pagination_template=data.get("pagination_template"),
             max_pages=data.get("max_pages", 1),
             max_items=intent.max_items,
             image_selector=data.get("image_selector"),
@@ -107,9 +194,72 @@ class StrategyBuilder:
             
         return strategy
 
+    def _memoized(self, kind: str, prompt: str, compute: Callable[[], Any], valid: Callable[[Any], bool]) -> Any:
+        """Return compute() for this prompt, reusing an earlier answer that passed ``valid``."""
+        key = self._cache_key(kind, prompt)
+        if key is None:
+            return compute()
+        hit, value = self._cache_lookup(key)
+        if hit:
+            return value
+        value = compute()
+        self._cache_store(key, value, valid)
+        return value
+
+    async def _amemoized(
+        self,
+        kind: str,
+        prompt: str,
+        compute: Callable[[], Awaitable[Any]],
+        valid: Callable[[Any], bool],
+    ) -> Any:
+        key = self._cache_key(kind, prompt)
+        if key is None:
+            return await compute()
+        hit, value = self._cache_lookup(key)
+        if hit:
+            return value
+        value = await compute()
+        self._cache_store(key, value, valid)
+        return value
+
+    def _cache_key(self, kind: str, prompt: str) -> Optional[Tuple[str, bytes]]:
+        if self.cache_size <= 0:
+            return None
+        return (kind, hashlib.blake2b(prompt.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+
+    def _cache_lookup(self, key: Tuple[str, bytes]) -> Tuple[bool, Any]:
+        with self._cache_lock:
+            if key not in self._cache:
+                return False, None
+            self._cache.move_to_end(key)
+            return True, copy.deepcopy(self._cache[key])
+
+    def _cache_store(self, key: Tuple[str, bytes], value: Any, valid: Callable[[Any], bool]) -> None:
+        # Failed calls are not remembered, so the next page gets a fresh attempt.
+        if not valid(value):
+            return
+        with self._cache_lock:
+            self._cache[key] = copy.deepcopy(value)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     def _call_model(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
         try:
             response = self.client.chat(messages)
+        except Exception:
+            return {}
+        return self._clean_model_response(response)
+
+    async def _acall_model(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        try:
+            response = await self.client.achat(messages)
+        except Exception:
+            return {}
+        return self._clean_model_response(response)
+
+    def _clean_model_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        try:
             payload = extract_json_payload(response.get("content", ""))
         except Exception:
             return {}
@@ -132,6 +282,10 @@ class StrategyBuilder:
             if key in payload and isinstance(payload.get(key), str):
                 cleaned[key] = payload[key].strip() or None
 
+        template = payload.get("pagination_template")
+        if isinstance(template, str) and "{page}" in template:
+            cleaned["pagination_template"] = template.strip()
+
         if "is_list" in payload:
             cleaned["is_list"] = self._as_bool(payload.get("is_list"))
         if "max_depth" in payload:
@@ -150,18 +304,17 @@ class StrategyBuilder:
 
         requested_fields = intent.requested_fields or typing.suggested_fields or ["title", "content"]
         for field in requested_fields:
-            selector = _DEFAULT_FIELD_SELECTORS.get(field, "")
-            if selector:
-                selectors[field] = selector
-                field_methods[field] = "attr:href" if field == "links" else "css"
+            rule = _DEFAULT_FIELD_RULES.get(field)
+            if rule is not None:
+                selectors[field], field_methods[field] = rule
 
         tag_counts = self._extract_tag_counts(dom_summary)
         is_list = typing.page_type == PageType.LIST or tag_counts.get("li", 0) > 10
         is_gallery = typing.page_type == PageType.GALLERY or tag_counts.get("img", 0) > 5
 
         wants_links = "links" in requested_fields
-        item_link_selector = None if wants_links else (".list a, .post a, a" if is_list else None)
-        pagination_selector = ".pagination a.next, a.next, a[rel='next']" if is_list else None
+        item_link_selector = _LIST_ITEM_LINK_SELECTOR if is_list and not wants_links else None
+        pagination_selector = _LIST_PAGINATION_SELECTOR if is_list else None
 
         heuristics = {
             "field_selectors": selectors,
@@ -171,15 +324,19 @@ class StrategyBuilder:
             "pagination_selector": pagination_selector,
             "max_pages": 3,
             "max_depth": 2 if is_list else 1,
-            "image_selector": ".gallery img, img" if is_gallery else None,
+            "image_selector": _GALLERY_IMAGE_SELECTOR if is_gallery else None,
             "fallbacks": {"field_selectors": _FALLBACK_FIELD_SELECTORS},
         }
         return heuristics
 
     @staticmethod
     def _extract_tag_counts(dom_summary: str) -> Dict[str, int]:
+        # A DomSummary already carries the counts; plain strings are parsed.
+        tag_counts = getattr(dom_summary, "tag_counts", None)
+        if tag_counts is not None:
+            return tag_counts
         try:
-            summary = json.loads(dom_summary)
+            summary = loads(dom_summary)
             return summary.get("tag_counts", {}) or {}
         except Exception:
             return {}
@@ -188,14 +345,21 @@ class StrategyBuilder:
     def _merge_strategy_dicts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         if not override:
             return base
-        merged: Dict[str, Any] = dict(base)
+        merged: Dict[str, Any] = base | override
+        # Only nested dicts need a second level of merging; everything else is already overridden.
         for key, value in override.items():
             if isinstance(value, dict):
-                merged[key] = {**base.get(key, {}), **value}
-            else:
-                merged[key] = value
+                merged[key] = base.get(key, {}) | value
         return merged
 
+    @staticmethod
+    def _restrict_keys(mapping: Dict[str, Any], allowed: FrozenSet[str]) -> Dict[str, Any]:
+        # Usually every key is already allowed (the heuristics start from the requested
+        # fields); the subset test runs in C and skips rebuilding the dict in that case.
+        if allowed.issuperset(mapping):
+            return mapping
+        return {key: value for key, value in mapping.items() if key in allowed}
+
     @staticmethod
     def _ensure_int_mapping(value: Any) -> Dict[str, int]:
         if not isinstance(value, dict):
@@ -249,25 +413,64 @@ class StrategyBuilder:
         field_name: str,
         retries: int = 3,
     ) -> Any:
-        prompt = FIRST_IMAGE_PROMPT_TEMPLATE.format(
+        prompt, messages = self._primary_image_messages(typing, intent, dom_summary, field_name)
+        return self._memoized(
+            "first_image",
+            prompt,
+            lambda: self._request_primary_image_selector(messages, retries),
+            valid=lambda selector: selector is not _SELECTOR_INVALID,
+        )
+
+    async def _abuild_primary_image_selector(
+        self,
+        typing: PageTypingResult,
+        intent: Intent,
+        dom_summary: str,
+        field_name: str,
+        retries: int = 3,
+    ) -> Any:
+        prompt, messages = self._primary_image_messages(typing, intent, dom_summary, field_name)
+        return await self._amemoized(
+            "first_image",
+            prompt,
+            lambda: self._arequest_primary_image_selector(messages, retries),
+            valid=lambda selector: selector is not _SELECTOR_INVALID,
+        )
+
+    @staticmethod
+    def _primary_image_messages(
+        typing: PageTypingResult, intent: Intent, dom_summary: str, field_name: str
+    ) -> Tuple[str, List[Dict[str, str]]]:
+        prompt = render_first_image_input(
             page_type=typing.page_type.value,
             task=intent.raw_text,
             field_name=field_name,
             dom_summary=dom_summary,
         )
-        messages = [{"role": "user", "content": prompt}]
+        messages = [
+            {"role": "system", "content": FIRST_IMAGE_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+        return prompt, messages
+
+    def _request_primary_image_selector(self, messages: List[Dict[str, str]], retries: int) -> Any:
         for _ in range(retries):
             try:
-                response = self.client.chat(
-                    messages,
-                    temperature=0,
-                    top_p=1,
-                    response_format={"type": "json_object"},
-                )
+                response = self.client.chat(messages, **_PRIMARY_IMAGE_CHAT_KWARGS)
             except Exception:
                 continue
-            payload = extract_json_payload(response.get("content", ""))
-            parsed = self._parse_primary_image_payload(payload)
+            parsed = self._parse_primary_image_payload(extract_json_payload(response.get("content", "")))
+            if parsed is not _SELECTOR_INVALID:
+                return parsed
+        return _SELECTOR_INVALID
+
+    async def _arequest_primary_image_selector(self, messages: List[Dict[str, str]], retries: int) -> Any:
+        for _ in range(retries):
+            try:
+                response = await self.client.achat(messages, **_PRIMARY_IMAGE_CHAT_KWARGS)
+            except Exception:
+                continue
+            parsed = self._parse_primary_image_payload(extract_json_payload(response.get("content", "")))
             if parsed is not _SELECTOR_INVALID:
                 return parsed
         return _SELECTOR_INVALID
@@ -0,0 +1,31 @@
+"""Shared lxml parsing for the summarizer and the executor."""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from lxml import etree
+
+# lxml parser objects must not be shared between threads.
+_PARSERS = threading.local()
+
+
+def parse_html(html: str) -> Optional[etree._Element]:
+    """Parse HTML into an lxml tree, or None when there is nothing to parse.
+
+    Nothing here looks elements up by id, so the parser skips building the
+    id index. Comments are kept: dropping them would merge the text on
+    either side into one node and change extracted strings.
+    """
+    parser = getattr(_PARSERS, "str_parser", None)
+    if parser is None:
+        parser = _PARSERS.str_parser = etree.HTMLParser(collect_ids=False)
+    try:
+        return etree.HTML(html, parser)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration.
+        parser = getattr(_PARSERS, "bytes_parser", None)
+        if parser is None:
+            parser = _PARSERS.bytes_parser = etree.HTMLParser(collect_ids=False, encoding="utf-8")
+        return etree.HTML(html.encode("utf-8"), parser)
@@ -3,12 +3,40 @@
 from __future__ import annotations
 
 import json
-import re
 from typing import Any, Dict, List
 
-_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL | re.IGNORECASE)
-_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
-_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, see the "fastjson" extra
+    orjson = None
+
+_CODE_FENCE = "```"
+# json.dumps only reuses its shared encoder for all-default arguments; with
+# ensure_ascii=False it would build a new JSONEncoder on every call.
+_encode_nested = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def dumps(value: Any, indent: bool = False) -> str:
+    """Serialize value to JSON text, using orjson when it is installed.
+
+    Output is compact unless ``indent`` is set, which matches ``json.dumps(indent=2)``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else None).decode("utf-8")
+        except TypeError:
+            # orjson rejects non-str keys and oversized ints; let the stdlib handle those.
+            pass
+    if indent:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(raw: str | bytes) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def extract_json_payload(raw: str) -> Any:
@@ -17,29 +45,87 @@ def extract_json_payload(raw: str) -> Any:
     if not content:
         return {}
 
-    fenced = _CODE_FENCE_RE.match(content)
-    if fenced:
-        content = fenced.group(1).strip()
+    content = _strip_code_fence(content)
 
     for candidate in (content, _scan_candidate(content)):
         if not candidate:
             continue
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
+            return loads(candidate)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
             continue
     return {}
 
 
+def _strip_code_fence(content: str) -> str:
+    """Unwrap a reply that is entirely one ```/```json fenced block."""
+    if len(content) < 2 * len(_CODE_FENCE) or not (
+        content.startswith(_CODE_FENCE) and content.endswith(_CODE_FENCE)
+    ):
+        return content
+    inner = content[len(_CODE_FENCE) : -len(_CODE_FENCE)]
+    if inner[:4].lower() == "json":
+        inner = inner[4:]
+    return inner.strip()
+
+
 def _scan_candidate(content: str) -> str:
-    """Scan for the first JSON object/array inside free-form text."""
-    for regex in (_JSON_OBJECT_RE, _JSON_ARRAY_RE):
-        match = regex.search(content)
-        if match:
-            return match.group(0)
+    """Span from the first opening brace/bracket to the last matching closer.
+
+    Plain find/rfind give the same span as a greedy DOTALL regex, without the regex engine.
+    """
+    for opener, closer in ("{}", "[]"):
+        start = content.find(opener)
+        if start != -1:
+            end = content.rfind(closer)
+            if end > start:
+                return content[start : end + 1]
     return ""
 
 
+class JsonStreamScanner:
+    """Incrementally detect when the first JSON object in a stream is complete.
+
+    Brackets in any prose before the first ``{`` are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.started = False
+        self.complete = False
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume chunk and return True once the outermost value has been closed."""
+        if self.complete:
+            return True
+        for char in chunk:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if not self.started:
+                if char == "{":
+                    self.started = True
+                    self.depth = 1
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self.depth += 1
+            elif char in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    self.complete = True
+                    return True
+        return False
+
+
 def ensure_string_list(value: Any) -> List[str]:
     """Return a sanitized string list."""
     if not isinstance(value, list):
@@ -64,7 +150,7 @@ def ensure_mapping(value: Any) -> Dict[str, str]:
         if isinstance(val, (str, int, float)):
             clean[key] = str(val).strip()
         elif isinstance(val, dict) or isinstance(val, list):
-            clean[key] = json.dumps(val, ensure_ascii=False)
+            clean[key] = _encode_nested(val)
         else:
             continue
     return clean
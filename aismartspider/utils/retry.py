@@ -2,26 +2,56 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
 import time
-from typing import Callable, TypeVar
+from typing import Awaitable, Callable, Optional, TypeVar
 
 T = TypeVar("T")
 
 
 class RetryPolicy:
-    """Simple exponential backoff retry wrapper."""
+    """Exponential backoff retry wrapper with jitter.
 
-    def __init__(self, max_retries: int = 3, backoff: float = 1.5) -> None:
+    Each wait is spread over 50-150% of its nominal value so that workers which
+    failed together (e.g. on a rate limit) do not all retry at the same instant.
+    ``deadline`` is a ``time.monotonic()`` timestamp: when the next wait would
+    run past it, the last error is raised instead of sleeping.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff: float = 1.5, jitter: bool = True) -> None:
         self.max_retries = max_retries
         self.backoff = backoff
+        self.jitter = jitter
 
-    def run(self, func: Callable[[], T]) -> T:
-        delay = 1.0
+    def run(self, func: Callable[[], T], deadline: Optional[float] = None) -> T:
         for attempt in range(self.max_retries):
             try:
                 return func()
             except Exception:
-                if attempt == self.max_retries - 1:
+                delay = self._next_delay(attempt, deadline)
+                if delay is None:
                     raise
                 time.sleep(delay)
-                delay *= self.backoff
+
+    async def arun(self, func: Callable[[], Awaitable[T]], deadline: Optional[float] = None) -> T:
+        """Async variant of :meth:`run`; backs off without blocking the event loop."""
+        for attempt in range(self.max_retries):
+            try:
+                return await func()
+            except Exception:
+                delay = self._next_delay(attempt, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+    def _next_delay(self, attempt: int, deadline: Optional[float]) -> Optional[float]:
+        """Seconds to wait after a failed attempt, or None when no retry should follow."""
+        if attempt >= self.max_retries - 1:
+            return None
+        delay = self.backoff ** attempt
+        if self.jitter:
+            delay *= 0.5 + random.random()
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
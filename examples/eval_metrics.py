@@ -1,5 +1,5 @@
-import json
 from collections import defaultdict
+from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
 from aismartspider.metrics.extraction import (
@@ -8,22 +8,19 @@ from aismartspider.metrics.extraction import (
 )
 from aismartspider.metrics.page_understanding import compute_page_type_accuracy
 from aismartspider.metrics.system_metrics import aggregate_timings
+from aismartspider.utils.json_utils import loads
 
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Bytes go straight to the parser (orjson when installed) without a separate decode pass.
+    return loads(Path(path).read_bytes())
 
 
 def index_gold_by_key(gold_runs: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
     """
     以 (site, url) 作为 key，把 gold 结果索引起来，方便对齐。
     """
-    idx = {}
-    for r in gold_runs:
-        key = (r["site"], r["url"])
-        idx[key] = r
-    return idx
+    return {(r["site"], r["url"]): r for r in gold_runs}
 
 
 def main(gold_path: str, pred_path: str):
@@ -69,10 +66,15 @@ def main(gold_path: str, pred_path: str):
     # ======== 汇总 ========
     page_type_acc = sum(page_type_results) / max(len(page_type_results), 1)
 
-    # 平均字段精确率/召回率
-    avg_precision = sum(x["precision"] for x in field_pr_results) / max(len(field_pr_results), 1)
-    avg_recall = sum(x["recall"] for x in field_pr_results) / max(len(field_pr_results), 1)
-    avg_f1 = sum(x["f1"] for x in field_pr_results) / max(len(field_pr_results), 1)
+    # 平均字段精确率/召回率：一次遍历同时累加三项
+    precision_sum = recall_sum = f1_sum = 0.0
+    for x in field_pr_results:
+        precision_sum += x["precision"]
+        recall_sum += x["recall"]
+        f1_sum += x["f1"]
+    avg_precision = precision_sum / max(len(field_pr_results), 1)
+    avg_recall = recall_sum / max(len(field_pr_results), 1)
+    avg_f1 = f1_sum / max(len(field_pr_results), 1)
 
     # 模糊匹配平均得分
     avg_fuzzy = sum(fuzzy_scores) / max(len(fuzzy_scores), 1)
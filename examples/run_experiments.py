@@ -8,13 +8,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from statistics import mean
-from typing import Any, Dict, List, Optional
+from statistics import fmean
+from typing import Any, Dict, List, Optional, Tuple
 
 from aismartspider import (
+    BatchingOpenAIClient,
     DomSummarizer,
     Executor,
     Fetcher,
@@ -26,15 +32,17 @@ from aismartspider import (
     PageTypeClassifier,
     StrategyBuilder,
 )
-from aismartspider.models import IntentType, PageType
+from aismartspider.models import Intent, IntentType, PageType
 from aismartspider.metrics.extraction import (
     compute_field_precision_recall,
     compute_fuzzy_similarity,
 )
 from aismartspider.metrics.system_metrics import aggregate_timings
+from aismartspider.utils.json_utils import dumps, loads
 
 
-@dataclass
+# Slotted cases drop the per-instance __dict__; dataclass(slots=...) needs Python 3.10+.
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class ExperimentCase:
     site: str
     url: str
@@ -48,23 +56,71 @@ class ExperimentCase:
     def load_html(self) -> Optional[str]:
         if not self.html_path:
             return None
-        path = Path(self.html_path)
-        if path.exists():
-            return path.read_text(encoding="utf-8", errors="ignore")
+        if Path(self.html_path).exists():
+            return _read_html_cached(self.html_path)
         return None
 
 
+@lru_cache(maxsize=None)
+def _read_html_cached(path: str) -> str:
+    # Every model re-runs the same cases; each snapshot is read from disk once per process.
+    # _load_cases stores html_path resolved, so one file has one key.
+    return Path(path).read_text(encoding="utf-8", errors="ignore")
+
+
+class _SnapshotFetcher:
+    """Serve one case's HTML for every URL the executor asks for.
+
+    Each case gets its own instance, so concurrent cases never touch the shared
+    fetcher and runs stay offline once the HTML is known.
+    """
+
+    def __init__(self, url: str, html: str) -> None:
+        self.url = url
+        self.html = html
+
+    def fetch(self, *_args: Any, **_kwargs: Any) -> FetchResult:
+        return FetchResult(url=self.url, html=self.html, renderer="mock")
+
+
+class _Timer:
+    """Store the wall time of a ``with`` block in ``timings[key]``, even if it raises."""
+
+    __slots__ = ("timings", "key", "start")
+
+    def __init__(self, timings: Dict[str, float], key: str) -> None:
+        self.timings = timings
+        self.key = key
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.timings[self.key] = time.perf_counter() - self.start
+
+
 class ExperimentRunner:
-    """Run a batch of experiment cases and report metrics."""
+    """Run a batch of experiment cases and report metrics.
+
+    ``run_case`` keeps no per-case state on the runner, so cases may run in parallel threads.
+    """
 
-    def __init__(self, client, fetcher: Optional[Fetcher] = None) -> None:
+    def __init__(
+        self,
+        client,
+        fetcher: Optional[Fetcher] = None,
+        summarizer: Optional[DomSummarizer] = None,
+    ) -> None:
         self.client = client
         self.fetcher = fetcher or Fetcher()
-        self.summarizer = DomSummarizer()
+        self.summarizer = summarizer or DomSummarizer()
         self.classifier = PageTypeClassifier(client)
         self.intent_parser = IntentParser(client)
         self.strategy_builder = StrategyBuilder(client)
         self.executor = Executor(self.fetcher)
+        # Cases usually share a few task strings; each is parsed once per model.
+        self._intents: Dict[str, "Future[Intent]"] = {}
+        self._intents_lock = threading.Lock()
 
     def run_case(self, case: ExperimentCase) -> Dict[str, Any]:
         timings: Dict[str, float] = {}
@@ -95,45 +151,37 @@ class ExperimentRunner:
                 "records": [],
             }
 
-        t0 = time.perf_counter()
-        dom_summary = self.summarizer.summarize(html)
-        # Inject page type marker for MockClient to improve determinism in offline runs
-        if case.expected_page_type:
-            dom_summary = dom_summary + f"\nTEST_PAGE_TYPE:{case.expected_page_type}"
-        timings["summarize"] = time.perf_counter() - t0
-
-        # Force executor to reuse the same HTML to avoid network when running offline
-        original_fetch = self.fetcher.fetch
-        self.fetcher.fetch = lambda *_args, **_kwargs: FetchResult(url=case.url, html=html, renderer="mock")  # type: ignore
+        with _Timer(timings, "summarize"):
+            dom_summary = self.summarizer.summarize(html)
+            # Inject page type marker for MockClient to improve determinism in offline runs
+            if case.expected_page_type:
+                dom_summary = dom_summary + f"\nTEST_PAGE_TYPE:{case.expected_page_type}"
 
-        try:
-            t0 = time.perf_counter()
+        with _Timer(timings, "classify"):
             typing = self.classifier.classify(dom_summary)
-            timings["classify"] = time.perf_counter() - t0
 
-            t0 = time.perf_counter()
-            intent = self.intent_parser.parse(case.task)
+        with _Timer(timings, "parse_intent"):
+            intent = self._parse_intent(case.task)
             if case.expected_intent_type:
                 intent.intent_type = _to_intent_type(case.expected_intent_type)
             if case.expected_fields:
                 intent.requested_fields = list(case.expected_fields)
-            timings["parse_intent"] = time.perf_counter() - t0
 
-            t0 = time.perf_counter()
+        with _Timer(timings, "build_strategy"):
             strategy = self.strategy_builder.build(typing, intent, dom_summary)
-            timings["build_strategy"] = time.perf_counter() - t0
 
-            t0 = time.perf_counter()
-            records = self.executor.execute(case.url, strategy)
-            timings["execute"] = time.perf_counter() - t0
-        finally:
-            self.fetcher.fetch = original_fetch
+        # The executor reuses the same HTML for every page to avoid network when running offline.
+        executor = Executor(_SnapshotFetcher(case.url, html), retry_policy=self.executor.retry_policy)
+        with _Timer(timings, "execute"):
+            records = executor.execute(case.url, strategy, html=html)
 
+        strategy_fields = list(strategy.field_selectors)
+        requested_fields = intent.requested_fields
         metrics: Dict[str, Any] = {
             "page_type": typing.page_type.value,
             "intent_type": intent.intent_type.value,
-            "requested_fields": intent.requested_fields,
-            "strategy_fields": list(strategy.field_selectors.keys()),
+            "requested_fields": requested_fields,
+            "strategy_fields": strategy_fields,
             "strategy_details": {
                 "selectors": strategy.field_selectors,
                 "limits": strategy.field_limits,
@@ -148,8 +196,8 @@ class ExperimentRunner:
         if case.expected_intent_type:
             metrics["intent_type_correct"] = intent.intent_type == _to_intent_type(case.expected_intent_type)
         if case.expected_fields:
-            metrics["intent_field_hit_rate"] = _coverage(case.expected_fields, intent.requested_fields or [])
-            metrics["strategy_field_hit_rate"] = _coverage(case.expected_fields, list(strategy.field_selectors.keys()))
+            metrics["intent_field_hit_rate"] = _coverage(case.expected_fields, requested_fields or [])
+            metrics["strategy_field_hit_rate"] = _coverage(case.expected_fields, strategy_fields)
             metrics["non_empty_fields"] = _count_non_empty(records, case.expected_fields)
         if case.expected_records:
             metrics["extraction_exact_match"] = _exact_match(case.expected_records, records)
@@ -163,6 +211,25 @@ class ExperimentRunner:
             "records": records,
         }
 
+    def _parse_intent(self, task: str) -> Intent:
+        """Parse ``task`` once per runner and return a private copy for the caller to adjust."""
+        with self._intents_lock:
+            future = self._intents.get(task)
+            owner = future is None
+            if owner:
+                future = self._intents[task] = Future()
+        if owner:
+            # Concurrent cases with the same task wait on this parse instead of repeating it.
+            try:
+                future.set_result(self.intent_parser.parse(task))
+            except BaseException as exc:
+                with self._intents_lock:
+                    del self._intents[task]
+                future.set_exception(exc)
+        intent = future.result()
+        fields = intent.requested_fields
+        return replace(intent, requested_fields=list(fields) if fields is not None else None)
+
     def _get_html(self, case: ExperimentCase, timings: Dict[str, float]) -> str:
         """Resolve HTML from snapshot if available, otherwise fetch (and save if path provided)."""
         html_override = case.load_html()
@@ -170,41 +237,42 @@ class ExperimentRunner:
             timings["fetch"] = 0.0
             return html_override
 
-        t0 = time.perf_counter()
         try:
-            page = self.fetcher.fetch(case.url)
+            with _Timer(timings, "fetch"):
+                page = self.fetcher.fetch(case.url)
             html = page.html
         except Exception as exc:
-            timings["fetch"] = time.perf_counter() - t0
             print(f"[ExperimentRunner] Fetch failed for {case.url}: {exc}")
             return ""
-        timings["fetch"] = time.perf_counter() - t0
 
         # Cache fetched HTML if a path is provided to aid subsequent offline runs
         if case.html_path:
             path = Path(case.html_path)
             path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a concurrent run of the same case never reads a partial file.
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
             try:
-                path.write_text(html, encoding="utf-8")
+                tmp_path.write_text(html, encoding="utf-8")
+                os.replace(tmp_path, path)
             except Exception:
                 # Swallow write failures; continue with in-memory HTML
-                pass
+                tmp_path.unlink(missing_ok=True)
         return html
 
 
 def _coverage(expected: List[str], observed: List[str]) -> float:
     if not expected:
         return 0.0
-    observed_set = set(observed)
-    hits = sum(1 for field in expected if field in observed_set)
+    # Membership tests run in C via map(); expected stays a list so repeated names still count twice.
+    hits = sum(map(set(observed).__contains__, expected))
     return hits / len(expected)
 
 
 def _count_non_empty(records: List[Dict[str, str]], expected_fields: List[str]) -> int:
     if not records:
         return 0
-    first = records[0]
-    return sum(1 for field in expected_fields if first.get(field))
+    # map() runs the lookups and truth tests in C; get() tolerates missing fields.
+    return sum(map(bool, map(records[0].get, expected_fields)))
 
 
 def _exact_match(expected_records: List[Dict[str, str]], actual_records: List[Dict[str, str]]) -> bool:
@@ -213,55 +281,76 @@ def _exact_match(expected_records: List[Dict[str, str]], actual_records: List[Di
     expected = expected_records[0]
     actual_first = actual_records[0]
 
+    # Scalar fields only look at the first record, so they are checked before
+    # any list field has to be gathered across all records.
+    list_keys = []
     for key, expected_value in expected.items():
         if isinstance(expected_value, list):
-            actual_values = [rec.get(key) for rec in actual_records if rec.get(key)]
-            if len(actual_values) == 1 and isinstance(actual_values[0], list):
-                actual_values = actual_values[0]
-            if actual_values != expected_value:
-                return False
-        else:
-            if actual_first.get(key) != expected_value:
-                return False
+            list_keys.append(key)
+        elif actual_first.get(key) != expected_value:
+            return False
+
+    if not list_keys:
+        return True
+    # Gather every list field in one pass over the records (column per key).
+    columns: Dict[str, List[Any]] = {key: [] for key in list_keys}
+    for rec in actual_records:
+        get = rec.get
+        for key, column in columns.items():
+            value = get(key)
+            if value:
+                column.append(value)
+
+    for key, actual_values in columns.items():
+        if len(actual_values) == 1 and isinstance(actual_values[0], list):
+            actual_values = actual_values[0]
+        if actual_values != expected[key]:
+            return False
     return True
 
 
+_PAGE_TYPE_ALIASES = {
+    "detail": "news",
+    "profile": "news",
+    "thread": "forum",
+}
+# Labels resolved in one lookup; aliases override plain enum values ("profile").
+_PAGE_TYPE_LOOKUP: Dict[str, PageType] = {member.value: member for member in PageType}
+_PAGE_TYPE_LOOKUP.update({alias: PageType(target) for alias, target in _PAGE_TYPE_ALIASES.items()})
+_INTENT_TYPE_LOOKUP: Dict[str, IntentType] = {member.value: member for member in IntentType}
+
+
+# Configs repeat a handful of labels for every case and model.
+@lru_cache(maxsize=64)
 def _to_page_type(value: str) -> PageType:
-    normalized = value.lower()
-    aliases = {
-        "detail": "news",
-        "profile": "news",
-        "thread": "forum",
-    }
-    normalized = aliases.get(normalized, normalized)
-    return PageType(normalized) if normalized in PageType._value2member_map_ else PageType.UNKNOWN
+    return _PAGE_TYPE_LOOKUP.get(value.lower(), PageType.UNKNOWN)
 
 
+@lru_cache(maxsize=64)
 def _to_intent_type(value: str) -> IntentType:
-    normalized = value.lower()
-    return IntentType(normalized) if normalized in IntentType._value2member_map_ else IntentType.OTHER
+    return _INTENT_TYPE_LOOKUP.get(value.lower(), IntentType.OTHER)
 
 
 def _load_cases(config_path: str) -> List[ExperimentCase]:
     config_file = Path(config_path).resolve()
-    data = json.loads(config_file.read_text(encoding="utf-8"))
+    data = loads(config_file.read_bytes())
     cases: List[ExperimentCase] = []
     for item in data:
         html_path = item.get("html_path")
         if html_path:
-            p = Path(html_path)
-            if not p.is_absolute():
-                item["html_path"] = str((config_file.parent / p).resolve())
+            # Always resolved (absolute paths included), so it is a canonical snapshot cache key.
+            item["html_path"] = str((config_file.parent / html_path).resolve())
         cases.append(ExperimentCase(**item))
     return cases
 
 
-def _build_client(kind: str, api_key: Optional[str], base_url: Optional[str], model: str):
+def _build_client(kind: str, api_key: Optional[str], base_url: Optional[str], model: str, batch: bool = False):
     if kind == "mock":
         return MockClient()
     if kind == "gemini":
         return GeminiClient(api_key=api_key, model=model)
-    return OpenAIClient(api_key=api_key, base_url=base_url, model=model)
+    client_cls = BatchingOpenAIClient if batch else OpenAIClient
+    return client_cls(api_key=api_key, base_url=base_url, model=model)
 
 
 def parse_args() -> argparse.Namespace:
@@ -285,25 +374,39 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--proxy", default=None, help="Proxy URL (e.g. http://127.0.0.1:7890).")
     parser.add_argument("--use-playwright", action="store_true", help="Force use Playwright.")
     parser.add_argument("--gold", default=None, help="Path to gold standard JSON file for evaluation.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of cases run concurrently (fetches and LLM calls overlap).",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write each run as one compact JSON line instead of indenting it (faster for large sweeps).",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send OpenAI requests through the Batch API; each pipeline stage of all cases goes out as one batch.",
+    )
     return parser.parse_args()
 
 
 def _parse_cookies(cookie_arg: Optional[str]) -> Dict[str, str]:
     if not cookie_arg:
         return {}
-    if Path(cookie_arg).exists():
+    # A literal "k=v; k2=v2" string skips the filesystem check; .json files are always tried.
+    looks_like_path = "=" not in cookie_arg or cookie_arg.endswith(".json")
+    if looks_like_path and Path(cookie_arg).exists():
         try:
-            return json.loads(Path(cookie_arg).read_text(encoding="utf-8"))
+            return loads(Path(cookie_arg).read_bytes())
         except Exception:
             pass
     
     # Try parsing string "k=v; k2=v2"
-    cookies = {}
-    for part in cookie_arg.split(";"):
-        if "=" in part:
-            k, v = part.split("=", 1)
-            cookies[k.strip()] = v.strip()
-    return cookies
+    pairs = (part.partition("=") for part in cookie_arg.split(";"))
+    return {k.strip(): v.strip() for k, sep, v in pairs if sep}
 
 
 def main() -> None:
@@ -312,118 +415,147 @@ def main() -> None:
     model_names = [m.strip() for m in args.models.split(",") if m.strip()]
     
     cookies = _parse_cookies(args.cookies)
+    # One fetcher (pooled sessions) and one summarizer (cached summaries) serve every model;
+    # only the LLM-bound components are per model.
     fetcher = Fetcher(use_playwright=args.use_playwright, cookies=cookies, proxy=args.proxy)
+    summarizer = DomSummarizer()
 
-    all_results: List[Dict[str, Any]] = []
+    jobs: List[Tuple[str, ExperimentRunner, ExperimentCase]] = []
     for model_name in model_names:
-        client = _build_client(args.client, args.api_key, args.base_url, model_name)
-        runner = ExperimentRunner(client, fetcher=fetcher)
-
-        for case in cases:
-            result = runner.run_case(case)
-            result["model"] = model_name
-            all_results.append(result)
-
-    summary = _summarize(all_results)
-    
-    report_text = ""
-    if args.gold:
-        eval_summary = _evaluate_with_gold(all_results, args.gold)
-        summary.update(eval_summary)
-        
-        lines = []
-        lines.append("=== Evaluation Report ===")
-        lines.append(f"Page Type Accuracy: {summary.get('page_type_accuracy', 0):.3f}")
-        lines.append("\n=== Extraction Quality ===")
-        lines.append(f"Field Precision: {summary.get('field_precision', 0):.3f}")
-        lines.append(f"Field Recall:    {summary.get('field_recall', 0):.3f}")
-        lines.append(f"Field F1:        {summary.get('field_f1', 0):.3f}")
-        lines.append(f"Fuzzy Score:     {summary.get('fuzzy_score', 0):.3f}")
-        lines.append("\n=== System Performance ===")
-        for k, v in summary.get('timings_summary', {}).items():
-            lines.append(f"{k}: mean={v['mean']:.3f}s, std={v['std']:.3f}s, min={v['min']:.3f}s, max={v['max']:.3f}s")
-        
-        report_text = "\n".join(lines)
-        print(f"\n{report_text}")
-
-    output = {"summary": summary, "runs": all_results}
-    if report_text:
-        output["evaluation_report"] = report_text
-
-    Path(args.output).write_text(json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8")
+        client = _build_client(args.client, args.api_key, args.base_url, model_name, batch=args.batch)
+        runner = ExperimentRunner(client, fetcher=fetcher, summarizer=summarizer)
+        jobs.extend((model_name, runner, case) for case in cases)
+
+    def run_job(job: Tuple[str, ExperimentRunner, ExperimentCase]) -> Dict[str, Any]:
+        model_name, runner, case = job
+        result = runner.run_case(case)
+        result["model"] = model_name
+        return result
+
+    workers = args.workers
+    if jobs and isinstance(client, BatchingOpenAIClient):
+        # A case's request only joins the current batch window while the case is
+        # in flight, so every case gets its own thread (up to one full batch).
+        workers = max(workers, min(len(jobs), client.batch_size))
+    gold_idx = _load_gold_index(args.gold) if args.gold else None
+    run_summary = _RunSummary(gold_idx)
+    # Cases are dominated by fetch and LLM latency; map() keeps results in job order.
+    # Each run is written out and folded into the summary as soon as it is yielded,
+    # so finished runs (with all their records) are not kept until the end.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool, Path(args.output).open(
+        "w", encoding="utf-8", buffering=1 << 20
+    ) as handle:
+        separator = '{\n  "runs": [\n    '
+        for result in pool.map(run_job, jobs):
+            run_summary.add(result)
+            handle.write(separator)
+            handle.write(dumps(result) if args.compact else dumps(result, indent=True).replace("\n", "\n    "))
+            separator = ",\n    "
+        handle.write('{\n  "runs": []' if separator.startswith("{") else "\n  ]")
+
+        summary = run_summary.result()
+        report_text = _evaluation_report(summary) if args.gold else ""
+        if report_text:
+            print(f"\n{report_text}")
+
+        # The tail keeps the layout of json.dumps(indent=2) for the whole document
+        # (the runs too, unless --compact); it is one JSON document either way.
+        handle.write(',\n  "summary": ' + dumps(summary, indent=True).replace("\n", "\n  "))
+        if report_text:
+            handle.write(',\n  "evaluation_report": ' + dumps(report_text))
+        handle.write("\n}")
 
     print(f"Wrote results to {args.output}")
     if not args.gold:
         print(json.dumps(summary, ensure_ascii=False, indent=2))
 
 
-def _evaluate_with_gold(results: List[Dict[str, Any]], gold_path: str) -> Dict[str, Any]:
+def _evaluation_report(summary: Dict[str, Any]) -> str:
+    lines = []
+    lines.append("=== Evaluation Report ===")
+    lines.append(f"Page Type Accuracy: {summary.get('page_type_accuracy', 0):.3f}")
+    lines.append("\n=== Extraction Quality ===")
+    lines.append(f"Field Precision: {summary.get('field_precision', 0):.3f}")
+    lines.append(f"Field Recall:    {summary.get('field_recall', 0):.3f}")
+    lines.append(f"Field F1:        {summary.get('field_f1', 0):.3f}")
+    lines.append(f"Fuzzy Score:     {summary.get('fuzzy_score', 0):.3f}")
+    lines.append("\n=== System Performance ===")
+    for k, v in summary.get('timings_summary', {}).items():
+        lines.append(f"{k}: mean={v['mean']:.3f}s, std={v['std']:.3f}s, min={v['min']:.3f}s, max={v['max']:.3f}s")
+    return "\n".join(lines)
+
+
+def _load_gold_index(gold_path: str) -> Optional[Dict[Tuple[str, str], Dict[str, Any]]]:
     try:
-        gold_data = json.loads(Path(gold_path).read_text(encoding="utf-8"))
+        gold_data = loads(Path(gold_path).read_bytes())
         gold_runs = gold_data.get("runs", [])
     except Exception as e:
         print(f"Error loading gold file: {e}")
-        return {}
+        return None
+    return {(r["site"], r["url"]): r for r in gold_runs}
 
-    gold_idx = {(r["site"], r["url"]): r for r in gold_runs}
-    
-    field_pr_results = []
-    fuzzy_scores = []
-    timings_list = []
 
-    for run in results:
-        key = (run["site"], run["url"])
-        if key not in gold_idx:
-            continue
+# Summary key -> per-run metric it averages (over the runs that report it).
+_SUMMARY_METRICS = {
+    "page_type_accuracy": "page_type_correct",
+    "intent_type_accuracy": "intent_type_correct",
+    "strategy_field_hit_rate": "strategy_field_hit_rate",
+    "extraction_exact_match_rate": "extraction_exact_match",
+}
+
+
+class _RunSummary:
+    """Average the per-run metrics and, given a gold index, score runs against it.
+
+    Runs are added one at a time; only the metric values are kept, not the runs.
+    """
+
+    def __init__(self, gold_idx: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None) -> None:
+        self.gold_idx = gold_idx
+        self.total_runs = 0
+        self.columns: Dict[str, List[float]] = {metric: [] for metric in _SUMMARY_METRICS.values()}
+        self.precisions: List[float] = []
+        self.recalls: List[float] = []
+        self.f1_scores: List[float] = []
+        self.fuzzy_scores: List[float] = []
+        self.timings_list: List[Dict[str, float]] = []
+
+    def add(self, run: Dict[str, Any]) -> None:
+        self.total_runs += 1
+        metrics = run["metrics"]
+        for metric, values in self.columns.items():
+            if metric in metrics:
+                values.append(metrics[metric])
+
+        gold_run = self.gold_idx.get((run["site"], run["url"])) if self.gold_idx is not None else None
+        if gold_run is None:
+            return
 
-        gold_run = gold_idx[key]
-        
         # Extraction Quality
         gold_fields = gold_run.get("fields", {})
         pred_records = run.get("records", [])
         pred_fields = pred_records[0] if pred_records else {}
 
         pr = compute_field_precision_recall(gold_fields, pred_fields)
-        field_pr_results.append(pr)
-
-        fuzzy = compute_fuzzy_similarity(gold_fields, pred_fields)
-        fuzzy_scores.append(fuzzy)
-
-        timings_list.append(run["metrics"].get("timings", {}))
-
-    avg_precision = mean([x["precision"] for x in field_pr_results]) if field_pr_results else 0.0
-    avg_recall = mean([x["recall"] for x in field_pr_results]) if field_pr_results else 0.0
-    avg_f1 = mean([x["f1"] for x in field_pr_results]) if field_pr_results else 0.0
-    avg_fuzzy = mean(fuzzy_scores) if fuzzy_scores else 0.0
-    
-    timing_summary = aggregate_timings(timings_list)
-
-    return {
-        "field_precision": avg_precision,
-        "field_recall": avg_recall,
-        "field_f1": avg_f1,
-        "fuzzy_score": avg_fuzzy,
-        "timings_summary": timing_summary
-    }
-
-
-def _summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    summary: Dict[str, Any] = {"total_runs": len(results)}
-    page_acc = [r["metrics"].get("page_type_correct") for r in results if "page_type_correct" in r["metrics"]]
-    intent_acc = [r["metrics"].get("intent_type_correct") for r in results if "intent_type_correct" in r["metrics"]]
-    strategy_hits = [
-        r["metrics"].get("strategy_field_hit_rate")
-        for r in results
-        if "strategy_field_hit_rate" in r["metrics"]
-    ]
-    extract_hits = [
-        r["metrics"].get("extraction_exact_match") for r in results if "extraction_exact_match" in r["metrics"]
-    ]
-    summary["page_type_accuracy"] = mean(page_acc) if page_acc else None
-    summary["intent_type_accuracy"] = mean(intent_acc) if intent_acc else None
-    summary["strategy_field_hit_rate"] = mean(strategy_hits) if strategy_hits else None
-    summary["extraction_exact_match_rate"] = mean(extract_hits) if extract_hits else None
-    return summary
+        self.precisions.append(pr["precision"])
+        self.recalls.append(pr["recall"])
+        self.f1_scores.append(pr["f1"])
+        self.fuzzy_scores.append(compute_fuzzy_similarity(gold_fields, pred_fields))
+        self.timings_list.append(metrics.get("timings", {}))
+
+    def result(self) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {"total_runs": self.total_runs}
+        for key, metric in _SUMMARY_METRICS.items():
+            values = self.columns[metric]
+            summary[key] = fmean(values) if values else None
+
+        if self.gold_idx is not None:
+            summary["field_precision"] = fmean(self.precisions) if self.precisions else 0.0
+            summary["field_recall"] = fmean(self.recalls) if self.recalls else 0.0
+            summary["field_f1"] = fmean(self.f1_scores) if self.f1_scores else 0.0
+            summary["fuzzy_score"] = fmean(self.fuzzy_scores) if self.fuzzy_scores else 0.0
+            summary["timings_summary"] = aggregate_timings(self.timings_list)
+        return summary
 
 
 if __name__ == "__main__":
@@ -0,0 +1,269 @@
+"""Tests for the LLM client layer."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from aismartspider import IntentParser, MockClient, PageType, PageTypeClassifier
+from aismartspider.ai_client import (
+    BatchingOpenAIClient,
+    CachingLLMClient,
+    GeminiClient,
+    LLMClient,
+    OpenAIClient,
+    RoundRobinLLMClient,
+    SQLiteBackend,
+)
+
+
+class EchoClient(LLMClient):
+    def chat(self, messages, **kwargs):
+        return {"content": messages[-1]["content"]}
+
+
+def test_abatch_preserves_order():
+    client = EchoClient()
+    batch = [[{"role": "user", "content": str(i)}] for i in range(20)]
+    responses = asyncio.run(client.abatch(batch, max_concurrency=4))
+    assert [r["content"] for r in responses] == [str(i) for i in range(20)]
+
+
+def test_async_classify_and_parse_match_sync():
+    client = MockClient()
+    classifier = PageTypeClassifier(client)
+    parser = IntentParser(client)
+
+    async def _run():
+        return await asyncio.gather(
+            classifier.aclassify("{} TEST_PAGE_TYPE:list"),
+            parser.aparse("抓标题"),
+        )
+
+    typing, intent = asyncio.run(_run())
+    assert typing.page_type == PageType.LIST
+    assert intent == parser.parse("抓标题")
+
+
+class CountingClient(LLMClient):
+    model = "counting"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat(self, messages, **kwargs):
+        self.calls += 1
+        return {"content": f"reply-{self.calls}"}
+
+
+def test_caching_client_replays_deterministic_calls(tmp_path):
+    inner = CountingClient()
+    client = CachingLLMClient(inner, SQLiteBackend(str(tmp_path / "cache.db")))
+    messages = [{"role": "user", "content": "hello"}]
+
+    first = client.chat(messages)
+    second = client.chat(messages)
+    sampled = client.chat(messages, temperature=0.7)
+
+    assert first == second == {"content": "reply-1"}
+    assert sampled == {"content": "reply-2"}
+    assert inner.calls == 2
+    assert client.stats == {"hits": 1, "misses": 1}
+
+
+class RateLimitedClient(LLMClient):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat(self, messages, **kwargs):
+        self.calls += 1
+        raise RuntimeError("429 Too Many Requests")
+
+
+def test_round_robin_client_fails_over_and_cools_down():
+    limited = RateLimitedClient()
+    healthy = CountingClient()
+    client = RoundRobinLLMClient([limited, healthy])
+    messages = [{"role": "user", "content": "hi"}]
+
+    assert client.chat(messages) == {"content": "reply-1"}
+    assert client.chat(messages) == {"content": "reply-2"}
+    assert limited.calls == 1
+
+
+def test_openai_client_defers_sdk_until_first_call():
+    client = OpenAIClient(api_key="sk-test")
+    assert client._client is None and client._legacy is None
+
+
+class FakeBatchAPI:
+    """Stand-in for the files/batches endpoints of the OpenAI SDK."""
+
+    def __init__(self) -> None:
+        self.uploads = []
+        self.files = self
+        self.batches = self
+
+    def create(self, file=None, purpose=None, input_file_id=None, endpoint=None, completion_window=None):
+        if purpose == "batch":
+            self.uploads.append(file[1].decode("utf-8"))
+            return SimpleNamespace(id="file-in")
+        return SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+    def content(self, file_id):
+        rows = []
+        for line in self.uploads[-1].splitlines():
+            request = json.loads(line)
+            reply = request["body"]["messages"][-1]["content"].upper()
+            rows.append(
+                json.dumps(
+                    {
+                        "custom_id": request["custom_id"],
+                        "response": {"status_code": 200, "body": {"choices": [{"message": {"content": reply}}]}},
+                    }
+                )
+            )
+        return SimpleNamespace(text="\n".join(rows))
+
+
+def test_batching_client_resolves_requests_from_one_batch():
+    client = BatchingOpenAIClient(api_key="sk-test", batch_window_seconds=0.05, poll_interval=0)
+    api = FakeBatchAPI()
+    client._client = api
+
+    async def run():
+        return await asyncio.gather(
+            client.achat([{"role": "user", "content": "a"}]),
+            client.achat([{"role": "user", "content": "b"}]),
+        )
+
+    assert asyncio.run(run()) == [{"content": "A"}, {"content": "B"}]
+    assert len(api.uploads) == 1
+
+
+def test_openai_warmup_reuses_the_shared_pool():
+    import httpx
+
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, str(request.url)))
+        return httpx.Response(200)
+
+    class MockTransportClient(OpenAIClient):
+        def _build_http_client(self, asynchronous=False):
+            return httpx.Client(transport=httpx.MockTransport(handler))
+
+    client = MockTransportClient(api_key="sk-test", base_url="https://llm.example/v1")
+    client._warmup()
+    assert seen == [("HEAD", "https://llm.example/v1/models")]
+
+
+def test_openai_async_warmup_primes_the_pool_achat_uses():
+    import httpx
+
+    seen = []
+    transports = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path))
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        return httpx.Response(
+            200,
+            json={
+                "id": "c",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "m",
+                "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "{}"}}],
+            },
+        )
+
+    class MockTransportClient(OpenAIClient):
+        def _build_http_client(self, asynchronous=False):
+            transport = httpx.MockTransport(handler)
+            transports.append((asynchronous, transport))
+            client_cls = httpx.AsyncClient if asynchronous else httpx.Client
+            return client_cls(transport=transport)
+
+    client = MockTransportClient(api_key="sk-test", base_url="https://llm.example/v1", stop_on_json=False)
+
+    async def run():
+        await client.awarmup()
+        warmed = client._async_http_client
+        reply = await client.achat([{"role": "user", "content": "hi"}])
+        return warmed, reply
+
+    warmed, reply = asyncio.run(run())
+    assert reply == {"content": "{}"}
+    assert seen == [("HEAD", "/v1/models"), ("POST", "/v1/chat/completions")]
+    # Both requests went through the single async transport the warmup created.
+    assert [asynchronous for asynchronous, _ in transports].count(True) == 1
+    assert client._aclient._client is warmed
+
+
+def test_caching_client_coalesces_concurrent_identical_calls():
+    class SlowClient(LLMClient):
+        model = "slow"
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def chat(self, messages, **kwargs):
+            raise NotImplementedError
+
+        async def achat(self, messages, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return {"content": "done"}
+
+    inner = SlowClient()
+    client = CachingLLMClient(inner)
+    messages = [{"role": "user", "content": "same"}]
+
+    async def run():
+        return await asyncio.gather(*(client.achat(messages) for _ in range(5)))
+
+    assert asyncio.run(run()) == [{"content": "done"}] * 5
+    assert inner.calls == 1
+
+
+def test_gemini_stream_stops_at_object_and_closes_iterator():
+    class FakeStream:
+        def __init__(self, texts):
+            self.texts = texts
+            self.consumed = 0
+            self.closed = False
+
+        def __iter__(self):
+            for text in self.texts:
+                self.consumed += 1
+                yield SimpleNamespace(text=text)
+
+        def close(self):
+            self.closed = True
+
+    stream = FakeStream(["Sure [note]: here is the JSON:\n", '{"page_type": "list"}', " trailing", " more"])
+
+    class FakeModel:
+        def generate_content(self, contents, **kwargs):
+            assert kwargs.get("stream")
+            return stream
+
+    client = GeminiClient(api_key="test")
+    client._prepare_model = lambda kwargs, system_instruction=None: (FakeModel(), {})
+
+    reply = client.chat([{"role": "user", "content": "classify"}])
+    assert reply == {"content": 'Sure [note]: here is the JSON:\n{"page_type": "list"}'}
+    assert stream.consumed == 2 and stream.closed
+
+
+def test_mock_client_ignores_unicode_case_variants_of_markers():
+    client = MockClient()
+    for content in ("ıntent_type", "field_ſelectors"):
+        assert isinstance(client.chat([{"role": "user", "content": content}])["content"], str)
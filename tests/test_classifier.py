@@ -1,5 +1,6 @@
 """Classifier and strategy tests across page types."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,7 @@ from aismartspider import (
     IntentParser,
     StrategyBuilder,
     MockClient,
+    PageTypingResult,
 )
 
 FIXTURE_DIR = Path(__file__).parent / "fixtures"
@@ -28,9 +30,10 @@ FIXTURE_DIR = Path(__file__).parent / "fixtures"
 def test_classifier_detects_common_page_types(fixture_name: str, marker: str, expected_type: PageType) -> None:
     html = (FIXTURE_DIR / fixture_name).read_text(encoding="utf-8")
     summarizer = DomSummarizer()
-    classifier = PageTypeClassifier(MockClient())
-    intent_parser = IntentParser(MockClient())
-    strategy_builder = StrategyBuilder(MockClient())
+    client = MockClient()
+    classifier = PageTypeClassifier(client)
+    intent_parser = IntentParser(client)
+    strategy_builder = StrategyBuilder(client)
 
     # 在 summary 里加一个专用于 MockClient 的测试标记，避免受自然语言变化影响
     summary = summarizer.summarize(html) + "\n" + marker
@@ -41,3 +44,22 @@ def test_classifier_detects_common_page_types(fixture_name: str, marker: str, ex
     assert typing.page_type == expected_type
     assert strategy.page_type == expected_type
     assert intent.requested_fields == ["title", "content"]
+
+
+def test_classifier_reuses_typing_for_identical_summary():
+    class CountingClient(MockClient):
+        calls = 0
+
+        def chat(self, messages, **kwargs):
+            CountingClient.calls += 1
+            return {"content": '{"page_type": "news", "confidence": 0.8, "suggested_fields": ["title"]}'}
+
+    classifier = PageTypeClassifier(CountingClient())
+    first = classifier.classify('{"title": "a"}')
+    first.suggested_fields.append("mutated")
+    second = asyncio.run(classifier.aclassify('{"title": "a"}'))
+    assert CountingClient.calls == 1
+    assert second == PageTypingResult(page_type=PageType.NEWS, confidence=0.8, suggested_fields=["title"])
+
+    classifier.classify('{"title": "b"}')
+    assert CountingClient.calls == 2
@@ -0,0 +1,60 @@
+"""Tests for the DOM summarizer."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from aismartspider import DomSummarizer
+
+HTML = """
+<html><head><title>Example</title><meta name="description" content=" desc "></head>
+<body>
+  <div class="article-content"><h1>Headline</h1><p>First paragraph with enough text.</p>
+  <script>var ignored = true;</script><img src="/a.png"></div>
+  <ul><li>one</li><li>two</li></ul>
+</body></html>
+"""
+
+
+def test_summary_skips_noise_and_keeps_all_fields():
+    summary = json.loads(DomSummarizer().summarize(HTML))
+    assert summary["title"] == "Example"
+    assert summary["meta"]["description"] == "desc"
+    assert summary["headings"] == ["Headline"]
+    assert summary["lists"] == [{"type": "ul", "items": ["one", "two"]}]
+    assert "ignored" not in summary["structure_hints"][0]["text_snippet"]
+    assert summary["image_hints"][0]["src_preview"] == "/a.png"
+
+
+def test_summary_fields_subset():
+    summary = json.loads(DomSummarizer().summarize(HTML, fields={"title", "paragraphs"}))
+    assert summary == {"title": "Example", "paragraphs": ["First paragraph with enough text."]}
+
+
+def test_summary_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        DomSummarizer().summarize(HTML, fields={"nope"})
+
+
+def test_summary_is_memoized_by_content(monkeypatch):
+    summarizer = DomSummarizer(cache_size=2)
+    calls = []
+    original = summarizer._summarize
+    monkeypatch.setattr(summarizer, "_summarize", lambda *args: calls.append(args) or original(*args))
+
+    first = summarizer.summarize(HTML)
+    assert summarizer.summarize(str(HTML)) == first
+    assert summarizer.summarize(HTML, fields=["title"]) != first
+    assert len(calls) == 2
+
+
+def test_summary_carries_tag_counts_for_strategy_builder():
+    import pickle
+
+    summary = DomSummarizer().summarize(HTML)
+    assert isinstance(summary, str)
+    assert summary.tag_counts == json.loads(summary)["tag_counts"]
+    assert pickle.loads(pickle.dumps(summary)).tag_counts == summary.tag_counts
+    assert DomSummarizer().summarize(HTML, fields={"title"}).tag_counts == {}
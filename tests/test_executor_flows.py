@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import Dict
 
+import pytest
+
 from aismartspider import Executor, FetchResult
 from aismartspider.models import Intent, IntentType, PageType, Strategy
 from aismartspider.utils.retry import RetryPolicy
@@ -73,6 +78,8 @@ def test_gallery_flow_collects_images():
         <div class="gallery">
             <img src="a.jpg" />
             <img src="b.jpg" />
+            <img src="/a.jpg" />
+            <img src="b.jpg" />
         </div>
       </body>
     </html>
@@ -110,3 +117,136 @@ def test_primary_image_selector_returns_single_image():
     record = executor.execute(base_url, strategy)[0]
     assert record["title"] == "Hero"
     assert record["image"] == "http://example.com/hero.jpg"
+
+
+def test_detail_pages_are_fetched_concurrently_in_link_order():
+    base_url = "http://example.com/list.html"
+    mapping = {
+        base_url: "<html><body>"
+        + "".join(f'<a class="item-link" href="/d{i}.html">{i}</a>' for i in range(3))
+        + "</body></html>",
+    }
+    for i in range(3):
+        mapping[f"http://example.com/d{i}.html"] = f"<html><body><h1>Title {i}</h1><p>Body</p></body></html>"
+
+    class SlowFetcher(DummyFetcher):
+        def __init__(self, mapping: Dict[str, str]) -> None:
+            super().__init__(mapping)
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+
+        def fetch(self, url: str) -> FetchResult:
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.05)
+            with self.lock:
+                self.active -= 1
+            return super().fetch(url)
+
+    fetcher = SlowFetcher(mapping)
+    records = Executor(fetcher, retry_policy=NoRetry()).execute(base_url, _strategy_for_list())
+    assert [record["title"] for record in records] == ["Title 0", "Title 1", "Title 2"]
+    assert fetcher.peak > 1
+
+
+def test_soupsieve_only_selectors_fall_back_to_beautifulsoup():
+    intent = Intent(intent_type=IntentType.EXTRACT_INFO, requested_fields=["title", "author"], raw_text="")
+    strategy = Strategy(
+        page_type=PageType.NEWS,
+        intent=intent,
+        field_selectors={"title": "h1", "author": "span:contains('By')"},
+        field_methods={"title": "css", "author": "css"},
+    )
+    html = "<html><body><h1> Headline <script>ignored()</script></h1><span>Tag</span><span>By Ann</span></body></html>"
+    base_url = "http://example.com/detail.html"
+    executor = Executor(DummyFetcher({base_url: html}), retry_policy=NoRetry())
+    record = executor.execute(base_url, strategy)[0]
+    assert record == {"title": "Headline", "author": "By Ann"}
+
+
+def test_resolve_url_fast_paths_match_urljoin():
+    from urllib.parse import urljoin
+
+    base = "https://example.com/news/page?x=1"
+    for href in ["https://cdn.example.com/a.png", "/detail/1", "/a/../b", "//cdn.example.com/x", "../up", "/a?#f", "?p=2"]:
+        assert Executor._resolve_url(base, href) == urljoin(base, href)
+
+
+def test_aexecute_matches_execute_for_detail_lists():
+    base_url = "http://example.com/list.html"
+    mapping = {
+        base_url: "<html><body>"
+        + "".join(f'<a class="item-link" href="/d{i}.html">{i}</a>' for i in range(3))
+        + "</body></html>",
+    }
+    for i in range(3):
+        mapping[f"http://example.com/d{i}.html"] = f"<html><body><h1>Title {i}</h1><p>Body</p></body></html>"
+
+    executor = Executor(DummyFetcher(mapping), retry_policy=NoRetry())
+    strategy = _strategy_for_list()
+    assert asyncio.run(executor.aexecute(base_url, strategy)) == executor.execute(base_url, strategy)
+
+
+def test_provided_html_replaces_the_first_fetch():
+    base_url = "http://example.com/list.html"
+    list_html = '<html><body><a class="item-link" href="/d1.html">1</a></body></html>'
+    # The list page is not in the mapping, so fetching it would raise KeyError.
+    mapping = {"http://example.com/d1.html": "<html><body><h1>Title 1</h1><p>Body</p></body></html>"}
+
+    executor = Executor(DummyFetcher(mapping), retry_policy=NoRetry())
+    strategy = _strategy_for_list()
+    records = executor.execute(base_url, strategy, html=list_html)
+    assert [record["title"] for record in records] == ["Title 1"]
+    assert asyncio.run(executor.aexecute(base_url, strategy, html=list_html)) == records
+
+
+def test_templated_pagination_fetches_numbered_pages():
+    base_url = "http://example.com/list?page=1"
+    mapping = {
+        f"http://example.com/list?page={i}": f"<html><body><ul><li class='row'>Row {i}</li></ul></body></html>"
+        for i in range(1, 4)
+    }
+    intent = Intent(intent_type=IntentType.CRAWL_LIST, requested_fields=["title"], raw_text="")
+    strategy = Strategy(
+        page_type=PageType.LIST,
+        intent=intent,
+        field_selectors={"title": "li.row"},
+        field_methods={"title": "css"},
+        is_list=True,
+        pagination_template="/list?page={page}",
+        max_pages=3,
+    )
+    executor = Executor(DummyFetcher(mapping), retry_policy=NoRetry())
+    records = executor.execute(base_url, strategy)
+    assert [record["title"] for record in records] == ["Row 1", "Row 2", "Row 3"]
+    assert asyncio.run(executor.aexecute(base_url, strategy)) == records
+
+
+def test_parsed_documents_are_reused_per_url_while_html_is_unchanged():
+    executor = Executor(DummyFetcher({}), retry_policy=NoRetry())
+    page = FetchResult(url="http://example.com/a", html="<html><body><h1>A</h1></body></html>", renderer="mock")
+    doc = executor._document(page)
+    assert executor._document(FetchResult(url=page.url, html=page.html, renderer="mock")) is doc
+    assert executor._document(FetchResult(url=page.url, html="<p>changed</p>", renderer="mock")) is not doc
+
+
+def test_retry_policy_jitters_waits_and_respects_deadline(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("boom")
+        return "ok"
+
+    assert RetryPolicy(max_retries=3, backoff=2.0).run(flaky) == "ok"
+    assert 0.5 <= sleeps[0] <= 1.5 and 1.0 <= sleeps[1] <= 3.0
+
+    attempts.clear()
+    with pytest.raises(RuntimeError):
+        RetryPolicy(max_retries=3).run(flaky, deadline=time.monotonic())
+    assert len(attempts) == 1
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
 from aismartspider.fetcher import Fetcher
 
 
@@ -40,3 +43,84 @@ def test_fetcher_keeps_static_result_on_content_rich_page():
     assert result.renderer == "static"
     assert result.html == static_html
     assert fetcher.render_attempts == 0
+
+
+def test_fetcher_reuses_one_session_per_thread():
+    fetcher = Fetcher(auto_render=False)
+    session = fetcher._session()
+    assert fetcher._session() is session
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(fetcher._session()))
+    thread.start()
+    thread.join()
+    assert other[0] is not session
+
+
+def test_fetch_many_keeps_order_and_renders_dynamic_pages():
+    rich = "<html>" + "<p>data</p>" * 500 + "</html>"
+
+    class AsyncStubFetcher(StubFetcher):
+        async def _afetch_static(self, url: str):
+            await asyncio.sleep(0.01 if url.endswith("slow") else 0)
+            return (rich if "static" in url else "<html></html>"), url
+
+        async def _arender_with_backends(self, url: str):
+            return self._render_with_backends(url)
+
+    render_payload = ("<html><body>rendered</body></html>", "http://example.com/rendered", "playwright")
+    fetcher = AsyncStubFetcher("", render_payload)
+    results = asyncio.run(fetcher.fetch_many(["http://example.com/static-slow", "http://example.com/dynamic"]))
+
+    assert [result.renderer for result in results] == ["static", "playwright"]
+    assert results[0].url == "http://example.com/static-slow"
+    assert fetcher.render_attempts == 1
+
+
+def test_static_fetch_revalidates_with_etag_and_serves_304_from_cache(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from aismartspider.config import settings
+
+    monkeypatch.setattr(settings, "rate_limit", 0)
+    body = "<html>" + "<p>cached</p>" * 10 + "</html>"
+    sent_headers = []
+
+    class FakeSession:
+        def get(self, **request):
+            sent_headers.append(request["headers"])
+            if request["headers"].get("If-None-Match") == '"v1"':
+                return SimpleNamespace(status_code=304, headers={}, url=request["url"], text="")
+            return SimpleNamespace(
+                status_code=200,
+                headers={"ETag": '"v1"'},
+                url=request["url"],
+                text=body,
+                raise_for_status=lambda: None,
+            )
+
+    fetcher = Fetcher(auto_render=False, cache_dir=str(tmp_path))
+    monkeypatch.setattr(fetcher, "_session", lambda: FakeSession())
+
+    assert fetcher._fetch_static("http://example.com/a") == (body, "http://example.com/a")
+    assert fetcher._fetch_static("http://example.com/a") == (body, "http://example.com/a")
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+
+    profile = tmp_path / "playwright-profile"
+    profile.mkdir()
+    fetcher.clear_cache()
+    assert not profile.exists()
+    fetcher._fetch_static("http://example.com/a")
+    assert "If-None-Match" not in sent_headers[2]
+    fetcher.close()
+
+
+def test_rate_limit_spaces_requests_per_host(monkeypatch):
+    from aismartspider.config import settings
+
+    monkeypatch.setattr(settings, "rate_limit", 1.0)
+    fetcher = Fetcher(auto_render=False)
+    assert fetcher._reserve_host_slot("http://a.example/1") == 0
+    assert 0.9 < fetcher._reserve_host_slot("http://a.example/2") <= 1.0
+    assert fetcher._reserve_host_slot("http://b.example/1") == 0
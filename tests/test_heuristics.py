@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 from aismartspider import IntentParser, StrategyBuilder, PageType
@@ -24,6 +25,26 @@ def test_intent_parser_heuristic_fields():
     assert set(intent.requested_fields or []) >= {"title", "images"}
 
 
+def test_intent_parser_skips_model_when_heuristics_are_unambiguous():
+    class CountingClient(BrokenClient):
+        calls = 0
+
+        def chat(self, messages, **kwargs):
+            CountingClient.calls += 1
+            return super().chat(messages, **kwargs)
+
+    parser = IntentParser(CountingClient())
+    request_text = "\u4e0b\u8f7d\u56fe\u7247 \u524d10 \u5f20\uff0c\u5e26\u6807\u9898\u548c\u94fe\u63a5"
+    intent = parser.parse(request_text)
+    assert CountingClient.calls == 0
+    assert intent.intent_type == IntentType.DOWNLOAD_IMAGES
+    assert intent.requested_fields == ["title", "images", "links"]
+    assert intent.max_items == 10
+
+    assert parser.parse(request_text, force_llm=True) == intent
+    assert CountingClient.calls == 1
+
+
 def test_strategy_builder_heuristic_defaults():
     builder = StrategyBuilder(BrokenClient())
     typing = PageTypingResult(page_type=PageType.LIST, confidence=0.8)
@@ -34,3 +55,47 @@ def test_strategy_builder_heuristic_defaults():
     assert strategy.item_link_selector
     assert "title" in strategy.field_selectors
     assert strategy.field_methods["title"] == "css"
+
+
+def test_strategy_builder_reuses_answer_for_identical_prompt():
+    class CountingClient(LLMClient):
+        calls = 0
+
+        def chat(self, messages, **kwargs):
+            CountingClient.calls += 1
+            return {"content": json.dumps({"field_selectors": {"title": "h1.headline"}})}
+
+    builder = StrategyBuilder(CountingClient())
+    typing = PageTypingResult(page_type=PageType.NEWS, confidence=0.9)
+    intent = Intent(intent_type=IntentType.EXTRACT_INFO, requested_fields=["title"], raw_text="")
+    dom_summary = json.dumps({"tag_counts": {"p": 3}})
+
+    first = builder.build(typing, intent, dom_summary)
+    first.field_selectors["title"] = "mutated"
+    second = builder.build(typing, intent, dom_summary)
+    assert CountingClient.calls == 1
+    assert second.field_selectors == {"title": "h1.headline"}
+
+    builder.cache_clear()
+    builder.build(typing, intent, dom_summary)
+    assert CountingClient.calls == 2
+
+
+def test_strategy_builder_abuild_matches_build():
+    class HeroClient(LLMClient):
+        def chat(self, messages, **kwargs):
+            if "response_format" in kwargs:
+                return {"content": json.dumps({"selector": "article img"})}
+            return {"content": json.dumps({"field_selectors": {"title": "h1.headline"}, "is_list": False})}
+
+    typing = PageTypingResult(page_type=PageType.NEWS, confidence=0.9)
+    intent = Intent(intent_type=IntentType.EXTRACT_INFO, requested_fields=["title", "cover"], raw_text="")
+    summaries = [json.dumps({"tag_counts": {"img": n}}) for n in (1, 9)]
+
+    expected = [StrategyBuilder(HeroClient(), cache_size=0).build(typing, intent, s) for s in summaries]
+    built = asyncio.run(
+        StrategyBuilder(HeroClient(), cache_size=0).abuild_many([(typing, intent, s) for s in summaries])
+    )
+    assert built == expected
+    assert built[0].primary_image_selector == "article img"
+    assert built[1].image_selector and not built[0].image_selector
@@ -0,0 +1,37 @@
+"""Tests for LLM JSON parsing helpers."""
+
+from __future__ import annotations
+
+from aismartspider.utils.json_utils import JsonStreamScanner, dumps, extract_json_payload, loads
+
+
+def test_stream_scanner_stops_after_outer_object():
+    scanner = JsonStreamScanner()
+    chunks = ['{"a": "}', '{ not a brace", "b": [1, ', "{}]", "}", " trailing"]
+    consumed = []
+    for chunk in chunks:
+        consumed.append(chunk)
+        if scanner.feed(chunk):
+            break
+    assert consumed == chunks[:4]
+    assert extract_json_payload("".join(consumed)) == {"a": "}{ not a brace", "b": [1, {}]}
+
+
+def test_stream_scanner_handles_escaped_quotes():
+    scanner = JsonStreamScanner()
+    assert not scanner.feed('{"q": "say \\"}\\"')
+    assert scanner.feed('"}')
+
+
+def test_stream_scanner_ignores_brackets_in_prose_before_object():
+    scanner = JsonStreamScanner()
+    assert not scanner.feed("Sure [note]: he")
+    assert not scanner.feed('re is the JSON:\n{"page_type": "list", "tags": [1]')
+    assert scanner.feed("}")
+
+
+def test_dumps_is_compact_and_round_trips_unicode():
+    payload = {"title": "标题", "tags": ["a", "b"], "score": 0.5}
+    text = dumps(payload)
+    assert text == '{"title":"标题","tags":["a","b"],"score":0.5}'
+    assert loads(text) == payload
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import csv
 import json
 import sqlite3
 
-from aismartspider.output import SQLiteWriter
+from aismartspider.output import CsvWriter, JsonWriter, SQLiteWriter
 
 
 def test_sqlite_writer_serializes_lists(tmp_path):
@@ -25,3 +26,74 @@ def test_sqlite_writer_serializes_lists(tmp_path):
     assert row[0] == "Example"
     assert json.loads(row[1]) == ["http://a", "http://b"]
     assert json.loads(row[2]) == {"author": "tester"}
+
+
+def test_sqlite_writer_appends_over_one_connection(tmp_path):
+    db_path = tmp_path / "records.db"
+    with SQLiteWriter(db_path=str(db_path)) as writer:
+        writer.write([{"title": "A"}])
+        connection = writer._connection
+        writer.write([{"title": "B"}])
+        assert writer._connection is connection
+    assert writer._connection is None
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute('SELECT title FROM "records"').fetchall()
+    conn.close()
+    assert rows == [("A",), ("B",)]
+
+
+def test_sql_writer_append_batches_until_flush(tmp_path):
+    db_path = tmp_path / "records.db"
+    writer = SQLiteWriter(db_path=str(db_path))
+    writer.append_batch_size = 3
+    writes = []
+    original = writer.write
+    writer.write = lambda records: writes.append(len(records)) or original(records)
+
+    for index in range(4):
+        writer.append([{"title": str(index)}])
+    assert writes == [3]
+    writer.close()
+    assert writes == [3, 1]
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute('SELECT COUNT(*) FROM "records"').fetchone() == (4,)
+    conn.close()
+
+
+def test_json_writer_matches_indented_dump(tmp_path):
+    path = tmp_path / "records.json"
+    records = [
+        {"title": "标题", "links": ["http://a"], "meta": {}},
+        {"title": "line\nbreak", "links": [], "meta": {"author": None}},
+    ]
+
+    JsonWriter(path=str(path)).write(records)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(records, ensure_ascii=False, indent=2)
+    assert json.loads(path.read_text(encoding="utf-8")) == records
+
+
+def test_file_writers_accept_generators(tmp_path):
+    records = [{"title": "A"}, {"title": "B", "date": "2024-01-01"}]
+
+    JsonWriter(path=str(tmp_path / "records.json")).write(iter(records))
+    JsonWriter(path=str(tmp_path / "empty.json")).write(iter(()))
+    CsvWriter(path=str(tmp_path / "records.csv")).write(record for record in records)
+
+    assert json.loads((tmp_path / "records.json").read_text(encoding="utf-8")) == records
+    assert (tmp_path / "empty.json").read_text(encoding="utf-8") == "[]"
+    with (tmp_path / "records.csv").open(newline="", encoding="utf-8") as handle:
+        assert list(csv.reader(handle)) == [["title", "date"], ["A", ""], ["B", "2024-01-01"]]
+
+
+def test_csv_writer_fills_missing_columns(tmp_path):
+    path = tmp_path / "records.csv"
+    records = [{"title": "A", "tags": ["x", "y"]}, {"title": "B", "date": "2024-01-01"}]
+
+    CsvWriter(path=str(path)).write(records)
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows == [["title", "tags", "date"], ["A", '["x","y"]', ""], ["B", "", "2024-01-01"]]
@@ -33,3 +33,125 @@ def test_smoke_flow():
 
     assert isinstance(records, list)
     assert records[0].get("title") == "标题"
+
+
+def test_cli_run_processes_urls_concurrently_and_writes_once():
+    import asyncio
+
+    from aismartspider.cli import _run
+
+    pages = {
+        "http://example.com/a": "<html><body><h1>A</h1><p>a</p></body></html>",
+        "http://example.com/b": "<html><body><h1>B</h1><p>b</p></body></html>",
+    }
+    client = MockClient()
+    fetcher = Fetcher()
+    fetcher.fetch = lambda url: FetchResult(url=url, html=pages[url], renderer="mock")  # type: ignore
+
+    async def afetch(url):
+        return fetcher.fetch(url)
+
+    fetcher.afetch = afetch  # type: ignore
+
+    class CollectingWriter:
+        def __init__(self):
+            self.batches = []
+
+        def write(self, records):
+            self.batches.append(list(records))
+
+    writer = CollectingWriter()
+    asyncio.run(
+        _run(
+            list(pages),
+            fetcher,
+            DomSummarizer(),
+            PageTypeClassifier(client),
+            IntentParser(client),
+            StrategyBuilder(client),
+            Executor(fetcher),
+            writer,
+            "抓标题",
+            parallel_urls=2,
+        )
+    )
+
+    assert len(writer.batches) == 1
+    assert [record["title"] for record in writer.batches[0]] == ["A", "B"]
+
+
+def test_package_exports_resolve_lazily():
+    import aismartspider
+
+    assert isinstance(aismartspider.__all__, tuple)
+    for name in aismartspider.__all__:
+        assert getattr(aismartspider, name) is not None
+    assert set(aismartspider.__all__) <= set(dir(aismartspider))
+
+
+def test_cli_run_keeps_records_when_one_url_fails(capsys):
+    import asyncio
+
+    from aismartspider.cli import _run
+
+    pages = {
+        "http://example.com/a": "<html><body><h1>A</h1><p>a</p></body></html>",
+        "http://example.com/b": "<html><body><h1>B</h1><p>b</p></body></html>",
+    }
+    client = MockClient()
+    fetcher = Fetcher()
+
+    def fetch(url):
+        if url not in pages:
+            raise ConnectionError(f"cannot reach {url}")
+        return FetchResult(url=url, html=pages[url], renderer="mock")
+
+    async def afetch(url):
+        return fetch(url)
+
+    fetcher.fetch = fetch  # type: ignore
+    fetcher.afetch = afetch  # type: ignore
+
+    written = []
+
+    class CollectingWriter:
+        def write(self, records):
+            written.append(list(records))
+
+    def run(urls):
+        return asyncio.run(
+            _run(
+                urls,
+                fetcher,
+                DomSummarizer(),
+                PageTypeClassifier(client),
+                IntentParser(client),
+                StrategyBuilder(client),
+                Executor(fetcher),
+                CollectingWriter(),
+                "抓标题",
+            )
+        )
+
+    assert run(["http://example.com/a", "http://127.0.0.1:1/x", "http://example.com/b"]) == 1
+    assert [[record["title"] for record in batch] for batch in written] == [["A", "B"]]
+    assert "[ERROR] Failed to process http://127.0.0.1:1/x" in capsys.readouterr().out
+
+    # When every URL fails nothing is written and the failures are still reported.
+    written.clear()
+    assert run(["http://127.0.0.1:1/x", "http://127.0.0.1:1/y"]) == 2
+    assert written == []
+
+
+def test_cli_main_exits_non_zero_when_a_url_fails(monkeypatch):
+    import pytest
+
+    from aismartspider import cli
+
+    async def afetch(self, url):
+        raise ConnectionError(f"cannot reach {url}")
+
+    monkeypatch.setattr(Fetcher, "afetch", afetch)
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["http://127.0.0.1:1/x", "--task", "t", "--use-mock", "--disable-auto-render"])
+    assert excinfo.value.code == 1